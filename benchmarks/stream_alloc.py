@@ -0,0 +1,131 @@
+"""Allocations and time per streamed token, for OpenAI and Gemini SSE streams.
+
+A synthetic SSE body is parsed with the same code the providers use
+(iter_sse_events() and the provider's _parse_sse_event()) and every chunk
+is accumulated into a StreamResponse, with the chunks kept alive as a
+relaying caller would. tracemalloc reports the blocks and bytes still
+allocated per token; time is the best of several untraced runs.
+
+No network access or API keys are needed. To compare before and after a
+change, run the script against a checkout of each commit:
+
+    python benchmarks/stream_alloc.py
+    git worktree add /tmp/justllms-before <commit>
+    PYTHONPATH=/tmp/justllms-before python benchmarks/stream_alloc.py
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+
+from justllms import Client
+from justllms.core.models import Message, Role
+from justllms.core.sse import iter_sse_events
+from justllms.core.streaming import StreamChunk, StreamResponse
+
+OPENAI_DELTA = b'{"id":"c","choices":[{"index":0,"delta":{"content":"tok "},"finish_reason":null}]}'
+OPENAI_FINAL = (
+    b'{"id":"c","choices":[{"index":0,"delta":{},"finish_reason":"stop"}],'
+    b'"usage":{"prompt_tokens":5,"completion_tokens":%d,"total_tokens":%d}}'
+)
+GEMINI_DELTA = (
+    b'{"candidates":[{"content":{"parts":[{"text":"tok "}]}}],'
+    b'"usageMetadata":{"promptTokenCount":5,"candidatesTokenCount":1,"totalTokenCount":6}}'
+)
+GEMINI_FINAL = (
+    b'{"candidates":[{"content":{"parts":[{"text":""}]},"finishReason":"STOP"}],'
+    b'"usageMetadata":{"promptTokenCount":5,"candidatesTokenCount":%d,"totalTokenCount":%d}}'
+)
+
+
+def sse_body(delta: bytes, final: bytes, tokens: int) -> bytes:
+    """Build an SSE response body of ``tokens`` deltas and a final chunk."""
+    events = [b"data: " + delta + b"\n\n"] * tokens
+    events.append(b"data: " + final % (tokens, tokens + 5) + b"\n\n")
+    return b"".join(events)
+
+
+def network_chunks(body: bytes, size: int = 4096) -> List[bytes]:
+    """Split a body into reads the way an HTTP client would return them."""
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+def run_stream(
+    parse_event: Callable[[Any], Any], provider: Any, model: str, reads: List[bytes]
+) -> Tuple[StreamResponse, List[StreamChunk]]:
+    """Parse and accumulate one stream, keeping every chunk alive."""
+    messages = [Message(role=Role.USER, content="hi")]
+    accumulator = StreamResponse(provider, model, messages)
+    chunks = []
+    for event in iter_sse_events(iter(reads)):
+        chunk = parse_event(event)
+        if chunk is not None:
+            accumulator.accumulate(chunk)
+            chunks.append(chunk)
+    accumulator.mark_complete()
+    accumulator.to_completion_response()
+    return accumulator, chunks
+
+
+def measure(
+    name: str, provider: Any, model: str, delta: bytes, final: bytes, tokens: int, repeat: int
+) -> None:
+    reads = network_chunks(sse_body(delta, final, tokens))
+    parse_event = provider._parse_sse_event
+    run_stream(parse_event, provider, model, network_chunks(sse_body(delta, final, 10)))
+
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        run_stream(parse_event, provider, model, reads)
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = run_stream(parse_event, provider, model, reads)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    del result
+
+    print(
+        f"{name:<8} {best / tokens * 1e6:6.2f} us/token  "
+        f"{blocks / tokens:5.1f} blocks/token  {size / tokens:7.0f} B/token"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=20_000, help="deltas per stream")
+    parser.add_argument("--repeat", type=int, default=7, help="timed runs, best is reported")
+    args = parser.parse_args()
+
+    client = Client(config={"providers": {"openai": {"api_key": "x"}, "google": {"api_key": "x"}}})
+    measure(
+        "openai",
+        client.providers["openai"],
+        "gpt-4o-mini",
+        OPENAI_DELTA,
+        OPENAI_FINAL,
+        args.tokens,
+        args.repeat,
+    )
+    measure(
+        "gemini",
+        client.providers["google"],
+        "gemini-2.5-flash",
+        GEMINI_DELTA,
+        GEMINI_FINAL,
+        args.tokens,
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
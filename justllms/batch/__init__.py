@@ -0,0 +1,13 @@
+from justllms.batch.runner import BatchRunStats, Checkpoint, run_jsonl_batch
+from justllms.batch.shards import MergeReport, ShardManifest, merge_shards, parse_shard, shard_of
+
+__all__ = [
+    "BatchRunStats",
+    "Checkpoint",
+    "MergeReport",
+    "ShardManifest",
+    "merge_shards",
+    "parse_shard",
+    "run_jsonl_batch",
+    "shard_of",
+]
@@ -0,0 +1,353 @@
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Dict, Iterator, Optional, Set, Tuple
+
+from justllms.batch.shards import ShardManifest, _write_json_atomic, shard_of
+from justllms.core.batch import BatchResult, run_batch
+from justllms.utils import codec
+
+if TYPE_CHECKING:
+    from justllms.core.client import Client
+    from justllms.core.completion import CompletionResponse
+
+
+@dataclass
+class BatchRunStats:
+    """Progress of a JSONL batch run."""
+
+    completed: int = 0
+    """items finished in this run, successfully or not"""
+
+    failed: int = 0
+    """items whose output records an error"""
+
+    skipped: int = 0
+    """items already finished by an earlier run"""
+
+    cached: int = 0
+    """items answered from the response cache (duplicates)"""
+
+    cost: float = 0.0
+    """estimated cost of this run in USD"""
+
+    started_at: float = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the run started."""
+        return time.monotonic() - self.started_at
+
+    @property
+    def rate(self) -> float:
+        """Items completed per second."""
+        elapsed = self.elapsed
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+
+class Checkpoint:
+    """Progress of a run, saved next to its output so a killed run can resume.
+
+    Input items are identified by line number. Everything below ``watermark``
+    is finished; finished items at or above it (completions arrive out of
+    order) are kept in ``done``. ``output_offset`` is the output size when the
+    checkpoint was saved: output written after that is rescanned on load, so
+    no finished item is lost even if the process died before saving.
+
+    Args:
+        input_path: Input file the checkpoint belongs to.
+        shard: (shard index, number of shards) the run processes.
+    """
+
+    VERSION = 1
+
+    def __init__(self, input_path: str, shard: Tuple[int, int] = (0, 1)):
+        self.input_path = os.path.realpath(input_path)
+        self.shard = shard
+        self.watermark = 0
+        self.done: Set[int] = set()
+        self.output_offset = 0
+        self.succeeded = 0
+        self.failed: Set[int] = set()
+
+    def is_done(self, line: int) -> bool:
+        """Whether the item on ``line`` has finished."""
+        return line < self.watermark or line in self.done
+
+    def mark_done(self, line: int) -> None:
+        """Record the item on ``line`` as finished."""
+        if line < self.watermark:
+            return
+        self.done.add(line)
+        while self.watermark in self.done:
+            self.done.remove(self.watermark)
+            self.watermark += 1
+
+    def record(self, line: int, ok: bool) -> None:
+        """Record the outcome of the item on ``line``."""
+        self.mark_done(line)
+        if ok:
+            self.succeeded += 1
+            self.failed.discard(line)
+        else:
+            self.failed.add(line)
+
+    def save(self, path: str) -> None:
+        """Atomically write the checkpoint to ``path``."""
+        _write_json_atomic(
+            path,
+            {
+                "version": self.VERSION,
+                "input": self.input_path,
+                "shard": list(self.shard),
+                "watermark": self.watermark,
+                "done": sorted(self.done),
+                "output_offset": self.output_offset,
+                "succeeded": self.succeeded,
+                "failed": sorted(self.failed),
+            },
+        )
+
+    @classmethod
+    def load(
+        cls, path: str, input_path: str, output_path: str, shard: Tuple[int, int] = (0, 1)
+    ) -> "Checkpoint":
+        """Restore progress from a checkpoint file and the output written since.
+
+        A missing checkpoint is rebuilt from the whole output file. A trailing
+        partial line (left by a crash mid-write) is removed from the output.
+
+        Args:
+            path: Checkpoint file.
+            input_path: Input file of the run being resumed.
+            output_path: Output file of the run being resumed.
+            shard: (shard index, number of shards) of the run being resumed.
+
+        Returns:
+            Checkpoint: Restored progress.
+
+        Raises:
+            ValueError: If the checkpoint belongs to a different input file or shard.
+        """
+        checkpoint = cls(input_path, shard)
+        if os.path.exists(path):
+            with open(path) as f:
+                data = json.load(f)
+            if (
+                data.get("version") != cls.VERSION
+                or data["input"] != checkpoint.input_path
+                or tuple(data["shard"]) != tuple(shard)
+            ):
+                raise ValueError(
+                    f"Checkpoint {path} belongs to a different input or shard "
+                    f"({data.get('input')}, shard {data.get('shard')}); "
+                    "restart the run or choose another output file"
+                )
+            checkpoint.watermark = data["watermark"]
+            checkpoint.done = set(data["done"])
+            checkpoint.output_offset = data["output_offset"]
+            checkpoint.succeeded = data["succeeded"]
+            checkpoint.failed = set(data["failed"])
+
+        if not os.path.exists(output_path):
+            checkpoint.output_offset = 0
+            return checkpoint
+
+        with open(output_path, "rb+") as f:
+            end = _truncate_partial_line(f)
+            if checkpoint.output_offset > end:
+                # The output was truncated or replaced since the checkpoint; rebuild
+                checkpoint = cls(input_path, shard)
+            f.seek(checkpoint.output_offset)
+            for raw_line in f:
+                record = codec.loads(raw_line)
+                checkpoint.record(record["index"], "error" not in record)
+            checkpoint.output_offset = end
+        return checkpoint
+
+
+def run_jsonl_batch(
+    client: "Client",
+    input_path: str,
+    output_path: str,
+    *,
+    concurrency: int = 10,
+    defaults: Optional[Dict[str, Any]] = None,
+    shard: Optional[Tuple[int, int]] = None,
+    retry_failed: bool = False,
+    restart: bool = False,
+    checkpoint_interval: float = 5.0,
+    on_progress: Optional[Callable[[BatchRunStats], Any]] = None,
+) -> BatchRunStats:
+    """Run every request of a JSONL file and append the responses to another.
+
+    Each input line is a JSON object of ``completion.create()`` arguments,
+    optionally with an ``id`` that is copied to the output, or a ``prompt``
+    string as shorthand for a single user message. Each output line holds the
+    ``index`` of the input line (0-based) and its ``id`` plus either ``response`` (as
+    CompletionResponse.to_dict()) or ``error``. Output lines are written as
+    requests complete, so they are not in input order.
+
+    The input is streamed, so files of any size can be processed. Progress is
+    checkpointed to ``<output_path>.checkpoint``; running again with the same
+    arguments after a crash or interrupt resumes without re-sending finished
+    requests. Requests that fail are recorded and only re-sent with
+    ``retry_failed``; the new result is appended after the old error.
+
+    With ``shard=(k, n)`` only the requests assigned to shard ``k`` of ``n``
+    (by a stable hash of the line number, see shard_of()) are run, so ``n``
+    processes or hosts can split one input and their outputs be combined with
+    merge_shards(). Each run also writes ``<output_path>.manifest.json``
+    describing which shard it covers and how far it got.
+
+    Args:
+        client: Client used to send the requests. Enable its response cache and
+            request coalescing to send duplicate requests only once.
+        input_path: JSONL file of requests.
+        output_path: JSONL file results are appended to.
+        concurrency: Maximum number of requests in flight.
+        defaults: Parameters applied to every request unless it sets them.
+        shard: (shard index, number of shards) to process, or None for all.
+        retry_failed: Re-send requests whose earlier result was an error.
+        restart: Discard existing output and checkpoint instead of resuming.
+        checkpoint_interval: Seconds between checkpoint saves.
+        on_progress: Optional callback invoked with the stats after each item.
+
+    Returns:
+        BatchRunStats: Counts for this run.
+
+    Raises:
+        ValueError: If the shard is invalid or the checkpoint belongs to a
+            different input file or shard.
+    """
+    shard_index, num_shards = shard or (0, 1)
+    if not 0 <= shard_index < num_shards:
+        raise ValueError(f"Invalid shard {shard_index}/{num_shards}")
+
+    checkpoint_path = f"{output_path}.checkpoint"
+    manifest_path = f"{output_path}.manifest.json"
+    if restart:
+        for path in (output_path, checkpoint_path, manifest_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    checkpoint = Checkpoint.load(
+        checkpoint_path, input_path, output_path, (shard_index, num_shards)
+    )
+    stats = BatchRunStats(started_at=time.monotonic())
+    defaults = defaults or {}
+    manifest = ShardManifest(
+        input=checkpoint.input_path,
+        input_size=os.path.getsize(input_path),
+        shard_index=shard_index,
+        num_shards=num_shards,
+        output=os.path.realpath(output_path),
+    )
+    assigned = 0
+
+    def items() -> Iterator[Dict[str, Any]]:
+        nonlocal assigned
+        with open(input_path, "rb") as f:
+            for line, raw_line in enumerate(f):
+                if not raw_line.strip() or shard_of(line, num_shards) != shard_index:
+                    # No output here; mark them so the watermark can pass
+                    checkpoint.mark_done(line)
+                    continue
+                assigned += 1
+                if checkpoint.is_done(line) and not (retry_failed and line in checkpoint.failed):
+                    stats.skipped += 1
+                    continue
+                yield {"line": line, "raw": raw_line}
+
+    def send(item: Dict[str, Any]) -> "CompletionResponse":
+        return client.completion.create(  # type: ignore[no-any-return]
+            **{**defaults, **_parse_request(item)}
+        )
+
+    with open(output_path, "ab") as out:
+        last_saved = time.monotonic()
+        try:
+            for result in run_batch(send, items(), concurrency=concurrency):
+                out.write(_encode_result(result))
+                checkpoint.record(result.request["line"], result.ok)
+                _update_stats(stats, result)
+                if on_progress is not None:
+                    on_progress(stats)
+
+                if time.monotonic() - last_saved >= checkpoint_interval:
+                    _save_checkpoint(checkpoint, checkpoint_path, out)
+                    last_saved = time.monotonic()
+            manifest.assigned = assigned
+            manifest.complete = True
+        finally:
+            _save_checkpoint(checkpoint, checkpoint_path, out)
+            manifest.succeeded = checkpoint.succeeded
+            manifest.failed = len(checkpoint.failed)
+            manifest.save(manifest_path)
+
+    return stats
+
+
+def _parse_request(item: Dict[str, Any]) -> Dict[str, Any]:
+    request = codec.loads(item["raw"])
+    if not isinstance(request, dict):
+        raise ValueError("Request must be a JSON object")
+    item["id"] = request.pop("id", None)
+    if "prompt" in request:
+        request["messages"] = [{"role": "user", "content": request.pop("prompt")}]
+    if request.get("stream"):
+        raise ValueError("Streaming requests are not supported in batches")
+    return request  # type: ignore[no-any-return]
+
+
+def _encode_result(result: BatchResult) -> bytes:
+    record: Dict[str, Any] = {"index": result.request["line"], "id": result.request.get("id")}
+    if result.response is not None:
+        record["response"] = result.response.to_dict()
+    else:
+        error = result.error
+        record["error"] = {
+            "type": type(error).__name__,
+            "message": str(error),
+            "status_code": getattr(error, "status_code", None),
+        }
+    return codec.dumps(record) + b"\n"
+
+
+def _update_stats(stats: BatchRunStats, result: BatchResult) -> None:
+    stats.completed += 1
+    if result.response is None:
+        stats.failed += 1
+        return
+    if result.response.cached:
+        stats.cached += 1
+    usage = result.response.usage
+    if usage is not None and usage.estimated_cost:
+        stats.cost += usage.estimated_cost
+
+
+def _save_checkpoint(checkpoint: Checkpoint, path: str, out: BinaryIO) -> None:
+    # The output must be durable before the checkpoint that points past it
+    out.flush()
+    os.fsync(out.fileno())
+    checkpoint.output_offset = out.tell()
+    checkpoint.save(path)
+
+
+def _truncate_partial_line(f: BinaryIO) -> int:
+    """Cut a trailing incomplete line from ``f`` and return the new size."""
+    end = f.seek(0, os.SEEK_END)
+    position = end
+    while position > 0:
+        step = min(4096, position)
+        f.seek(position - step)
+        block = f.read(step)
+        newline = block.rfind(b"\n")
+        if newline != -1:
+            position = position - step + newline + 1
+            break
+        position -= step
+    if position != end:
+        f.truncate(position)
+    return position
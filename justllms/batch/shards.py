@@ -0,0 +1,285 @@
+import contextlib
+import hashlib
+import heapq
+import json
+import os
+import socket
+import time
+from array import array
+from dataclasses import asdict, dataclass, field
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from justllms.utils import codec
+
+
+def shard_of(index: int, num_shards: int) -> int:
+    """Shard an input line belongs to.
+
+    The assignment depends only on the line number and shard count, so every
+    host computes the same split of the same input independently.
+
+    Args:
+        index: 0-based input line number.
+        num_shards: Total number of shards.
+
+    Returns:
+        int: Shard index in ``range(num_shards)``.
+    """
+    if num_shards == 1:
+        return 0
+    digest = hashlib.blake2b(str(index).encode("ascii"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % num_shards
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """Parse a ``K/N`` shard spec (shard K of N, 0-based).
+
+    Raises:
+        ValueError: If the spec is malformed or K is out of range.
+    """
+    index, sep, count = spec.partition("/")
+    try:
+        shard = (int(index), int(count))
+    except ValueError:
+        raise ValueError(f"Invalid shard {spec!r}, expected K/N (e.g. 0/4)") from None
+    if not sep or not 0 <= shard[0] < shard[1]:
+        raise ValueError(f"Invalid shard {spec!r}, expected K/N with 0 <= K < N")
+    return shard
+
+
+@dataclass
+class ShardManifest:
+    """Summary of one shard's output, written next to it as ``<output>.manifest.json``."""
+
+    input: str
+    """input file path on the host that ran the shard"""
+
+    input_size: int
+    """input size in bytes, to detect shards run on different inputs"""
+
+    shard_index: int
+    num_shards: int
+    output: str
+
+    host: str = field(default_factory=socket.gethostname)
+
+    assigned: Optional[int] = None
+    """requests in this shard, known once the whole input has been read"""
+
+    succeeded: int = 0
+    failed: int = 0
+
+    complete: bool = False
+    """whether every request of the shard has a result"""
+
+    updated_at: float = field(default_factory=time.time)
+
+    def save(self, path: str) -> None:
+        """Atomically write the manifest to ``path``."""
+        self.updated_at = time.time()
+        _write_json_atomic(path, asdict(self))
+
+    @classmethod
+    def load(cls, path: str) -> "ShardManifest":
+        """Read a manifest written by save()."""
+        with open(path) as f:
+            return cls(**json.load(f))
+
+
+@dataclass
+class MergeReport:
+    """Completeness of a merged batch run."""
+
+    total: int = 0
+    """non-blank input lines"""
+
+    succeeded: int = 0
+    failed: int = 0
+    missing: int = 0
+    """input lines with no result in any shard output"""
+
+    missing_by_shard: Dict[int, int] = field(default_factory=dict)
+    """missing results per shard (when the shard count is known)"""
+
+    missing_indices: List[int] = field(default_factory=list)
+    """first missing input lines, for inspection"""
+
+    problems: List[str] = field(default_factory=list)
+    """inconsistencies between manifests, input and outputs"""
+
+    @property
+    def complete(self) -> bool:
+        """Whether every input line has a result and the shards are consistent."""
+        return self.missing == 0 and not self.problems
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the report to a JSON-serializable dictionary."""
+        return {**asdict(self), "complete": self.complete}
+
+
+def merge_shards(
+    input_path: str,
+    shard_outputs: Sequence[str],
+    output_path: str,
+    num_shards: Optional[int] = None,
+    max_missing_indices: int = 1000,
+) -> MergeReport:
+    """Merge shard outputs into one result file in input order.
+
+    Each shard output is indexed (line number and byte offset per result,
+    keeping only the best result when an item was retried) and the indexes
+    are merged while the input is read, so memory stays proportional to the
+    number of results rather than their size. The merged file is written
+    atomically, so re-running the merge after re-running incomplete shards
+    simply replaces it. The report is also written to
+    ``<output_path>.report.json``.
+
+    Args:
+        input_path: Input JSONL every shard was run on.
+        shard_outputs: Output files of the shard runs.
+        output_path: Merged result file.
+        num_shards: Number of shards, if no manifests are available; used to
+            attribute missing results to shards.
+        max_missing_indices: How many missing input lines to list in the report.
+
+    Returns:
+        MergeReport: Counts of succeeded, failed and missing results.
+    """
+    report = MergeReport()
+    num_shards = _check_manifests(input_path, shard_outputs, num_shards, report)
+
+    indexes = [_index_output(path) for path in shard_outputs]
+    duplicates = strays = 0
+    tmp_path = f"{output_path}.tmp"
+    with contextlib.ExitStack() as stack:
+        handles = [stack.enter_context(open(path, "rb")) for path in shard_outputs]
+        merged = heapq.merge(*(_iter_index(shard, *index) for shard, index in enumerate(indexes)))
+        with open(input_path, "rb") as source, open(tmp_path, "wb") as out:
+            pending = next(merged, None)
+            for line, raw_line in enumerate(source):
+                if not raw_line.strip():
+                    continue
+                report.total += 1
+
+                found = False
+                while pending is not None and pending[0] <= line:
+                    index, shard, offset = pending
+                    if index == line and not found:
+                        found = True
+                        record = _read_line(handles[shard], offset)
+                        out.write(record)
+                        if b'"error":' in record and "error" in codec.loads(record):
+                            report.failed += 1
+                        else:
+                            report.succeeded += 1
+                    elif index == line:
+                        duplicates += 1
+                    else:
+                        strays += 1
+                    pending = next(merged, None)
+
+                if not found:
+                    report.missing += 1
+                    if len(report.missing_indices) < max_missing_indices:
+                        report.missing_indices.append(line)
+                    if num_shards is not None:
+                        shard_index = shard_of(line, num_shards)
+                        report.missing_by_shard[shard_index] = (
+                            report.missing_by_shard.get(shard_index, 0) + 1
+                        )
+            strays += (pending is not None) + sum(1 for _ in merged)
+        os.replace(tmp_path, output_path)
+
+    if duplicates:
+        report.problems.append(f"{duplicates} input lines have results in several shards")
+    if strays:
+        report.problems.append(f"{strays} results don't match a non-blank input line")
+
+    _write_json_atomic(f"{output_path}.report.json", report.to_dict())
+    return report
+
+
+def _check_manifests(
+    input_path: str, shard_outputs: Sequence[str], num_shards: Optional[int], report: MergeReport
+) -> Optional[int]:
+    """Validate shard manifests against each other and the input; return the shard count."""
+    input_size = os.path.getsize(input_path)
+    seen: Dict[int, str] = {}
+    for path in shard_outputs:
+        manifest_path = f"{path}.manifest.json"
+        if not os.path.exists(manifest_path):
+            report.problems.append(f"No manifest for {path}")
+            continue
+        manifest = ShardManifest.load(manifest_path)
+        if num_shards is None:
+            num_shards = manifest.num_shards
+        elif manifest.num_shards != num_shards:
+            report.problems.append(
+                f"{path} is shard {manifest.shard_index}/{manifest.num_shards}, "
+                f"expected {num_shards} shards"
+            )
+        if manifest.input_size != input_size:
+            report.problems.append(f"{path} was run on a different input ({manifest.input})")
+        if manifest.shard_index in seen:
+            report.problems.append(
+                f"{path} and {seen[manifest.shard_index]} are both shard {manifest.shard_index}"
+            )
+        seen[manifest.shard_index] = path
+        if not manifest.complete:
+            report.problems.append(
+                f"Shard {manifest.shard_index} ({path}, on {manifest.host}) has not finished"
+            )
+
+    if num_shards is not None and seen:
+        absent = sorted(set(range(num_shards)) - set(seen))
+        if absent:
+            report.problems.append(f"No output for shards {absent}")
+    return num_shards
+
+
+def _index_output(path: str) -> Tuple["array[int]", "array[int]"]:
+    """Map each input line with a result in ``path`` to the offset of its best result.
+
+    A success beats an error, and a later error beats an earlier one. A torn
+    last line (from a crashed run) is ignored.
+    """
+    best: Dict[int, Tuple[int, bool]] = {}
+    with open(path, "rb") as f:
+        offset = 0
+        for raw_line in f:
+            try:
+                record = codec.loads(raw_line)
+            except ValueError:
+                offset += len(raw_line)
+                continue
+            ok = "error" not in record
+            previous = best.get(record["index"])
+            if previous is None or not previous[1]:
+                best[record["index"]] = (offset, ok)
+            offset += len(raw_line)
+
+    lines = array("q", sorted(best))
+    offsets = array("q", (best[line][0] for line in lines))
+    return lines, offsets
+
+
+def _iter_index(
+    shard: int, lines: "array[int]", offsets: "array[int]"
+) -> Iterator[Tuple[int, int, int]]:
+    for line, offset in zip(lines, offsets):
+        yield line, shard, offset
+
+
+def _read_line(f: BinaryIO, offset: int) -> bytes:
+    f.seek(offset)
+    line = f.readline()
+    return line if line.endswith(b"\n") else line + b"\n"
+
+
+def _write_json_atomic(path: str, data: Dict[str, Any]) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
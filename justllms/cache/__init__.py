@@ -0,0 +1,11 @@
+from justllms.cache.backends import BaseCacheBackend, MemoryCache, SQLiteCache
+from justllms.cache.response_cache import ResponseCache
+from justllms.cache.semantic import SemanticCache
+
+__all__ = [
+    "BaseCacheBackend",
+    "MemoryCache",
+    "ResponseCache",
+    "SemanticCache",
+    "SQLiteCache",
+]
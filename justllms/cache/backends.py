@@ -0,0 +1,239 @@
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+
+class BaseCacheBackend(ABC):
+    """Abstract key/value store for cached responses.
+
+    Values are opaque bytes; serialization is the caller's job so every
+    backend stores exactly the same thing.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Get the value stored for ``key``, or None if missing or expired."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """Store ``value`` under ``key``.
+
+        Args:
+            key: Cache key.
+            value: Serialized value.
+            ttl: Seconds until the entry expires, or None to keep it until evicted.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove ``key`` if present."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+        pass
+
+    def close(self) -> None:  # noqa: B027
+        """Release resources held by the backend. The backend stays usable."""
+        pass
+
+
+class MemoryCache(BaseCacheBackend):
+    """In-process LRU cache with per-entry TTL.
+
+    When either limit is exceeded, the least recently used entries are evicted
+    until the cache fits again. Expired entries are dropped when they are read
+    or when they reach the LRU end.
+
+    Args:
+        max_entries: Maximum number of entries, or None for no limit.
+        max_size_bytes: Maximum total size of stored values, or None for no limit.
+    """
+
+    def __init__(self, max_entries: Optional[int] = 1000, max_size_bytes: Optional[int] = None):
+        self.max_entries = max_entries
+        self.max_size_bytes = max_size_bytes
+        self._entries: OrderedDict[str, Tuple[Optional[float], bytes]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        if self.max_size_bytes is not None and len(value) > self.max_size_bytes:
+            return
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires_at, value)
+            self._size += len(value)
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: str) -> None:
+        _, value = self._entries.pop(key)
+        self._size -= len(value)
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_size_bytes is not None and self._size > self.max_size_bytes)
+        ):
+            key = next(iter(self._entries))
+            self._remove(key)
+
+
+class SQLiteCache(BaseCacheBackend):
+    """Persistent cache in a SQLite database that several processes can share.
+
+    The database runs in WAL mode so readers in other processes don't block
+    on writers. Expiry uses wall-clock time, which all processes agree on.
+    When ``max_entries`` is exceeded the least recently read entries are
+    deleted. Expired entries are purged and the size is enforced every
+    ``maintenance_writes`` writes or ``maintenance_interval`` seconds rather
+    than on each write, so writes stay cheap on large tables; in between,
+    the table may briefly hold more than ``max_entries`` entries. The
+    connection is opened lazily, so the cache can be used again after
+    ``close()``.
+
+    Args:
+        path: Database file, created if it doesn't exist.
+        max_entries: Maximum number of entries, or None for no limit.
+        timeout: Seconds to wait for a lock held by another process.
+    """
+
+    maintenance_writes = 256
+    maintenance_interval = 60.0
+
+    def __init__(
+        self,
+        path: Union[str, Path] = ".justllms_cache.sqlite",
+        max_entries: Optional[int] = None,
+        timeout: float = 30.0,
+    ):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._writes_since_maintenance = 0
+        self._last_maintenance = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        # Caller holds the lock
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                str(self.path),
+                timeout=self.timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "expires_at REAL, accessed_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_expires ON responses (expires_at)"
+            )
+            self._connection = connection
+        return self._connection
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            if self.max_entries is not None:
+                connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            return bytes(value)
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), expires_at, now),
+            )
+            self._writes_since_maintenance += 1
+            if (
+                self._writes_since_maintenance >= self.maintenance_writes
+                or now - self._last_maintenance >= self.maintenance_interval
+            ):
+                self._maintain(connection, now)
+
+    def _maintain(self, connection: sqlite3.Connection, now: float) -> None:
+        # Caller holds the lock
+        self._writes_since_maintenance = 0
+        self._last_maintenance = now
+        connection.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        if self.max_entries is None:
+            return
+        (count,) = connection.execute("SELECT COUNT(*) FROM responses").fetchone()
+        if count > self.max_entries:
+            connection.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
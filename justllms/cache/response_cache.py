@@ -0,0 +1,184 @@
+import json
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from justllms.cache.backends import BaseCacheBackend, MemoryCache, SQLiteCache
+from justllms.core.models import Choice, Usage
+
+if TYPE_CHECKING:
+    from justllms.config.config import CacheConfig
+    from justllms.core.completion import CompletionResponse
+    from justllms.core.streaming import StreamChunk
+
+
+class ResponseCache:
+    """Exact-match cache of completion responses.
+
+    Responses are stored serialized, so every hit returns a fresh
+    CompletionResponse that callers may modify freely. Hits are flagged with
+    ``cached=True`` and cost nothing (``usage.estimated_cost`` is 0); token
+    counts are kept as reported by the original call. Streams are stored as
+    their chunk sequence with timing so they can be replayed.
+
+    Args:
+        backend: Store holding the serialized responses.
+        ttl: Seconds a response stays valid, or None for no expiry.
+    """
+
+    def __init__(self, backend: BaseCacheBackend, ttl: Optional[float] = None):
+        self.backend = backend
+        self.ttl = ttl
+
+    @classmethod
+    def from_config(cls, config: "CacheConfig") -> Optional["ResponseCache"]:
+        """Build the response cache described by a cache config.
+
+        Args:
+            config: Cache configuration.
+
+        Returns:
+            Optional[ResponseCache]: Cache with the configured backend, or None
+            if caching is disabled.
+        """
+        if not config.enabled:
+            return None
+
+        backend: BaseCacheBackend
+        if config.backend == "sqlite":
+            backend = SQLiteCache(config.path, max_entries=config.max_entries)
+        else:
+            backend = MemoryCache(
+                max_entries=config.max_entries, max_size_bytes=config.max_size_bytes
+            )
+        return cls(backend, ttl=config.ttl)
+
+    def get(self, key: str) -> Optional["CompletionResponse"]:
+        """Look up a response.
+
+        Args:
+            key: Request fingerprint (see justllms.utils.request_key).
+
+        Returns:
+            Optional[CompletionResponse]: Cached response, or None on a miss.
+        """
+        value = self.backend.get(key)
+        if value is None:
+            return None
+        try:
+            return _decode_response(value)
+        except (ValueError, TypeError, KeyError):
+            # Written by an incompatible version; treat as a miss and replace it
+            self.backend.delete(key)
+            return None
+
+    def set(self, key: str, response: "CompletionResponse") -> None:
+        """Store a response under ``key``.
+
+        Args:
+            key: Request fingerprint.
+            response: Response to cache.
+        """
+        self.backend.set(key, _encode_response(response), ttl=self.ttl)
+
+    def get_stream(self, key: str) -> Optional[List[Tuple[float, "StreamChunk"]]]:
+        """Look up a recorded stream.
+
+        Args:
+            key: Request fingerprint of the streaming request.
+
+        Returns:
+            Optional[List[Tuple[float, StreamChunk]]]: (offset, chunk) pairs, or
+            None on a miss.
+        """
+        value = self.backend.get(key)
+        if value is None:
+            return None
+        try:
+            return _decode_stream(value)
+        except (ValueError, TypeError, KeyError):
+            self.backend.delete(key)
+            return None
+
+    def set_stream(self, key: str, recorded: List[Tuple[float, "StreamChunk"]]) -> None:
+        """Store a completed stream under ``key``.
+
+        Args:
+            key: Request fingerprint of the streaming request.
+            recorded: (offset, chunk) pairs as produced by record_stream().
+        """
+        self.backend.set(key, _encode_stream(recorded), ttl=self.ttl)
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        self.backend.clear()
+
+    def close(self) -> None:
+        """Release the backend's resources."""
+        self.backend.close()
+
+
+def _encode_response(response: "CompletionResponse") -> bytes:
+    data: Dict[str, Any] = {
+        "id": response.id,
+        "model": response.model,
+        "choices": [choice.model_dump(mode="json") for choice in response.choices],
+        "usage": response.usage.model_dump(mode="json") if response.usage else None,
+        "created": response.created,
+        "system_fingerprint": response.system_fingerprint,
+        "provider": response.provider,
+        "raw_response": response.raw_response,
+    }
+    return json.dumps(data, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _decode_response(value: bytes) -> "CompletionResponse":
+    from justllms.core.completion import CompletionResponse
+
+    data = json.loads(value)
+    usage = Usage(**data["usage"]) if data["usage"] else None
+    if usage is not None:
+        usage.estimated_cost = 0.0
+
+    response = CompletionResponse(
+        id=data["id"],
+        model=data["model"],
+        choices=[Choice(**choice) for choice in data["choices"]],
+        usage=usage,
+        created=data["created"],
+        system_fingerprint=data["system_fingerprint"],
+        provider=data["provider"],
+        **data["raw_response"],
+    )
+    response.cached = True
+    return response
+
+
+def _encode_stream(recorded: List[Tuple[float, "StreamChunk"]]) -> bytes:
+    # Raw provider payloads are debugging aids and are not kept
+    data = {
+        "chunks": [
+            {
+                "offset": offset,
+                "content": chunk.content,
+                "finish_reason": chunk.finish_reason,
+                "usage": chunk.usage.model_dump(mode="json") if chunk.usage else None,
+            }
+            for offset, chunk in recorded
+        ]
+    }
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _decode_stream(value: bytes) -> List[Tuple[float, "StreamChunk"]]:
+    from justllms.core.streaming import StreamChunk
+
+    return [
+        (
+            float(item["offset"]),
+            StreamChunk(
+                content=item["content"],
+                finish_reason=item["finish_reason"],
+                usage=Usage(**item["usage"]) if item["usage"] else None,
+            ),
+        )
+        for item in json.loads(value)["chunks"]
+    ]
@@ -0,0 +1,344 @@
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from justllms.cache.response_cache import _decode_response, _encode_response
+from justllms.core.models import Message
+from justllms.exceptions import ConfigurationError
+from justllms.utils.request_key import request_key
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+if TYPE_CHECKING:
+    from justllms.config.config import SemanticCacheConfig
+    from justllms.core.completion import CompletionResponse
+
+logger = logging.getLogger(__name__)
+
+EmbeddingFunction = Callable[[str], Sequence[float]]
+
+
+class SemanticCache:
+    """Cache that answers requests similar in meaning to an earlier one.
+
+    Only the last message of a request is compared semantically. The provider,
+    model, parameters and all earlier messages (system prompt, previous turns)
+    must match exactly; they form the entry's scope. The last message is
+    embedded with ``embedding_function`` and compared by cosine similarity
+    against every entry in the same scope with a single matrix-vector product
+    over a contiguous float32 matrix.
+
+    With a ``path``, vectors are kept in a memory-mapped ``vectors.npy`` and
+    entry metadata and responses in ``entries.sqlite`` in that directory, so a
+    restart maps the existing index instead of re-embedding. The index is
+    meant to be written by one process at a time.
+
+    Once ``max_entries`` is reached, the oldest entry is replaced.
+
+    Args:
+        embedding_function: Maps text to an embedding vector (e.g. a local
+            sentence-transformers model or a provider embeddings endpoint).
+        threshold: Minimum cosine similarity for a hit.
+        max_entries: Capacity of the index.
+        ttl: Seconds an entry stays valid, or None for no expiry.
+        path: Directory to persist the index in, or None to keep it in memory.
+
+    Raises:
+        ConfigurationError: If numpy is not installed.
+    """
+
+    def __init__(
+        self,
+        embedding_function: EmbeddingFunction,
+        threshold: float = 0.95,
+        max_entries: int = 10000,
+        ttl: Optional[float] = None,
+        path: Optional[Union[str, Path]] = None,
+    ):
+        if not HAS_NUMPY:
+            raise ConfigurationError(
+                "Semantic caching requires numpy. Install it with: pip install 'justllms[semantic]'"
+            )
+        self.embedding_function = embedding_function
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.path = Path(path) if path is not None else None
+        self._vectors: Any = None
+        self._scope_ids: Any = np.full(max_entries, -1, dtype=np.int64)
+        self._created: Any = np.zeros(max_entries, dtype=np.float64)
+        self._scopes: Dict[str, int] = {}
+        self._values: Dict[int, bytes] = {}
+        self._size = 0
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        if self.path is not None:
+            self._load()
+
+    @classmethod
+    def from_config(cls, config: "SemanticCacheConfig") -> Optional["SemanticCache"]:
+        """Build the semantic cache described by a config.
+
+        Args:
+            config: Semantic cache configuration.
+
+        Returns:
+            Optional[SemanticCache]: The cache, or None if disabled.
+
+        Raises:
+            ConfigurationError: If enabled without an embedding function, or if
+                numpy is not installed.
+        """
+        if not config.enabled:
+            return None
+        if config.embedding_function is None:
+            raise ConfigurationError(
+                "Semantic caching requires an embedding_function",
+                config_key="cache.semantic.embedding_function",
+            )
+        return cls(
+            config.embedding_function,
+            threshold=config.similarity_threshold,
+            max_entries=config.max_entries,
+            ttl=config.ttl,
+            path=config.path,
+        )
+
+    def __len__(self) -> int:
+        return self._size
+
+    def get(
+        self,
+        provider: Optional[str],
+        model: Optional[str],
+        messages: List[Message],
+        params: Dict[str, Any],
+    ) -> Optional["CompletionResponse"]:
+        """Look up the response of the most similar earlier request.
+
+        Args:
+            provider: Provider as requested by the caller.
+            model: Model as requested by the caller.
+            messages: Validated messages.
+            params: Generation parameters.
+
+        Returns:
+            Optional[CompletionResponse]: Cached response flagged as cached, or
+            None if no entry in scope reaches the similarity threshold.
+        """
+        matches = self.search(provider, model, messages, params, k=1)
+        if matches and matches[0][0] >= self.threshold:
+            return matches[0][1]
+        return None
+
+    def search(
+        self,
+        provider: Optional[str],
+        model: Optional[str],
+        messages: List[Message],
+        params: Dict[str, Any],
+        k: int = 1,
+    ) -> List[Tuple[float, "CompletionResponse"]]:
+        """Find the ``k`` most similar cached requests in scope, ignoring the threshold.
+
+        Useful for tuning the threshold against real traffic.
+
+        Returns:
+            List of (cosine similarity, cached response), most similar first.
+        """
+        if not messages:
+            return []
+        scope = _scope_key(provider, model, messages, params)
+        with self._lock:
+            if self._vectors is None or scope not in self._scopes:
+                return []
+        query = self._embed(_message_text(messages[-1]))
+
+        with self._lock:
+            scope_id = self._scopes.get(scope)
+            if scope_id is None:
+                return []
+            size = self._size
+            mask = self._scope_ids[:size] == scope_id
+            if self.ttl is not None:
+                mask &= self._created[:size] > time.time() - self.ttl
+            candidates = int(mask.sum())
+            if candidates == 0:
+                return []
+            if query.shape[0] != self._vectors.shape[1]:
+                # e.g. the embedding model changed; a lookup must not fail the request
+                logger.warning(
+                    "Semantic cache miss: embedding has %d dimensions, index expects %d",
+                    query.shape[0],
+                    self._vectors.shape[1],
+                )
+                return []
+
+            scores = np.where(mask, self._vectors[:size] @ query, -np.inf)
+            k = min(k, candidates)
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            values = [(float(scores[slot]), self._read_value(int(slot))) for slot in top]
+
+        return [(score, _decode_response(value)) for score, value in values]
+
+    def set(
+        self,
+        provider: Optional[str],
+        model: Optional[str],
+        messages: List[Message],
+        params: Dict[str, Any],
+        response: "CompletionResponse",
+    ) -> None:
+        """Add a response to the index.
+
+        Args:
+            provider: Provider as requested by the caller.
+            model: Model as requested by the caller.
+            messages: Validated messages.
+            params: Generation parameters.
+            response: Response to cache.
+        """
+        if not messages:
+            return
+        scope = _scope_key(provider, model, messages, params)
+        vector = self._embed(_message_text(messages[-1]))
+        value = _encode_response(response)
+        now = time.time()
+
+        with self._lock:
+            if self._vectors is not None and vector.shape[0] != self._vectors.shape[1]:
+                # The embedding model changed, so the stored vectors can't be compared
+                logger.warning(
+                    "Resetting semantic cache: embedding has %d dimensions, index has %d",
+                    vector.shape[0],
+                    self._vectors.shape[1],
+                )
+                self._clear_entries()
+                self._vectors = None
+            if self._vectors is None:
+                self._vectors = self._create_vectors(vector.shape[0])
+            if self._size < self.max_entries:
+                slot = self._size
+                self._size += 1
+            else:
+                slot = int(np.argmin(self._created))
+
+            scope_id = self._scopes.setdefault(scope, len(self._scopes))
+            self._vectors[slot] = vector
+            self._scope_ids[slot] = scope_id
+            self._created[slot] = now
+            if self._connection is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO entries (slot, scope, created_at, value) "
+                    "VALUES (?, ?, ?, ?)",
+                    (slot, scope, now, sqlite3.Binary(value)),
+                )
+            else:
+                self._values[slot] = value
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._clear_entries()
+
+    def _clear_entries(self) -> None:
+        # Caller holds the lock
+        self._scope_ids[:] = -1
+        self._created[:] = 0.0
+        self._scopes.clear()
+        self._values.clear()
+        self._size = 0
+        if self._connection is not None:
+            self._connection.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        """Flush the memory-mapped vectors to disk."""
+        with self._lock:
+            if self.path is not None and self._vectors is not None:
+                self._vectors.flush()
+
+    def _embed(self, text: str) -> Any:
+        vector = np.asarray(self.embedding_function(text), dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else vector
+
+    def _create_vectors(self, dimensions: int) -> Any:
+        # Caller holds the lock
+        if self.path is None:
+            return np.zeros((self.max_entries, dimensions), dtype=np.float32)
+        return np.lib.format.open_memmap(
+            str(self.path / "vectors.npy"),
+            mode="w+",
+            dtype=np.float32,
+            shape=(self.max_entries, dimensions),
+        )
+
+    def _read_value(self, slot: int) -> bytes:
+        # Caller holds the lock
+        if self._connection is None:
+            return self._values[slot]
+        row = self._connection.execute(
+            "SELECT value FROM entries WHERE slot = ?", (slot,)
+        ).fetchone()
+        return bytes(row[0])
+
+    def _load(self) -> None:
+        assert self.path is not None
+        self.path.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(
+            str(self.path / "entries.sqlite"), isolation_level=None, check_same_thread=False
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "slot INTEGER PRIMARY KEY, scope TEXT NOT NULL, "
+            "created_at REAL NOT NULL, value BLOB NOT NULL)"
+        )
+        self._connection = connection
+
+        vectors_path = self.path / "vectors.npy"
+        if not vectors_path.exists():
+            connection.execute("DELETE FROM entries")
+            return
+
+        vectors = np.load(str(vectors_path), mmap_mode="r+")
+        if vectors.shape[0] != self.max_entries:
+            # Capacity changed since the index was written; start over
+            connection.execute("DELETE FROM entries")
+            vectors_path.unlink()
+            return
+
+        self._vectors = vectors
+        for slot, scope, created_at in connection.execute(
+            "SELECT slot, scope, created_at FROM entries WHERE slot < ?", (self.max_entries,)
+        ):
+            self._scope_ids[slot] = self._scopes.setdefault(scope, len(self._scopes))
+            self._created[slot] = created_at
+            self._size = max(self._size, slot + 1)
+
+
+def _scope_key(
+    provider: Optional[str],
+    model: Optional[str],
+    messages: List[Message],
+    params: Dict[str, Any],
+) -> str:
+    """Fingerprint everything that must match exactly: all but the last message."""
+    return request_key(provider or "", model or "", messages[:-1], params)
+
+
+def _message_text(message: Message) -> str:
+    if isinstance(message.content, str):
+        return message.content
+    return "\n".join(
+        str(part.get("text", "")) for part in message.content if part.get("type", "text") == "text"
+    )
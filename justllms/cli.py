@@ -1,4 +1,6 @@
+import json
 import sys
+from typing import Any, Dict, Optional, Tuple
 
 import click
 
@@ -168,5 +170,184 @@ def describe(tool_name: str, provider: str) -> None:
         sys.exit(1)
 
 
+@main.group()
+def batch() -> None:
+    """Process JSONL files of requests."""
+    pass
+
+
+def _parse_params(values: Tuple[str, ...]) -> Dict[str, Any]:
+    """Parse repeated key=value options; values are JSON if they parse as JSON."""
+    params: Dict[str, Any] = {}
+    for value in values:
+        key, sep, raw = value.partition("=")
+        if not sep:
+            raise click.BadParameter(f"expected key=value, got {value!r}", param_hint="--param")
+        try:
+            params[key] = json.loads(raw)
+        except json.JSONDecodeError:
+            params[key] = raw
+    return params
+
+
+@batch.command()
+@click.argument("input_path", type=click.Path(exists=True, dir_okay=False))
+@click.argument("output_path", type=click.Path(dir_okay=False))
+@click.option("--config", "-c", "config_path", type=click.Path(exists=True), help="Config file")
+@click.option("--model", "-m", help="Default model (e.g. 'openai/gpt-4o-mini')")
+@click.option("--provider", help="Default provider")
+@click.option(
+    "--param", "-P", "params", multiple=True, help="Default request parameter as key=value"
+)
+@click.option("--concurrency", "-j", default=16, show_default=True, help="Requests in flight")
+@click.option("--rpm", type=int, help="Requests per minute limit, per provider and model")
+@click.option("--tpm", type=int, help="Tokens per minute limit, per provider and model")
+@click.option(
+    "--dedupe/--no-dedupe",
+    default=True,
+    show_default=True,
+    help="Send identical requests only once",
+)
+@click.option(
+    "--dedupe-cache",
+    type=click.Path(dir_okay=False),
+    help="SQLite file remembering responses across runs (default: in memory)",
+)
+@click.option("--shard", help="Only run shard K of N (K/N, 0-based), e.g. 0/4")
+@click.option("--retry-failed", is_flag=True, help="Re-send requests that failed in earlier runs")
+@click.option("--restart", is_flag=True, help="Discard previous output instead of resuming")
+def run(
+    input_path: str,
+    output_path: str,
+    config_path: Optional[str],
+    model: Optional[str],
+    provider: Optional[str],
+    params: Tuple[str, ...],
+    concurrency: int,
+    rpm: Optional[int],
+    tpm: Optional[int],
+    dedupe: bool,
+    dedupe_cache: Optional[str],
+    shard: Optional[str],
+    retry_failed: bool,
+    restart: bool,
+) -> None:
+    """Run every request in INPUT_PATH and append results to OUTPUT_PATH.
+
+    Each input line is a JSON object of completion arguments (e.g.
+    "messages", "model", "temperature"), optionally with an "id", or a
+    "prompt" string. Progress is checkpointed: re-running the same command
+    after an interrupt or crash resumes where it stopped.
+
+    With --shard K/N, only the requests of shard K are run, so N hosts (each
+    with their own keys and rate limits) can split one input; combine their
+    outputs with 'justllms batch merge'.
+
+    Examples:
+        justllms batch run prompts.jsonl results.jsonl -m openai/gpt-4o-mini
+        justllms batch run prompts.jsonl results.jsonl -j 64 --rpm 5000 -P temperature=0
+        justllms batch run prompts.jsonl results-2.jsonl --shard 2/8 -m openai/gpt-4o-mini
+    """
+    from justllms import Client
+    from justllms.batch import BatchRunStats, parse_shard, run_jsonl_batch
+    from justllms.config import load_config
+
+    try:
+        shard_spec = parse_shard(shard) if shard else None
+        config = load_config(config_path)
+        for provider_settings in config.providers.values():
+            if rpm is not None:
+                provider_settings["rate_limit"] = rpm
+            if tpm is not None:
+                provider_settings["token_rate_limit"] = tpm
+        if dedupe:
+            config.cache.coalesce_requests = True
+            if not config.cache.enabled:
+                config.cache.enabled = True
+                config.cache.ttl = None
+                config.cache.max_entries = 100_000
+            if dedupe_cache:
+                config.cache.backend = "sqlite"
+                config.cache.path = dedupe_cache
+                config.cache.max_entries = None
+
+        defaults = _parse_params(params)
+        if model:
+            defaults["model"] = model
+        if provider:
+            defaults["provider"] = provider
+
+        last_report = [0.0]
+
+        def report(stats: BatchRunStats, force: bool = False) -> None:
+            if not force and stats.elapsed - last_report[0] < 2.0:
+                return
+            last_report[0] = stats.elapsed
+            click.echo(
+                f"\r{stats.completed} done ({stats.failed} failed, {stats.cached} deduped, "
+                f"{stats.skipped} already done) {stats.rate:.1f}/s ${stats.cost:.4f}",
+                nl=False,
+                err=True,
+            )
+
+        with Client(config) as client:
+            stats = run_jsonl_batch(
+                client,
+                input_path,
+                output_path,
+                concurrency=concurrency,
+                defaults=defaults,
+                shard=shard_spec,
+                retry_failed=retry_failed,
+                restart=restart,
+                on_progress=report,
+            )
+        report(stats, force=True)
+        click.echo("", err=True)
+    except KeyboardInterrupt:
+        click.echo("\nInterrupted; run the same command again to resume", err=True)
+        sys.exit(130)
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@batch.command()
+@click.argument("input_path", type=click.Path(exists=True, dir_okay=False))
+@click.argument("output_path", type=click.Path(dir_okay=False))
+@click.argument("shard_outputs", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option("--shards", "num_shards", type=int, help="Number of shards, if manifests are missing")
+def merge(
+    input_path: str, output_path: str, shard_outputs: Tuple[str, ...], num_shards: Optional[int]
+) -> None:
+    """Merge shard outputs into OUTPUT_PATH in input order and report completeness.
+
+    Exits with status 2 if results are missing or shards are inconsistent;
+    re-run the listed shards (they resume) and merge again.
+
+    Examples:
+        justllms batch merge prompts.jsonl results.jsonl results-*.jsonl
+    """
+    from justllms.batch import merge_shards
+
+    try:
+        report = merge_shards(input_path, shard_outputs, output_path, num_shards=num_shards)
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    click.echo(
+        f"{report.total} requests: {report.succeeded} succeeded, {report.failed} failed, "
+        f"{report.missing} missing"
+    )
+    for shard_index, count in sorted(report.missing_by_shard.items()):
+        click.echo(f"  shard {shard_index}: {count} missing", err=True)
+    for problem in report.problems:
+        click.echo(f"  {problem}", err=True)
+    click.echo(f"Report written to {output_path}.report.json")
+    if not report.complete:
+        sys.exit(2)
+
+
 if __name__ == "__main__":
     main()
@@ -2,7 +2,7 @@ import contextlib
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Union
 
 import yaml
 from pydantic import BaseModel, ConfigDict, Field
@@ -20,6 +20,32 @@ class ConfigProviderSettings(BaseModel):
     deployment_mapping: Dict[str, str] = Field(default_factory=dict)
 
 
+class CircuitBreakerConfig(BaseModel):
+    """Configuration for per provider/model circuit breakers."""
+
+    model_config = ConfigDict(extra="allow")
+
+    enabled: bool = True
+
+    """failure rate (0-1) within the window at which the circuit opens"""
+    error_threshold: float = 0.5
+
+    """seconds after which a successful call counts as failed (None disables)"""
+    latency_threshold: Optional[float] = None
+
+    """minimum calls in the window before the circuit can open"""
+    min_requests: int = 5
+
+    """length of the sliding window in seconds"""
+    window: float = 60.0
+
+    """seconds the circuit stays open before probe requests are let through"""
+    open_duration: float = 30.0
+
+    """concurrent probe requests allowed while half-open"""
+    half_open_probes: int = 1
+
+
 class RoutingConfig(BaseModel):
     """Configuration for provider and model fallbacks."""
 
@@ -28,9 +54,20 @@ class RoutingConfig(BaseModel):
     fallback_provider: Optional[str] = None
     fallback_model: Optional[str] = None
 
+    """ordered "provider/model" candidates to fail over to when a circuit is open"""
+    failover_models: List[str] = Field(default_factory=list)
+
+    circuit_breaker: CircuitBreakerConfig = Field(default_factory=CircuitBreakerConfig)
+
     """max execution time per tool"""
     tool_timeout: float = 120.0
 
+    """run the tool calls of one model turn concurrently; opt in only if your tools are thread-safe"""
+    parallel_tool_execution: bool = False
+
+    """max tool calls running at once when executing in parallel"""
+    max_tool_workers: int = 8
+
     """max number of tool execution rounds"""
     max_tool_iterations: int = 10
 
@@ -38,6 +75,76 @@ class RoutingConfig(BaseModel):
     execute_tools_by_default: bool = True
 
 
+class RetryConfig(BaseModel):
+    """Client-wide retry budget shared by all providers."""
+
+    model_config = ConfigDict(extra="allow")
+
+    """max retries per original request within the window (None disables the budget)"""
+    budget_ratio: Optional[float] = 0.2
+
+    """retries always allowed per window, so low-traffic clients can still retry"""
+    budget_min_retries: int = 10
+
+    """length of the sliding window in seconds"""
+    budget_window: float = 10.0
+
+
+class SemanticCacheConfig(BaseModel):
+    """Configuration for answering similar (not just identical) requests from cache."""
+
+    model_config = ConfigDict(extra="allow")
+
+    enabled: bool = False
+
+    """callable mapping text to an embedding vector; required when enabled"""
+    embedding_function: Optional[Callable[[str], Sequence[float]]] = None
+
+    """minimum cosine similarity between last messages for a cache hit"""
+    similarity_threshold: float = 0.95
+
+    """capacity of the index; the oldest entries are replaced once full"""
+    max_entries: int = 10000
+
+    """seconds an entry stays valid, None for no expiry"""
+    ttl: Optional[float] = 3600.0
+
+    """directory to persist the index in (memory-mapped), None to keep it in memory"""
+    path: Optional[str] = None
+
+
+class CacheConfig(BaseModel):
+    """Configuration for response caching and sharing responses between identical requests."""
+
+    model_config = ConfigDict(extra="allow")
+
+    """coalesce identical in-flight non-streaming requests into one upstream call"""
+    coalesce_requests: bool = False
+
+    """cache responses (and completed streams) keyed by provider, model, messages and parameters"""
+    enabled: bool = False
+
+    """where cached responses live: "memory" (per process) or "sqlite" (shared on disk)"""
+    backend: Literal["memory", "sqlite"] = "memory"
+
+    """seconds a cached response stays valid, None for no expiry"""
+    ttl: Optional[float] = 3600.0
+
+    """maximum number of cached responses; least recently used ones are evicted"""
+    max_entries: Optional[int] = 1000
+
+    """maximum total size of cached responses in bytes (memory backend only)"""
+    max_size_bytes: Optional[int] = None
+
+    """database file for the sqlite backend"""
+    path: str = ".justllms_cache.sqlite"
+
+    """pace of cached stream replays as a multiple of the recorded speed, None for instant"""
+    stream_replay_speed: Optional[float] = None
+
+    semantic: SemanticCacheConfig = Field(default_factory=SemanticCacheConfig)
+
+
 class Config(BaseModel):
     """Configuration class for multi-provider LLM client."""
 
@@ -45,6 +152,8 @@ class Config(BaseModel):
 
     providers: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
     routing: RoutingConfig = Field(default_factory=RoutingConfig)
+    retry: RetryConfig = Field(default_factory=RetryConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
 
     @classmethod
     def from_file(cls, path: Union[str, Path]) -> "Config":
@@ -1,4 +1,5 @@
 from justllms.core.base import BaseProvider, BaseResponse
+from justllms.core.batch import BatchResult
 from justllms.core.client import Client
 from justllms.core.completion import Completion, CompletionResponse
 from justllms.core.models import Message, Role, Usage
@@ -6,6 +7,7 @@ from justllms.core.models import Message, Role, Usage
 __all__ = [
     "BaseProvider",
     "BaseResponse",
+    "BatchResult",
     "Client",
     "Completion",
     "CompletionResponse",
@@ -1,61 +1,107 @@
+import asyncio
+import functools
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import httpx
-from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
-from justllms.core.models import Choice, Message, ModelInfo, ProviderConfig, Usage
-from justllms.exceptions import ProviderError
+from justllms.core.concurrency import AdaptiveConcurrencyLimiter
+from justllms.core.models import BatchJob, Choice, Message, ModelInfo, ProviderConfig, Usage
+from justllms.core.rate_limit import RateLimiter
+from justllms.core.retry import RetryPolicy, retry_after_from_headers
+from justllms.core.transport import DEFAULT_TIMEOUT, HTTPTransport
+from justllms.exceptions import ProviderError, RateLimitError
+from justllms.utils import codec
+from justllms.utils.codec import json_body
 
 if TYPE_CHECKING:
     from justllms.core.streaming import AsyncStreamResponse, SyncStreamResponse
     from justllms.tools.adapters.base import BaseToolAdapter
 
-DEFAULT_TIMEOUT = 300.0
 
+class BaseResponse:
+    """Base class for all provider responses.
 
-def _is_retryable_http_error(exc: BaseException) -> bool:
-    """Determine if an exception is worth retrying.
-
-    Retries on:
-    - Network/connection errors (httpx.RequestError)
-    - Rate limiting (429)
-    - Server errors (500+)
-    - Request timeout (408)
-
-    Does NOT retry on:
-    - Client errors (400-499 except 429, 408)
+    ``choices`` and ``usage`` may be given as zero-argument callables, which
+    are called on first access. Providers use this to keep the decoded JSON
+    (``data``) as the single copy of the response and only build Choice,
+    Message and Usage models when something reads them; ``raw_response`` is
+    likewise derived from ``data`` on first access.
     """
-    if isinstance(exc, httpx.RequestError):
-        return True
-    if isinstance(exc, ProviderError):
-        status = getattr(exc, "status_code", None)
-        if status is None:
-            return False
-        return status in (429, 408) or status >= 500
-    return False
-
 
-class BaseResponse:
-    """Base class for all provider responses."""
+    STANDARD_KEYS = frozenset(["id", "model", "choices", "usage", "created", "system_fingerprint"])
+    """Top-level keys held in attributes rather than in raw_response."""
 
     def __init__(
         self,
         id: str,
         model: str,
-        choices: List[Choice],
-        usage: Optional[Usage] = None,
+        choices: Union[List[Choice], Callable[[], List[Choice]]],
+        usage: Union[Usage, None, Callable[[], Optional[Usage]]] = None,
         created: Optional[int] = None,
         system_fingerprint: Optional[str] = None,
         **kwargs: Any,
     ):
         self.id = id
         self.model = model
-        self.choices = choices
-        self.usage = usage
+        self._choices = choices
+        self._usage = usage
         self.created = created
         self.system_fingerprint = system_fingerprint
-        self.raw_response = kwargs
+        self._raw_response: Optional[Dict[str, Any]] = kwargs
+        # Decoded provider JSON the response was parsed from, when available
+        self.data: Optional[Dict[str, Any]] = None
+
+    @property
+    def choices(self) -> List[Choice]:
+        """Response choices, parsed from ``data`` on first access if deferred."""
+        if callable(self._choices):
+            self._choices = self._choices()
+        return self._choices
+
+    @choices.setter
+    def choices(self, value: List[Choice]) -> None:
+        self._choices = value
+
+    @property
+    def usage(self) -> Optional[Usage]:
+        """Token usage, parsed from ``data`` on first access if deferred."""
+        if callable(self._usage):
+            self._usage = self._usage()
+        return self._usage
+
+    @usage.setter
+    def usage(self, value: Optional[Usage]) -> None:
+        self._usage = value
+
+    @property
+    def raw_response(self) -> Dict[str, Any]:
+        """Provider-specific fields of the response (everything but STANDARD_KEYS)."""
+        if self._raw_response is None:
+            data = self.data or {}
+            self._raw_response = {k: v for k, v in data.items() if k not in self.STANDARD_KEYS}
+        return self._raw_response
+
+    @raw_response.setter
+    def raw_response(self, value: Dict[str, Any]) -> None:
+        self._raw_response = value
+
+    def _share_data(self, other: "BaseResponse") -> None:
+        """Take over the decoded JSON and deferred fields of ``other`` without copying.
+
+        Fields neither response has read yet are parsed separately by each.
+        """
+        self._choices = other._choices
+        self._usage = other._usage
+        self._raw_response = other._raw_response
+        self.data = other.data
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Loaders are bound to the provider, which can't be pickled
+        state = self.__dict__.copy()
+        state["_choices"] = self.choices
+        state["_usage"] = self.usage
+        return state
 
     @property
     def content(self) -> Optional[str]:
@@ -88,9 +134,54 @@ class BaseProvider(ABC):
     supports_native_tools: bool = False
     """Whether this provider has native built-in tools."""
 
+    supports_batch: bool = False
+    """Whether this provider has a native asynchronous batch API."""
+
+    batch_cost_factor: float = 1.0
+    """Price of batch requests relative to regular ones (batch APIs are usually discounted)."""
+
     def __init__(self, config: ProviderConfig):
         self.config = config
         self._models_cache: Optional[Dict[str, ModelInfo]] = None
+        self._transport = HTTPTransport.from_config(config)
+        self.retry_policy = RetryPolicy.from_config(config)
+        self.rate_limiter = RateLimiter(
+            requests_per_minute=config.rate_limit,
+            tokens_per_minute=config.token_rate_limit,
+        )
+        self.concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = (
+            AdaptiveConcurrencyLimiter.from_config(config) if config.adaptive_concurrency else None
+        )
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """Pooled HTTP client shared by all requests made through this provider."""
+        return self._transport.client
+
+    @property
+    def async_http_client(self) -> httpx.AsyncClient:
+        """Pooled async HTTP client for the running event loop."""
+        return self._transport.async_client
+
+    def close(self) -> None:
+        """Close the provider's connection pool."""
+        self._transport.close()
+
+    async def aclose(self) -> None:
+        """Close the provider's sync and async connection pools."""
+        await self._transport.aclose()
+
+    def __enter__(self) -> "BaseProvider":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "BaseProvider":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
 
     @property
     @abstractmethod
@@ -116,6 +207,30 @@ class BaseProvider(ABC):
         """
         pass
 
+    async def acomplete(
+        self,
+        messages: List[Message],
+        model: str,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> BaseResponse:
+        """Async completion method - same parameters as complete().
+
+        Default implementation runs complete() in the loop's thread pool so
+        custom providers keep working. Built-in providers override this with a
+        native implementation on the pooled async HTTP client.
+
+        Args:
+            messages: List of messages for the completion.
+            model: Model identifier to use.
+            timeout: Optional timeout in seconds. Defaults to 300 seconds if not specified.
+            **kwargs: Additional provider-specific parameters.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.complete, messages, model, timeout=timeout, **kwargs)
+        )
+
     @abstractmethod
     def get_available_models(self) -> Dict[str, ModelInfo]:
         """Get available models for this provider."""
@@ -173,6 +288,35 @@ class BaseProvider(ABC):
             f"Use complete() instead or switch to a streaming-capable provider."
         )
 
+    async def astream(
+        self,
+        messages: List[Message],
+        model: str,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> "AsyncStreamResponse":
+        """Async stream completion - same parameters as stream().
+
+        Default implementation raises NotImplementedError.
+        Providers that support async streaming should override this method.
+
+        Args:
+            messages: List of messages for the completion.
+            model: Model identifier to use.
+            timeout: Optional timeout in seconds. Defaults to 300 seconds if not specified.
+            **kwargs: Additional provider-specific parameters.
+
+        Returns:
+            AsyncStreamResponse.
+
+        Raises:
+            NotImplementedError: If provider doesn't support async streaming.
+        """
+        raise NotImplementedError(
+            f"{self.name} provider doesn't support async streaming. "
+            f"Use acomplete() instead or switch to a streaming-capable provider."
+        )
+
     def supports_streaming(self) -> bool:
         """Check if this provider supports streaming.
 
@@ -239,12 +383,119 @@ class BaseProvider(ABC):
         formatted = self._format_messages_base(messages)
         return count_tokens(formatted, model)
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception(_is_retryable_http_error),
-        reraise=True,
-    )
+    def _estimate_request_tokens(self, messages: List[Message], model: str, **kwargs: Any) -> int:
+        """Estimate the tokens a request counts against a tokens-per-minute limit.
+
+        Args:
+            messages: Request messages (prompt tokens).
+            model: Model identifier for token counting.
+            **kwargs: Request parameters; ``max_tokens`` bounds the completion.
+
+        Returns:
+            int: Estimated prompt tokens plus requested max completion tokens.
+        """
+        return self.count_message_tokens(messages, model) + (kwargs.get("max_tokens") or 0)
+
+    def acquire_rate_limit(self, messages: List[Message], model: str, **kwargs: Any) -> None:
+        """Block until the request fits within the configured rate limits.
+
+        Does nothing if neither ``rate_limit`` nor ``token_rate_limit`` is set.
+
+        Args:
+            messages: Request messages.
+            model: Model identifier; limits are tracked per model.
+            **kwargs: Request parameters (``max_tokens`` is used for estimation).
+        """
+        if not self.rate_limiter.enabled:
+            return
+        tokens = (
+            self._estimate_request_tokens(messages, model, **kwargs)
+            if self.rate_limiter.limits_tokens
+            else 0
+        )
+        self.rate_limiter.acquire(model, tokens)
+
+    async def aacquire_rate_limit(self, messages: List[Message], model: str, **kwargs: Any) -> None:
+        """Async version of acquire_rate_limit() that waits without blocking the loop."""
+        if not self.rate_limiter.enabled:
+            return
+        tokens = (
+            self._estimate_request_tokens(messages, model, **kwargs)
+            if self.rate_limiter.limits_tokens
+            else 0
+        )
+        await self.rate_limiter.aacquire(model, tokens)
+
+    def _build_http_request(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, str]] = None,
+        method: str = "POST",
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Build keyword arguments for an httpx ``request()`` call.
+
+        Args:
+            url: Target endpoint URL for the request.
+            payload: Request body data to send as JSON (ignored for GET).
+            headers: Optional HTTP headers to include in request.
+            params: Optional query parameters for the request.
+            method: HTTP method to use ('POST' or 'GET').
+            timeout: Optional timeout in seconds. Defaults to 300 seconds if not specified.
+
+        Returns:
+            Dict[str, Any]: Arguments accepted by both httpx.Client.request and
+                           httpx.AsyncClient.request.
+
+        Raises:
+            ValueError: If unsupported HTTP method is specified.
+        """
+        method = method.upper()
+        if method not in ("POST", "GET"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        request: Dict[str, Any] = {
+            "method": method,
+            "url": url,
+            "headers": headers or {},
+            "params": params or {},
+            "timeout": timeout if timeout is not None else DEFAULT_TIMEOUT,
+        }
+        if method == "POST":
+            request.update(json_body(payload, headers))
+        return request
+
+    def _handle_http_response(self, response: httpx.Response) -> Dict[str, Any]:
+        """Validate an HTTP response and decode its JSON body.
+
+        Args:
+            response: Completed HTTP response from the provider API.
+
+        Returns:
+            Dict[str, Any]: Parsed JSON response from the API.
+
+        Raises:
+            RateLimitError: If the provider rejected the request with 429.
+            ProviderError: If the response has any other non-200 status.
+        """
+        if response.status_code != 200:
+            message = f"{self.name} API error: {response.status_code} - {response.text}"
+            error_kwargs: Dict[str, Any] = {
+                "provider": self.name,
+                "status_code": response.status_code,
+                "response_body": response.text,
+                "headers": dict(response.headers),
+            }
+            if response.status_code == 429:
+                raise RateLimitError(
+                    message, retry_after=retry_after_from_headers(response.headers), **error_kwargs
+                )
+            raise ProviderError(message, **error_kwargs)
+
+        return codec.loads(response.content)  # type: ignore[no-any-return]
+
     def _make_http_request(
         self,
         url: str,
@@ -253,11 +504,13 @@ class BaseProvider(ABC):
         params: Optional[Dict[str, str]] = None,
         method: str = "POST",
         timeout: Optional[float] = None,
+        retry: bool = True,
     ) -> Dict[str, Any]:
         """Execute HTTP request with automatic retry logic and error handling.
 
         Provides consistent HTTP request handling across all providers with
-        built-in retry logic and standardized error reporting.
+        standardized error reporting. Failed requests are retried according to
+        ``self.retry_policy`` (see justllms.core.retry.RetryPolicy).
 
         Args:
             url: Target endpoint URL for the request.
@@ -266,6 +519,9 @@ class BaseProvider(ABC):
             params: Optional query parameters for the request.
             method: HTTP method to use ('POST' or 'GET').
             timeout: Optional timeout in seconds. Defaults to 300 seconds if not specified.
+            retry: Whether failed attempts are retried. Pass False for requests
+                  that aren't safe to repeat, such as creating a batch job: a
+                  timed-out attempt may still have been carried out.
 
         Returns:
             Dict[str, Any]: Parsed JSON response from the API.
@@ -275,36 +531,140 @@ class BaseProvider(ABC):
                           Includes provider name, status code, and response details.
             ValueError: If unsupported HTTP method is specified.
         """
-        request_headers = headers or {}
-        request_params = params or {}
-
-        timeout_config = timeout if timeout is not None else DEFAULT_TIMEOUT
-        with httpx.Client(timeout=timeout_config) as client:
-            if method.upper() == "POST":
-                response = client.post(
-                    url,
-                    json=payload,
-                    headers=request_headers,
-                    params=request_params,
-                )
-            elif method.upper() == "GET":
-                response = client.get(
-                    url,
-                    headers=request_headers,
-                    params=request_params,
-                )
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+        request = self._build_http_request(url, payload, headers, params, method, timeout)
+        if not retry:
+            return self._send_http_request(request)
+        return self.retry_policy.call(self._send_http_request, request)
 
-            if response.status_code != 200:
-                raise ProviderError(
-                    f"{self.name} API error: {response.status_code} - {response.text}",
-                    provider=self.name,
-                    status_code=response.status_code,
-                    response_body=response.text,
-                )
+    def _send_http_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a single request attempt on the pooled client.
+
+        With adaptive concurrency enabled, the attempt holds a limiter slot while
+        in flight and its status and rate-limit headers feed back into the limit.
+        """
+        limiter = self.concurrency_limiter
+        if limiter is None:
+            return self._handle_http_response(self.http_client.request(**request))
+
+        with limiter.slot():
+            response = self.http_client.request(**request)
+            limiter.observe(response.status_code, response.headers)
+        return self._handle_http_response(response)
+
+    async def _amake_http_request(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, str]] = None,
+        method: str = "POST",
+        timeout: Optional[float] = None,
+        retry: bool = True,
+    ) -> Dict[str, Any]:
+        """Async version of _make_http_request() using the pooled async client.
+
+        Args:
+            url: Target endpoint URL for the request.
+            payload: Request body data to send as JSON.
+            headers: Optional HTTP headers to include in request.
+            params: Optional query parameters for the request.
+            method: HTTP method to use ('POST' or 'GET').
+            timeout: Optional timeout in seconds. Defaults to 300 seconds if not specified.
+            retry: Whether failed attempts are retried.
+
+        Returns:
+            Dict[str, Any]: Parsed JSON response from the API.
+
+        Raises:
+            ProviderError: If request fails after retries or returns non-200 status.
+            ValueError: If unsupported HTTP method is specified.
+        """
+        request = self._build_http_request(url, payload, headers, params, method, timeout)
+        if not retry:
+            return await self._asend_http_request(request)
+        return await self.retry_policy.acall(self._asend_http_request, request)
+
+    async def _asend_http_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Async version of _send_http_request() using the pooled async client."""
+        limiter = self.concurrency_limiter
+        if limiter is None:
+            return self._handle_http_response(await self.async_http_client.request(**request))
+
+        async with limiter.aslot():
+            response = await self.async_http_client.request(**request)
+            limiter.observe(response.status_code, response.headers)
+        return self._handle_http_response(response)
+
+    def _upload_file(
+        self,
+        url: str,
+        content: bytes,
+        filename: str,
+        fields: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Upload a file as multipart form data.
+
+        The upload is sent once: retrying one that timed out could leave a
+        duplicate file behind.
+
+        Args:
+            url: Upload endpoint URL.
+            content: File contents.
+            filename: File name sent with the upload.
+            fields: Additional form fields (e.g. ``purpose``).
+            headers: HTTP headers; must not set a JSON Content-Type.
+            timeout: Optional timeout in seconds. Defaults to 300 seconds if not specified.
+
+        Returns:
+            Dict[str, Any]: Parsed JSON response from the API.
+
+        Raises:
+            ProviderError: If the upload fails.
+        """
+        response = self.http_client.post(
+            url,
+            files={"file": (filename, content, "application/jsonl")},
+            data=fields or {},
+            headers=headers or {},
+            timeout=timeout if timeout is not None else DEFAULT_TIMEOUT,
+        )
+        return self._handle_http_response(response)
+
+    def _iter_remote_lines(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[str]:
+        """Download a line-oriented file (e.g. JSONL results) without buffering it whole.
+
+        Args:
+            url: File URL.
+            headers: Optional HTTP headers.
+            params: Optional query parameters.
+            timeout: Optional timeout in seconds. Defaults to 300 seconds if not specified.
 
-            return response.json()  # type: ignore[no-any-return]
+        Yields:
+            Lines of the file.
+
+        Raises:
+            ProviderError: If the download is rejected.
+        """
+        with self.http_client.stream(
+            "GET",
+            url,
+            headers=headers or {},
+            params=params or {},
+            timeout=timeout if timeout is not None else DEFAULT_TIMEOUT,
+            follow_redirects=True,
+        ) as response:
+            if response.status_code != 200:
+                response.read()
+                self._handle_http_response(response)
+            yield from response.iter_lines()
 
     def _extract_raw_response(
         self, response_data: Dict[str, Any], exclude_keys: Optional[List[str]] = None
@@ -322,30 +682,29 @@ class BaseProvider(ABC):
         Returns:
             Dict[str, Any]: Filtered response data containing only custom fields.
         """
-        default_exclude_keys = ["id", "model", "choices", "usage", "created", "system_fingerprint"]
-        exclude_keys = default_exclude_keys if exclude_keys is None else exclude_keys
+        exclude = BaseResponse.STANDARD_KEYS if exclude_keys is None else exclude_keys
 
-        return {k: v for k, v in response_data.items() if k not in exclude_keys}
+        return {k: v for k, v in response_data.items() if k not in exclude}
 
     def _create_base_response(
         self,
         response_class: type,
         response_data: Dict[str, Any],
-        choices: List[Choice],
-        usage: Usage,
+        choices: Union[List[Choice], Callable[[], List[Choice]]],
+        usage: Union[Usage, Callable[[], Usage]],
         model: str,
         **kwargs: Any,
     ) -> BaseResponse:
         """Construct a standardized response object from provider data.
 
-        Creates response objects with consistent structure across all providers
-        while preserving provider-specific metadata and allowing customization.
+        The response keeps ``response_data`` itself rather than a copy; its
+        provider-specific fields become ``raw_response`` when first read.
 
         Args:
             response_class: Response class to instantiate (e.g., OpenAIResponse).
             response_data: Raw response dictionary from provider API.
-            choices: List of parsed choice objects with messages.
-            usage: Token usage statistics for the request.
+            choices: Parsed choices, or a callable parsing them on first access.
+            usage: Token usage statistics, or a callable parsing them on first access.
             model: Model identifier used for the request.
             **kwargs: Additional fields to include in the response object.
 
@@ -353,18 +712,21 @@ class BaseProvider(ABC):
             BaseResponse: Instantiated response object with standard fields
                          and provider-specific metadata.
         """
-        raw_response = self._extract_raw_response(response_data)
-
-        return response_class(  # type: ignore[no-any-return]
+        response = response_class(
             id=response_data.get("id", ""),
             model=model,
             choices=choices,
             usage=usage,
             created=response_data.get("created"),
             system_fingerprint=response_data.get("system_fingerprint"),
-            **raw_response,
             **kwargs,
         )
+        response.data = response_data
+        if not kwargs:
+            response._raw_response = None
+        else:
+            response._raw_response = {**self._extract_raw_response(response_data), **kwargs}
+        return response  # type: ignore[no-any-return]
 
     def _format_messages_base(self, messages: List[Message]) -> List[Dict[str, Any]]:
         """Convert Message objects to provider-compatible format.
@@ -472,6 +834,37 @@ class BaseProvider(ABC):
 
         return self.complete(messages, model, timeout=timeout, **kwargs)
 
+    async def acomplete_with_tools(
+        self,
+        messages: List[Message],
+        tools: Optional[List[Dict[str, Any]]] = None,
+        model: str = "",
+        tool_choice: Optional[Any] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> BaseResponse:
+        """Async version of complete_with_tools().
+
+        Default implementation delegates to acomplete() with tools in kwargs.
+
+        Args:
+            messages: List of messages for the completion.
+            tools: List of tool definitions in provider format.
+            model: Model identifier to use.
+            tool_choice: Tool selection strategy.
+            timeout: Optional timeout in seconds.
+            **kwargs: Additional provider-specific parameters.
+
+        Returns:
+            BaseResponse with potential tool calls.
+        """
+        if tools:
+            kwargs["tools"] = tools
+        if tool_choice is not None:
+            kwargs["tool_choice"] = tool_choice
+
+        return await self.acomplete(messages, model, timeout=timeout, **kwargs)
+
     def get_tool_adapter(self) -> Optional["BaseToolAdapter"]:
         """Get the tool adapter for this provider.
 
@@ -488,3 +881,53 @@ class BaseProvider(ABC):
         raise NotImplementedError(
             f"{self.name} provider supports tools but hasn't implemented get_tool_adapter()"
         )
+
+    def create_batch(
+        self, requests: List[Tuple[str, List[Message], Dict[str, Any]]], model: str
+    ) -> BatchJob:
+        """Submit requests as a provider-native batch job.
+
+        Args:
+            requests: (custom_id, messages, params) for each request.
+            model: Model used for every request in the job.
+
+        Returns:
+            BatchJob describing the submitted job.
+
+        Raises:
+            NotImplementedError: If the provider has no batch API.
+        """
+        raise NotImplementedError(f"{self.name} provider doesn't support batch jobs")
+
+    def retrieve_batch(self, batch_id: str) -> BatchJob:
+        """Fetch the current state of a batch job.
+
+        Raises:
+            NotImplementedError: If the provider has no batch API.
+        """
+        raise NotImplementedError(f"{self.name} provider doesn't support batch jobs")
+
+    def cancel_batch(self, batch_id: str) -> BatchJob:
+        """Request cancellation of a batch job.
+
+        Raises:
+            NotImplementedError: If the provider has no batch API.
+        """
+        raise NotImplementedError(f"{self.name} provider doesn't support batch jobs")
+
+    def iter_batch_results(
+        self, job: BatchJob
+    ) -> Iterator[Tuple[str, Optional[BaseResponse], Optional[Exception]]]:
+        """Stream the results of a finished batch job.
+
+        Args:
+            job: Job as returned by retrieve_batch() once it is done.
+
+        Yields:
+            (custom_id, response, error) per request; exactly one of response
+            and error is set.
+
+        Raises:
+            NotImplementedError: If the provider has no batch API.
+        """
+        raise NotImplementedError(f"{self.name} provider doesn't support batch jobs")
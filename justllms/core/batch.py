@@ -0,0 +1,152 @@
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+)
+
+if TYPE_CHECKING:
+    from justllms.core.completion import CompletionResponse
+
+
+class BatchResult:
+    """Outcome of one item of a batch."""
+
+    def __init__(
+        self,
+        index: int,
+        request: Any,
+        response: Optional["CompletionResponse"] = None,
+        error: Optional[BaseException] = None,
+        custom_id: Optional[str] = None,
+    ):
+        """Initialize a batch result.
+
+        Args:
+            index: Position of the item in the batch input.
+            request: The item as given (e.g. the create() keyword arguments).
+            response: Response if the item succeeded.
+            error: Exception raised by the item, if it failed.
+            custom_id: Identifier of the item in a provider-native batch job.
+        """
+        self.index = index
+        self.request = request
+        self.response = response
+        self.error = error
+        self.custom_id = custom_id
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item succeeded."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"BatchResult(index={self.index}, {status})"
+
+
+def run_batch(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    concurrency: int = 10,
+    on_result: Optional[Callable[[BatchResult], Any]] = None,
+) -> Iterator[BatchResult]:
+    """Run ``fn`` over ``items`` on a thread pool and yield results as they complete.
+
+    At most ``concurrency`` items are in flight; ``items`` is consumed lazily,
+    so arbitrarily long iterables (e.g. a file being read) are fine. Errors are
+    captured per item rather than aborting the batch. If the caller stops
+    iterating, items that haven't started are cancelled.
+
+    Args:
+        fn: Function called with each item.
+        items: Batch input.
+        concurrency: Maximum number of items running at once.
+        on_result: Optional callback invoked with each result (e.g. for progress).
+
+    Yields:
+        BatchResult for each item, in completion order.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    def run(index: int, item: Any) -> BatchResult:
+        try:
+            return BatchResult(index, item, response=fn(item))
+        except Exception as e:
+            return BatchResult(index, item, error=e)
+
+    def finish(done: Set["Future[BatchResult]"]) -> Iterator[BatchResult]:
+        for future in sorted(done, key=lambda f: f.result().index):
+            result = future.result()
+            if on_result is not None:
+                on_result(result)
+            yield result
+
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="batch")
+    pending: Set[Future[BatchResult]] = set()
+    try:
+        for index, item in enumerate(items):
+            if len(pending) >= concurrency:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from finish(done)
+            pending.add(executor.submit(run, index, item))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from finish(done)
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def arun_batch(
+    fn: Callable[[Any], Awaitable[Any]],
+    items: Iterable[Any],
+    concurrency: int = 10,
+    on_result: Optional[Callable[[BatchResult], Any]] = None,
+) -> AsyncIterator[BatchResult]:
+    """Async version of run_batch() that runs items as tasks on the current loop.
+
+    If the caller stops iterating, items still in flight are cancelled.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    async def run(index: int, item: Any) -> BatchResult:
+        try:
+            return BatchResult(index, item, response=await fn(item))
+        except Exception as e:
+            return BatchResult(index, item, error=e)
+
+    def finish(done: Set["asyncio.Task[BatchResult]"]) -> Iterator[BatchResult]:
+        for task in sorted(done, key=lambda t: t.result().index):
+            result = task.result()
+            if on_result is not None:
+                on_result(result)
+            yield result
+
+    pending: Set[asyncio.Task[BatchResult]] = set()
+    try:
+        for index, item in enumerate(items):
+            if len(pending) >= concurrency:
+                done, pending = await asyncio.wait(pending, return_when=FIRST_COMPLETED)
+                for result in finish(done):
+                    yield result
+            pending.add(asyncio.ensure_future(run(index, item)))
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=FIRST_COMPLETED)
+            for result in finish(done):
+                yield result
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
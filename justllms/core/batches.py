@@ -0,0 +1,286 @@
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from justllms.core.base import BaseProvider
+from justllms.core.batch import BatchResult
+from justllms.core.models import BatchJob
+from justllms.exceptions import ProviderError, TimeoutError
+from justllms.utils.validators import validate_messages
+
+if TYPE_CHECKING:
+    from justllms.core.client import Client
+
+
+class Batches:
+    """Provider-native batch jobs (OpenAI Batch, Anthropic Message Batches, Gemini batch).
+
+    Batch jobs are processed asynchronously by the provider, typically within
+    24 hours, at a discount (see ``BaseProvider.batch_cost_factor``). Requests
+    are formatted by the same code as regular completions. For results within
+    seconds, use ``client.completion.batch()`` instead.
+    """
+
+    def __init__(self, client: "Client"):
+        self.client = client
+
+    def create(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        *,
+        model: str,
+        provider: Optional[str] = None,
+        **defaults: Any,
+    ) -> BatchJob:
+        """Submit a batch job.
+
+        Args:
+            requests: One dict per request with ``messages`` and optionally a
+                ``custom_id`` (defaults to ``request-<index>``) and any
+                completion parameters.
+            model: Model for every request. Can be 'provider/model'.
+            provider: Provider to submit to. Inferred from the model if omitted.
+            **defaults: Parameters applied to every request unless it sets them.
+
+        Returns:
+            BatchJob: The submitted job.
+
+        Raises:
+            ProviderError: If no provider with batch support serves the model.
+            ValueError: If a request is malformed or custom IDs are not unique.
+        """
+        provider, model = self._resolve_provider(model, provider)
+
+        prepared = []
+        seen = set()
+        for index, request in enumerate(requests):
+            params = {**defaults, **request}
+            custom_id = str(params.pop("custom_id", None) or f"request-{index}")
+            if custom_id in seen:
+                raise ValueError(f"Duplicate custom_id in batch: {custom_id!r}")
+            seen.add(custom_id)
+            if "messages" not in params:
+                raise ValueError(f"Batch request {custom_id!r} has no messages")
+            if params.pop("stream", False):
+                raise ValueError("Streaming requests are not supported in batches")
+            if params.pop("model", model) != model:
+                raise ValueError("All requests in a batch job must use the same model")
+            messages = validate_messages(params.pop("messages"))
+            params = {k: v for k, v in params.items() if v is not None}
+            prepared.append((custom_id, messages, params))
+
+        if not prepared:
+            raise ValueError("Batch must contain at least one request")
+
+        return self.client.providers[provider].create_batch(prepared, model)
+
+    def retrieve(self, job: Union[BatchJob, str], provider: Optional[str] = None) -> BatchJob:
+        """Fetch the current state of a batch job.
+
+        Args:
+            job: Job or job ID.
+            provider: Provider the job was submitted to; required with a job ID.
+
+        Returns:
+            BatchJob: Updated job.
+        """
+        provider_instance, batch_id = self._resolve_job(job, provider)
+        updated = provider_instance.retrieve_batch(batch_id)
+        if isinstance(job, BatchJob) and updated.model is None:
+            updated.model = job.model
+        return updated
+
+    def cancel(self, job: Union[BatchJob, str], provider: Optional[str] = None) -> BatchJob:
+        """Request cancellation of a batch job.
+
+        Results of requests that finished before cancellation remain available.
+
+        Args:
+            job: Job or job ID.
+            provider: Provider the job was submitted to; required with a job ID.
+
+        Returns:
+            BatchJob: Updated job, usually in the ``cancelling`` state.
+        """
+        provider_instance, batch_id = self._resolve_job(job, provider)
+        updated = provider_instance.cancel_batch(batch_id)
+        if isinstance(job, BatchJob) and updated.model is None:
+            updated.model = job.model
+        return updated
+
+    def wait(
+        self,
+        job: Union[BatchJob, str],
+        provider: Optional[str] = None,
+        *,
+        poll_interval: float = 30.0,
+        timeout: Optional[float] = None,
+        on_update: Optional[Callable[[BatchJob], Any]] = None,
+    ) -> BatchJob:
+        """Poll a batch job until it reaches a final state.
+
+        Args:
+            job: Job or job ID.
+            provider: Provider the job was submitted to; required with a job ID.
+            poll_interval: Seconds between status checks.
+            timeout: Maximum seconds to wait, or None to wait indefinitely.
+            on_update: Optional callback invoked with the job after each check.
+
+        Returns:
+            BatchJob: The finished job.
+
+        Raises:
+            TimeoutError: If the job is still running after ``timeout`` seconds.
+                The job itself keeps running.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        current = self.retrieve(job, provider)
+        while True:
+            if on_update is not None:
+                on_update(current)
+            if current.done:
+                return current
+            if deadline is not None and time.monotonic() + poll_interval > deadline:
+                raise TimeoutError(
+                    f"Batch job {current.id} did not finish within {timeout}s "
+                    f"(status: {current.status.value})",
+                    timeout_seconds=timeout,
+                    provider=current.provider,
+                )
+            time.sleep(poll_interval)
+            current = self.retrieve(current)
+
+    def results(self, job: BatchJob) -> Iterator[BatchResult]:
+        """Stream the results of a finished batch job.
+
+        Results are yielded in the order the provider returns them, which need
+        not match submission order; use ``result.custom_id`` to match them to
+        requests. Costs reflect the provider's batch discount.
+
+        Args:
+            job: Finished job, as returned by wait() or retrieve().
+
+        Yields:
+            BatchResult: One result per request, with ``index`` counting
+            results as they are yielded.
+        """
+        provider_instance, _ = self._resolve_job(job, None)
+        for index, (custom_id, response, error) in enumerate(
+            provider_instance.iter_batch_results(job)
+        ):
+            if response is None:
+                yield BatchResult(index, None, error=error, custom_id=custom_id)
+                continue
+
+            self.client._estimate_and_set_cost(
+                response, provider_instance, job.model or response.model
+            )
+            if response.usage and response.usage.estimated_cost is not None:
+                response.usage.estimated_cost *= provider_instance.batch_cost_factor
+            yield BatchResult(
+                index,
+                None,
+                response=self.client._wrap_completion_response(response, job.provider),
+                custom_id=custom_id,
+            )
+
+    def run(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        *,
+        model: str,
+        provider: Optional[str] = None,
+        poll_interval: float = 30.0,
+        timeout: Optional[float] = None,
+        **defaults: Any,
+    ) -> List[BatchResult]:
+        """Submit a batch job, wait for it and collect its results.
+
+        Args:
+            requests: Requests as accepted by create().
+            model: Model for every request. Can be 'provider/model'.
+            provider: Provider to submit to. Inferred from the model if omitted.
+            poll_interval: Seconds between status checks.
+            timeout: Maximum seconds to wait, or None to wait indefinitely.
+            **defaults: Parameters applied to every request unless it sets them.
+
+        Returns:
+            List[BatchResult]: One result per request, in input order. Requests
+            the provider returned nothing for (e.g. the job expired) carry a
+            ProviderError.
+
+        Examples:
+            results = client.batches.run(
+                [{"messages": [{"role": "user", "content": q}]} for q in questions],
+                model="openai/gpt-4o-mini",
+            )
+        """
+        requests = list(requests)
+        custom_ids = [
+            str(request.get("custom_id") or f"request-{index}")
+            for index, request in enumerate(requests)
+        ]
+        job = self.create(requests, model=model, provider=provider, **defaults)
+        job = self.wait(job, poll_interval=poll_interval, timeout=timeout)
+
+        by_id = {result.custom_id: result for result in self.results(job)}
+        results = []
+        for index, (custom_id, request) in enumerate(zip(custom_ids, requests)):
+            result = by_id.get(custom_id)
+            if result is None:
+                result = BatchResult(
+                    index,
+                    request,
+                    error=ProviderError(
+                        f"No result for request {custom_id!r} (job {job.status.value})",
+                        provider=job.provider,
+                    ),
+                    custom_id=custom_id,
+                )
+            result.index = index
+            result.request = request
+            results.append(result)
+        return results
+
+    def _resolve_provider(self, model: str, provider: Optional[str]) -> Tuple[str, str]:
+        if provider is None and "/" in model:
+            provider, model = model.split("/", 1)
+
+        if provider is None:
+            candidates = [
+                name
+                for name, instance in self.client.providers.items()
+                if instance.supports_batch and model in instance.get_available_models()
+            ]
+            if not candidates:
+                raise ProviderError(f"No provider with batch support offers model '{model}'")
+            provider = candidates[0]
+
+        if provider not in self.client.providers:
+            raise ProviderError(f"Provider '{provider}' not found")
+        if not self.client.providers[provider].supports_batch:
+            raise ProviderError(f"Provider '{provider}' doesn't support batch jobs")
+        return provider, model
+
+    def _resolve_job(
+        self, job: Union[BatchJob, str], provider: Optional[str]
+    ) -> Tuple[BaseProvider, str]:
+        if isinstance(job, BatchJob):
+            provider, batch_id = job.provider, job.id
+        else:
+            batch_id = job
+        if provider is None:
+            raise ValueError("provider is required when passing a batch job ID")
+        if provider not in self.client.providers:
+            raise ProviderError(f"Provider '{provider}' not found")
+        return self.client.providers[provider], batch_id
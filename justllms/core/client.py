@@ -1,11 +1,32 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+import asyncio
+import contextlib
+import functools
+import sys
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
+from justllms.cache import ResponseCache, SemanticCache
 from justllms.config import Config
 from justllms.core.base import BaseProvider, BaseResponse
+from justllms.core.batches import Batches
 from justllms.core.completion import Completion, CompletionResponse
 from justllms.core.models import Message, ProviderConfig
+from justllms.core.retry import RetryBudget
+from justllms.core.singleflight import SingleFlight
 from justllms.exceptions import ProviderError
 from justllms.routing import Router
+from justllms.routing.circuit_breaker import CircuitState
+from justllms.utils.request_key import request_key
 
 if TYPE_CHECKING:
     from justllms.core.streaming import AsyncStreamResponse, SyncStreamResponse
@@ -24,7 +45,15 @@ class Client:
     ):
         self.config = self._load_config(config)
 
+        self.retry_budget = self._create_retry_budget()
+        self._singleflight: Optional[SingleFlight] = (
+            SingleFlight() if self.config.cache.coalesce_requests else None
+        )
+        self.response_cache = ResponseCache.from_config(self.config.cache)
+        self.semantic_cache = SemanticCache.from_config(self.config.cache.semantic)
         self.providers = providers if providers is not None else {}
+        for provider_instance in self.providers.values():
+            provider_instance.retry_policy.budget = self.retry_budget
         self.router = router or Router(self.config.routing)
         self.default_model = default_model
         self.default_provider = default_provider
@@ -34,6 +63,7 @@ class Client:
         self.tool_registry = ToolRegistry()
 
         self.completion = Completion(self)
+        self.batches = Batches(self)
 
         if providers is None:
             self._initialize_providers()
@@ -65,6 +95,21 @@ class Client:
 
             return load_config(use_defaults=True, use_env=True)
 
+    def _create_retry_budget(self) -> Optional[RetryBudget]:
+        """Create the retry budget shared by every provider of this client.
+
+        Returns:
+            Optional[RetryBudget]: Shared budget, or None if disabled in config.
+        """
+        retry_config = self.config.retry
+        if retry_config.budget_ratio is None:
+            return None
+        return RetryBudget(
+            ratio=retry_config.budget_ratio,
+            min_retries=retry_config.budget_min_retries,
+            window=retry_config.budget_window,
+        )
+
     def _initialize_providers(self) -> None:
         """Initialize providers based on configuration settings.
 
@@ -91,7 +136,7 @@ class Client:
 
             try:
                 config = ProviderConfig(name=provider_name, **provider_config)
-                self.providers[provider_name] = provider_class(config)
+                self.add_provider(provider_name, provider_class(config))
             except Exception:
                 pass
 
@@ -102,6 +147,7 @@ class Client:
             name: Unique identifier for the provider (e.g., 'openai', 'anthropic').
             provider: Configured provider instance implementing BaseProvider.
         """
+        provider.retry_policy.budget = self.retry_budget
         self.providers[name] = provider
 
     def get_provider(self, name: str) -> Optional[BaseProvider]:
@@ -124,6 +170,40 @@ class Client:
         """
         return list(self.providers.keys())
 
+    def close(self) -> None:
+        """Close the connection pools of all providers and the caches.
+
+        Providers reopen their pool lazily, so the client remains usable after
+        closing, but each provider will pay a fresh connection handshake.
+        """
+        for provider in self.providers.values():
+            provider.close()
+        if self.response_cache is not None:
+            self.response_cache.close()
+        if self.semantic_cache is not None:
+            self.semantic_cache.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def aclose(self) -> None:
+        """Close the sync and async connection pools of all providers and the caches."""
+        for provider in self.providers.values():
+            await provider.aclose()
+        if self.response_cache is not None:
+            self.response_cache.close()
+        if self.semantic_cache is not None:
+            self.semantic_cache.close()
+
+    async def __aenter__(self) -> "Client":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
     def register_tools(self, tools: List[Any]) -> None:
         """Register tools for use with completions.
 
@@ -190,16 +270,142 @@ class Client:
         Returns:
             CompletionResponse with provider metadata.
         """
-        return CompletionResponse(
-            id=response.id,
-            model=response.model,
-            choices=response.choices,
-            usage=response.usage,
-            created=response.created,
-            system_fingerprint=response.system_fingerprint,
-            provider=provider,
-            **response.raw_response,
-        )
+        return CompletionResponse.from_response(response, provider)
+
+    def _select_tool_provider(
+        self,
+        messages: List[Message],
+        model: Optional[str],
+        provider: Optional[str],
+        **kwargs: Any,
+    ) -> Tuple[str, str]:
+        """Resolve provider and model for a tool-enabled completion.
+
+        Args:
+            messages: List of conversation messages to process.
+            model: Optional specific model to use.
+            provider: Optional specific provider to use.
+            **kwargs: Additional request parameters passed to the router.
+
+        Returns:
+            Tuple of (provider_name, model_name).
+
+        Raises:
+            ProviderError: If the specified provider is not available.
+            ValueError: If the provider has no models.
+        """
+        if not provider:
+            return self.router.route_with_tools(
+                messages=messages, providers=self.providers, model=model, **kwargs
+            )
+
+        if provider not in self.providers:
+            raise ProviderError(f"Provider '{provider}' not found")
+
+        provider_instance = self.providers[provider]
+        models = provider_instance.get_available_models()
+        _model: Optional[str] = model if model else (list(models.keys())[0] if models else None)
+
+        if not _model:
+            raise ValueError(f"No models available for provider {provider}")
+
+        return provider, _model
+
+    def _track_circuit(self, provider: str, model: str) -> ContextManager[None]:
+        """Record the outcome of a provider call in the router's circuit breakers.
+
+        Custom routers without circuit breakers are supported and skip tracking.
+        """
+        track = getattr(self.router, "track", None)
+        if track is None:
+            return contextlib.nullcontext()
+        return track(provider, model)  # type: ignore[no-any-return]
+
+    def _release_circuit(self, provider: str, model: str) -> None:
+        """Give back the circuit probe reserved by routing for a request that wasn't sent.
+
+        Custom routers without circuit breakers are supported and skip this.
+        """
+        release = getattr(self.router, "release", None)
+        if release is not None:
+            release(provider, model)
+
+    def _pop_tool_options(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract tool execution options from request kwargs, applying config defaults."""
+        return {
+            "tool_choice": kwargs.pop("tool_choice", "auto"),
+            "execute_tools": kwargs.pop(
+                "execute_tools", self.config.routing.execute_tools_by_default
+            ),
+            "max_iterations": kwargs.pop("max_iterations", self.config.routing.max_tool_iterations),
+            "timeout": kwargs.pop("timeout", None),
+        }
+
+    def _select_provider(
+        self,
+        messages: List[Message],
+        model: Optional[str],
+        provider: Optional[str],
+        stream: bool,
+        **kwargs: Any,
+    ) -> Tuple[str, str]:
+        """Resolve provider and model for a plain or streaming completion.
+
+        Args:
+            messages: List of conversation messages to process.
+            model: Optional specific model to use. Can be model name or
+                  'provider/model' format.
+            provider: Optional specific provider to use. Overrides fallback selection.
+            stream: Whether the request is streaming.
+            **kwargs: Additional request parameters passed to the router.
+
+        Returns:
+            Tuple of (provider_name, model_name).
+
+        Raises:
+            ValueError: If no suitable model is available.
+            ProviderError: If the specified provider is not available, or if
+                          streaming is requested but the provider doesn't support it.
+        """
+        if provider:
+            if provider not in self.providers:
+                raise ProviderError(f"Provider '{provider}' not found")
+
+            provider_instance = self.providers[provider]
+
+            # Determine model to use
+            if model:
+                selected_model = model
+            else:
+                # Try to get default model from provider
+                models = provider_instance.get_available_models()
+                if models:
+                    selected_model = list(models.keys())[0]
+                else:
+                    raise ValueError(f"No models available for provider {provider}")
+
+            if stream and not provider_instance.supports_streaming_for_model(selected_model):
+                streaming_providers = [
+                    name for name, prov in self.providers.items() if prov.supports_streaming()
+                ]
+                streaming_hint = (
+                    f" Try using one of these providers: {', '.join(streaming_providers)}"
+                    if streaming_providers
+                    else ""
+                )
+                raise ProviderError(
+                    f"Provider '{provider}' does not support streaming for model '{selected_model}'. "
+                    f"Use stream=False or switch to a streaming-capable provider.{streaming_hint}"
+                )
+
+            return provider, selected_model
+
+        if stream:
+            return self.router.route_streaming(
+                messages=messages, providers=self.providers, model=model, **kwargs
+            )
+
+        return self.router.route(messages=messages, model=model, providers=self.providers, **kwargs)
 
     def _create_completion(
         self,
@@ -212,7 +418,10 @@ class Client:
         """Create a completion with automatic fallback support.
 
         Uses configured fallback provider/model or first available provider
-        if no specific model is requested.
+        if no specific model is requested. When caching is enabled, requests
+        are answered from the cache if an identical (or, with the semantic
+        cache, similar enough) request was made before; cached streams are
+        replayed chunk by chunk.
 
         Args:
             messages: List of conversation messages to process.
@@ -232,109 +441,619 @@ class Client:
                           completion request fails, or if streaming is requested
                           but the provider doesn't support it.
         """
+        # Hedging applies to plain and streaming completions only
+        hedge_delay = kwargs.pop("hedge_delay", None)
+        use_cache = kwargs.pop("cache", None) is not False
+        accumulate = kwargs.pop("accumulate", True)
+        keep_raw = kwargs.pop("keep_raw", True)
+
         # Check if tools are provided
         tools = kwargs.pop("tools", None)
         if tools and not stream:
             # Route to tool-enabled completion
-            # Determine provider/model for tools
-            if not provider:
-                provider_name, selected_model = self.router.route_with_tools(
-                    messages=messages, providers=self.providers, model=model, **kwargs
+            provider_name, selected_model = self._select_tool_provider(
+                messages, model, provider, **kwargs
+            )
+            tool_options = self._pop_tool_options(kwargs)
+
+            # Call tool-enabled completion
+            return self.completion._create_with_tools(
+                messages=messages,
+                tools=tools,
+                provider=provider_name,
+                model=selected_model,
+                **tool_options,
+                **kwargs,
+            )
+
+        # Semantic lookups are scoped to the requested (not routed) provider and model
+        semantic_cache = self.semantic_cache if use_cache and not stream else None
+        if semantic_cache is not None:
+            cached = semantic_cache.get(provider, model, messages, kwargs)
+            if cached is not None:
+                return cached
+
+        provider_name, selected_model = self._select_provider(
+            messages, model, provider, stream, **kwargs
+        )
+
+        send: Callable[[], Any] = functools.partial(
+            self._send_completion, messages, provider_name, selected_model, stream, **kwargs
+        )
+        if hedge_delay is not None:
+            send = functools.partial(
+                self._send_hedged,
+                messages,
+                model,
+                provider,
+                stream,
+                (provider_name, selected_model),
+                hedge_delay,
+                response_cache=self.response_cache if use_cache and not stream else None,
+                **kwargs,
+            )
+
+        if stream:
+            if use_cache and self.response_cache is not None:
+                response = self._stream_with_cache(
+                    send,
+                    self.response_cache,
+                    messages,
+                    provider_name,
+                    selected_model,
+                    kwargs,
+                    record=accumulate and keep_raw,
                 )
             else:
-                provider_name = provider
-                if provider not in self.providers:
-                    raise ProviderError(f"Provider '{provider}' not found")
+                response = send()
+            if not (accumulate and keep_raw):
+                response.passthrough(accumulate=accumulate, keep_raw=keep_raw)
+            return response  # type: ignore[no-any-return]
 
-                provider_instance = self.providers[provider]
-                models = provider_instance.get_available_models()
-                _model: Optional[str] = (
-                    model if model else (list(models.keys())[0] if models else None)
+        key = request_key(provider_name, selected_model, messages, kwargs)
+        stores: List[Callable[[Any], None]] = []
+        if use_cache and self.response_cache is not None:
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                self._release_circuit(provider_name, selected_model)
+                return cached
+            if hedge_delay is None:
+                # Hedged attempts cache their answers under their own keys
+                stores.append(functools.partial(self.response_cache.set, key))
+        if semantic_cache is not None:
+            stores.append(functools.partial(semantic_cache.set, provider, model, messages, kwargs))
+        if stores:
+            send = functools.partial(_send_and_cache, send, stores)
+
+        if self._singleflight is not None:
+            return self._send_shared(  # type: ignore[no-any-return]
+                self._singleflight, key, send, provider_name, selected_model
+            )
+        return send()  # type: ignore[no-any-return]
+
+    def _send_shared(
+        self,
+        singleflight: SingleFlight,
+        key: str,
+        send: Callable[[], Any],
+        provider_name: str,
+        selected_model: str,
+    ) -> Any:
+        """Send through single-flight, giving back the circuit probe if another call is shared.
+
+        Args:
+            singleflight: Group deduplicating identical in-flight requests.
+            key: Request fingerprint.
+            send: Sends the request.
+            provider_name: Routed provider.
+            selected_model: Routed model.
+
+        Returns:
+            Response of this or the shared in-flight request.
+        """
+        sent = False
+
+        def send_once() -> Any:
+            nonlocal sent
+            sent = True
+            return send()
+
+        try:
+            return singleflight.do(key, send_once)
+        finally:
+            if not sent:
+                self._release_circuit(provider_name, selected_model)
+
+    def _stream_with_cache(
+        self,
+        send: Callable[[], Any],
+        response_cache: ResponseCache,
+        messages: List[Message],
+        provider_name: str,
+        selected_model: str,
+        params: Dict[str, Any],
+        record: bool = True,
+    ) -> "SyncStreamResponse":
+        """Replay a cached stream, or start the stream and record it for the cache.
+
+        Args:
+            send: Starts the upstream stream.
+            response_cache: Cache holding recorded streams.
+            messages: List of conversation messages.
+            provider_name: Routed provider.
+            selected_model: Routed model.
+            params: Generation parameters, part of the cache key.
+            record: Whether to record the stream on a cache miss. Pass-through
+                streams (``accumulate=False`` or ``keep_raw=False``) aren't
+                recorded, since holding every chunk would defeat their
+                constant memory use.
+
+        Returns:
+            SyncStreamResponse replaying from cache (``cached=True``) or streaming
+            from the provider.
+        """
+        from justllms.core.streaming import SyncStreamResponse, record_stream, replay_stream
+
+        key = request_key(provider_name, selected_model, messages, {**params, "stream": True})
+        recorded = response_cache.get_stream(key)
+        if recorded is not None:
+            self._release_circuit(provider_name, selected_model)
+            return SyncStreamResponse(
+                self.providers[provider_name],
+                selected_model,
+                messages,
+                replay_stream(recorded, self.config.cache.stream_replay_speed),
+                cached=True,
+            )
+
+        response = send()
+        if record:
+            winner = response.accumulator
+            if (winner.provider.name, winner.model) != (provider_name, selected_model):
+                # A hedged request was answered by another candidate
+                key = request_key(
+                    winner.provider.name, winner.model, messages, {**params, "stream": True}
                 )
+            response.raw_stream = record_stream(
+                response.raw_stream, functools.partial(response_cache.set_stream, key)
+            )
+        return response  # type: ignore[no-any-return]
 
-                if not _model:
-                    raise ValueError(f"No models available for provider {provider}")
+    def _send_hedged(
+        self,
+        messages: List[Message],
+        model: Optional[str],
+        provider: Optional[str],
+        stream: bool,
+        primary: Tuple[str, str],
+        hedge_delay: float,
+        response_cache: Optional[ResponseCache] = None,
+        **kwargs: Any,
+    ) -> "CompletionResponse | SyncStreamResponse":
+        """Send a completion as hedged requests across routing candidates.
+
+        Args:
+            messages: List of conversation messages to process.
+            model: Model as requested by the caller.
+            provider: Provider as requested by the caller.
+            stream: If True, hedges on the first chunk of a streaming response.
+            primary: Routed (provider_name, model_name) tried first.
+            hedge_delay: Seconds to wait before hedging to the next candidate.
+            response_cache: Cache to store each non-streaming answer in, keyed
+                by the candidate that produced it.
+            **kwargs: Additional parameters passed to the provider.
 
-                selected_model = _model
+        Returns:
+            CompletionResponse or SyncStreamResponse from the winning candidate.
+        """
+        from justllms.core.hedging import run_hedged
+        from justllms.core.streaming import SyncStreamResponse
 
-            # Extract tool execution params
-            tool_choice = kwargs.pop("tool_choice", "auto")
-            execute_tools = kwargs.pop(
-                "execute_tools", self.config.routing.execute_tools_by_default
+        candidates = self._hedge_candidates(messages, model, provider, stream, primary)
+        attempts = [
+            functools.partial(
+                self._send_completion, messages, candidate[0], candidate[1], stream, **kwargs
             )
-            max_iterations = kwargs.pop("max_iterations", self.config.routing.max_tool_iterations)
-            timeout = kwargs.pop("timeout", None)
+            for candidate in candidates
+        ]
+        if stream:
+            attempts = [functools.partial(_prime_stream, attempt) for attempt in attempts]
+        elif response_cache is not None:
+            attempts = [
+                functools.partial(
+                    _send_and_cache,
+                    attempt,
+                    [
+                        functools.partial(
+                            response_cache.set, request_key(*candidate, messages, kwargs)
+                        )
+                    ],
+                )
+                for attempt, candidate in zip(attempts, candidates)
+            ]
 
-            # Call tool-enabled completion
-            return self.completion._create_with_tools(
+        def discard(result: Any) -> None:
+            if isinstance(result, SyncStreamResponse):
+                result.close()
+
+        return run_hedged(attempts, hedge_delay, discard)  # type: ignore[no-any-return]
+
+    def _send_completion(
+        self,
+        messages: List[Message],
+        provider_name: str,
+        selected_model: str,
+        stream: bool,
+        **kwargs: Any,
+    ) -> "CompletionResponse | SyncStreamResponse | AsyncStreamResponse":
+        """Send a completion to an already selected provider and model.
+
+        Args:
+            messages: List of conversation messages to process.
+            provider_name: Provider to send the request to.
+            selected_model: Model to use.
+            stream: If True, returns a streaming response.
+            **kwargs: Additional parameters passed to the provider.
+
+        Returns:
+            CompletionResponse or SyncStreamResponse depending on stream parameter.
+        """
+        from justllms.core.streaming import track_stream
+
+        provider_instance = self.providers[provider_name]
+        try:
+            provider_instance.acquire_rate_limit(messages, selected_model, **kwargs)
+        except BaseException:
+            self._release_circuit(provider_name, selected_model)
+            raise
+
+        if stream:
+            # The stream's outcome is only known once it has been consumed
+            tracker = self._track_circuit(provider_name, selected_model)
+            tracker.__enter__()
+            try:
+                stream_response = provider_instance.stream(
+                    messages=messages, model=selected_model, **kwargs
+                )
+            except BaseException:
+                tracker.__exit__(*sys.exc_info())
+                raise
+            stream_response.raw_stream = track_stream(  # type: ignore[union-attr]
+                stream_response.raw_stream, tracker  # type: ignore[union-attr]
+            )
+            return stream_response
+
+        with self._track_circuit(provider_name, selected_model):
+            response = provider_instance.complete(messages=messages, model=selected_model, **kwargs)
+        self._estimate_and_set_cost(response, provider_instance, selected_model)
+        return self._wrap_completion_response(response, provider_name)
+
+    def _hedge_candidates(
+        self,
+        messages: List[Message],
+        model: Optional[str],
+        provider: Optional[str],
+        stream: bool,
+        primary: Tuple[str, str],
+    ) -> List[Tuple[str, str]]:
+        """List the primary plus router candidates that hedged requests may go to.
+
+        Candidates with an open circuit, or that can't stream when streaming,
+        are left out. Custom routers without get_candidates() hedge nothing.
+        """
+        get_candidates = getattr(self.router, "get_candidates", None)
+        if get_candidates is None:
+            return [primary]
+
+        requested = f"{provider}/{primary[1]}" if provider else model
+        try:
+            routed = get_candidates(messages, model=requested, providers=self.providers)
+        except ValueError:
+            return [primary]
+
+        breakers = getattr(self.router, "circuit_breakers", None)
+        candidates = [primary]
+        for provider_name, model_name in routed:
+            if (provider_name, model_name) in candidates:
+                continue
+            if stream and not self.providers[provider_name].supports_streaming_for_model(
+                model_name
+            ):
+                continue
+            if breakers is not None and (
+                breakers.get(provider_name, model_name).state == CircuitState.OPEN
+            ):
+                continue
+            candidates.append((provider_name, model_name))
+        return candidates
+
+    async def _acreate_completion(
+        self,
+        messages: List[Message],
+        model: Optional[str] = None,
+        provider: Optional[str] = None,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> "CompletionResponse | AsyncStreamResponse":
+        """Async version of _create_completion().
+
+        Requests are sent on each provider's pooled async HTTP client, so many
+        completions can be in flight on a single event loop.
+
+        Args:
+            messages: List of conversation messages to process.
+            model: Optional specific model to use. Can be model name or
+                  'provider/model' format.
+            provider: Optional specific provider to use. Overrides fallback selection.
+            stream: If True, returns AsyncStreamResponse instead of CompletionResponse.
+            **kwargs: Additional parameters passed to the provider's acomplete method.
+
+        Returns:
+            CompletionResponse or AsyncStreamResponse depending on stream parameter.
+
+        Raises:
+            ValueError: If model is not specified and no fallback is configured.
+            ProviderError: If the specified provider is not available or if the
+                          completion request fails.
+        """
+        hedge_delay = kwargs.pop("hedge_delay", None)
+        use_cache = kwargs.pop("cache", None) is not False
+        accumulate = kwargs.pop("accumulate", True)
+        keep_raw = kwargs.pop("keep_raw", True)
+        tools = kwargs.pop("tools", None)
+        if tools and not stream:
+            provider_name, selected_model = self._select_tool_provider(
+                messages, model, provider, **kwargs
+            )
+            tool_options = self._pop_tool_options(kwargs)
+
+            return await self.completion._acreate_with_tools(
                 messages=messages,
                 tools=tools,
                 provider=provider_name,
                 model=selected_model,
-                tool_choice=tool_choice,
-                execute_tools=execute_tools,
-                max_iterations=max_iterations,
-                timeout=timeout,
+                **tool_options,
                 **kwargs,
             )
 
-        if provider:
-            if provider not in self.providers:
-                raise ProviderError(f"Provider '{provider}' not found")
+        semantic_cache = self.semantic_cache if use_cache and not stream else None
+        if semantic_cache is not None:
+            # Embedding may be slow (a local model or a remote call)
+            cached = await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(semantic_cache.get, provider, model, messages, kwargs)
+            )
+            if cached is not None:
+                return cached
 
-            provider_instance = self.providers[provider]
+        provider_name, selected_model = self._select_provider(
+            messages, model, provider, stream, **kwargs
+        )
 
-            # Determine model to use
-            if model:
-                selected_model = model
-            else:
-                # Try to get default model from provider
-                models = provider_instance.get_available_models()
-                if models:
-                    selected_model = list(models.keys())[0]
-                else:
-                    raise ValueError(f"No models available for provider {provider}")
+        send: Callable[[], Awaitable[Any]] = functools.partial(
+            self._asend_completion, messages, provider_name, selected_model, stream, **kwargs
+        )
+        if hedge_delay is not None:
+            send = functools.partial(
+                self._asend_hedged,
+                messages,
+                model,
+                provider,
+                stream,
+                (provider_name, selected_model),
+                hedge_delay,
+                response_cache=self.response_cache if use_cache and not stream else None,
+                **kwargs,
+            )
 
-            if stream:
-                if not provider_instance.supports_streaming_for_model(selected_model):
-                    streaming_providers = [
-                        name for name, prov in self.providers.items() if prov.supports_streaming()
-                    ]
-                    streaming_hint = (
-                        f" Try using one of these providers: {', '.join(streaming_providers)}"
-                        if streaming_providers
-                        else ""
-                    )
-                    raise ProviderError(
-                        f"Provider '{provider}' does not support streaming for model '{selected_model}'. "
-                        f"Use stream=False or switch to a streaming-capable provider.{streaming_hint}"
-                    )
-
-                # Stream with specified provider
-                return provider_instance.stream(messages=messages, model=selected_model, **kwargs)
+        if stream:
+            if use_cache and self.response_cache is not None:
+                response = await self._astream_with_cache(
+                    send,
+                    self.response_cache,
+                    messages,
+                    provider_name,
+                    selected_model,
+                    kwargs,
+                    record=accumulate and keep_raw,
+                )
             else:
-                # Non-streaming with specified provider
-                response = provider_instance.complete(
-                    messages=messages, model=selected_model, **kwargs
+                response = await send()
+            if not (accumulate and keep_raw):
+                response.passthrough(accumulate=accumulate, keep_raw=keep_raw)
+            return response  # type: ignore[no-any-return]
+
+        key = request_key(provider_name, selected_model, messages, kwargs)
+        stores: List[Callable[[Any], None]] = []
+        if use_cache and self.response_cache is not None:
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                self._release_circuit(provider_name, selected_model)
+                return cached
+            if hedge_delay is None:
+                # Hedged attempts cache their answers under their own keys
+                stores.append(functools.partial(self.response_cache.set, key))
+        if semantic_cache is not None:
+            stores.append(functools.partial(semantic_cache.set, provider, model, messages, kwargs))
+        if stores:
+            send = functools.partial(_asend_and_cache, send, stores)
+
+        if self._singleflight is not None:
+            return await self._asend_shared(  # type: ignore[no-any-return]
+                self._singleflight, key, send, provider_name, selected_model
+            )
+        return await send()  # type: ignore[no-any-return]
+
+    async def _asend_shared(
+        self,
+        singleflight: SingleFlight,
+        key: str,
+        send: Callable[[], Awaitable[Any]],
+        provider_name: str,
+        selected_model: str,
+    ) -> Any:
+        """Async version of _send_shared()."""
+        sent = False
+
+        async def send_once() -> Any:
+            nonlocal sent
+            sent = True
+            return await send()
+
+        try:
+            return await singleflight.ado(key, send_once)
+        finally:
+            if not sent:
+                self._release_circuit(provider_name, selected_model)
+
+    async def _astream_with_cache(
+        self,
+        send: Callable[[], Awaitable[Any]],
+        response_cache: ResponseCache,
+        messages: List[Message],
+        provider_name: str,
+        selected_model: str,
+        params: Dict[str, Any],
+        record: bool = True,
+    ) -> "AsyncStreamResponse":
+        """Async version of _stream_with_cache()."""
+        from justllms.core.streaming import AsyncStreamResponse, arecord_stream, areplay_stream
+
+        key = request_key(provider_name, selected_model, messages, {**params, "stream": True})
+        recorded = response_cache.get_stream(key)
+        if recorded is not None:
+            self._release_circuit(provider_name, selected_model)
+            return AsyncStreamResponse(
+                self.providers[provider_name],
+                selected_model,
+                messages,
+                areplay_stream(recorded, self.config.cache.stream_replay_speed),
+                cached=True,
+            )
+
+        response = await send()
+        if record:
+            winner = response.accumulator
+            if (winner.provider.name, winner.model) != (provider_name, selected_model):
+                # A hedged request was answered by another candidate
+                key = request_key(
+                    winner.provider.name, winner.model, messages, {**params, "stream": True}
                 )
-                self._estimate_and_set_cost(response, provider_instance, selected_model)
-                return self._wrap_completion_response(response, provider)
+            response.async_stream = arecord_stream(
+                response.async_stream, functools.partial(response_cache.set_stream, key)
+            )
+        return response  # type: ignore[no-any-return]
 
-        if stream:
-            provider_name, selected_model = self.router.route_streaming(
-                messages=messages, providers=self.providers, model=model, **kwargs
+    async def _asend_hedged(
+        self,
+        messages: List[Message],
+        model: Optional[str],
+        provider: Optional[str],
+        stream: bool,
+        primary: Tuple[str, str],
+        hedge_delay: float,
+        response_cache: Optional[ResponseCache] = None,
+        **kwargs: Any,
+    ) -> "CompletionResponse | AsyncStreamResponse":
+        """Async version of _send_hedged(); losing requests are cancelled."""
+        from justllms.core.hedging import arun_hedged
+        from justllms.core.streaming import AsyncStreamResponse
+
+        candidates = self._hedge_candidates(messages, model, provider, stream, primary)
+        attempts = [
+            functools.partial(
+                self._asend_completion, messages, candidate[0], candidate[1], stream, **kwargs
             )
+            for candidate in candidates
+        ]
+        if stream:
+            attempts = [functools.partial(_aprime_stream, attempt) for attempt in attempts]
+        elif response_cache is not None:
+            attempts = [
+                functools.partial(
+                    _asend_and_cache,
+                    attempt,
+                    [
+                        functools.partial(
+                            response_cache.set, request_key(*candidate, messages, kwargs)
+                        )
+                    ],
+                )
+                for attempt, candidate in zip(attempts, candidates)
+            ]
 
-            # Stream with routed provider
-            provider_instance = self.providers[provider_name]
-            return provider_instance.stream(messages=messages, model=selected_model, **kwargs)
-        else:
-            # Non-streaming route
-            provider_name, selected_model = self.router.route(
-                messages=messages, model=model, providers=self.providers, **kwargs
+        async def discard(result: Any) -> None:
+            if isinstance(result, AsyncStreamResponse):
+                await result.aclose()
+
+        return await arun_hedged(attempts, hedge_delay, discard)
+
+    async def _asend_completion(
+        self,
+        messages: List[Message],
+        provider_name: str,
+        selected_model: str,
+        stream: bool,
+        **kwargs: Any,
+    ) -> "CompletionResponse | AsyncStreamResponse":
+        """Async version of _send_completion()."""
+        from justllms.core.streaming import atrack_stream
+
+        provider_instance = self.providers[provider_name]
+        try:
+            await provider_instance.aacquire_rate_limit(messages, selected_model, **kwargs)
+        except BaseException:
+            self._release_circuit(provider_name, selected_model)
+            raise
+
+        if stream:
+            tracker = self._track_circuit(provider_name, selected_model)
+            tracker.__enter__()
+            try:
+                stream_response = await provider_instance.astream(
+                    messages=messages, model=selected_model, **kwargs
+                )
+            except BaseException:
+                tracker.__exit__(*sys.exc_info())
+                raise
+            stream_response.async_stream = atrack_stream(stream_response.async_stream, tracker)
+            return stream_response
+
+        with self._track_circuit(provider_name, selected_model):
+            response = await provider_instance.acomplete(
+                messages=messages, model=selected_model, **kwargs
             )
+        self._estimate_and_set_cost(response, provider_instance, selected_model)
+        return self._wrap_completion_response(response, provider_name)
 
-            provider_instance = self.providers[provider_name]
-            response = provider_instance.complete(messages=messages, model=selected_model, **kwargs)
-            self._estimate_and_set_cost(response, provider_instance, selected_model)
-            return self._wrap_completion_response(response, provider_name)
+
+def _prime_stream(start: Callable[[], Any]) -> Any:
+    """Start a stream and wait for its first chunk (the hedging "response" for streams)."""
+    stream = start()
+    stream.prime()
+    return stream
+
+
+async def _aprime_stream(start: Callable[[], Awaitable[Any]]) -> Any:
+    """Async version of _prime_stream()."""
+    stream = await start()
+    await stream.aprime()
+    return stream
+
+
+def _send_and_cache(send: Callable[[], Any], stores: List[Callable[[Any], None]]) -> Any:
+    """Send a completion and hand the response to each cache's store function."""
+    response = send()
+    for store in stores:
+        store(response)
+    return response
+
+
+async def _asend_and_cache(
+    send: Callable[[], Awaitable[Any]], stores: List[Callable[[Any], None]]
+) -> Any:
+    """Async version of _send_and_cache(); stores run in the default executor."""
+    response = await send()
+    loop = asyncio.get_running_loop()
+    for store in stores:
+        await loop.run_in_executor(None, store, response)
+    return response
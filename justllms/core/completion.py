@@ -1,6 +1,21 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, overload
+import functools
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+    overload,
+)
 
 from justllms.core.base import BaseResponse
+from justllms.core.batch import BatchResult, arun_batch, run_batch
 from justllms.core.models import Choice, Message, Usage
 from justllms.utils.validators import validate_messages
 
@@ -36,6 +51,29 @@ class CompletionResponse(BaseResponse):
         self.tool_execution_history: Optional[List[Any]] = None
         self.tools_used: Optional[List[str]] = None
         self.tool_execution_cost: Optional[float] = None
+        self.cached = False
+
+    @classmethod
+    def from_response(cls, response: BaseResponse, provider: Optional[str]) -> "CompletionResponse":
+        """Wrap a provider response, sharing its decoded JSON and unparsed fields.
+
+        Args:
+            response: Provider response to wrap.
+            provider: Provider name to include in the response.
+
+        Returns:
+            CompletionResponse: Response reading from the same data as ``response``.
+        """
+        wrapped = cls(
+            id=response.id,
+            model=response.model,
+            choices=[],
+            created=response.created,
+            system_fingerprint=response.system_fingerprint,
+            provider=provider,
+        )
+        wrapped._share_data(response)
+        return wrapped
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert response to dictionary."""
@@ -66,6 +104,7 @@ class CompletionResponse(BaseResponse):
             "created": self.created,
             "system_fingerprint": self.system_fingerprint,
             "provider": self.provider,
+            "cached": self.cached,
         }
 
     @property
@@ -106,6 +145,8 @@ class Completion:
         seed: Optional[int] = None,
         user: Optional[str] = None,
         timeout: Optional[float] = None,
+        hedge_delay: Optional[float] = None,
+        cache: Optional[bool] = None,
         **kwargs: Any,
     ) -> CompletionResponse: ...
 
@@ -132,6 +173,10 @@ class Completion:
         seed: Optional[int] = None,
         user: Optional[str] = None,
         timeout: Optional[float] = None,
+        hedge_delay: Optional[float] = None,
+        cache: Optional[bool] = None,
+        accumulate: bool = True,
+        keep_raw: bool = True,
         **kwargs: Any,
     ) -> "Union[SyncStreamResponse, AsyncStreamResponse]": ...
 
@@ -157,6 +202,10 @@ class Completion:
         seed: Optional[int] = None,
         user: Optional[str] = None,
         timeout: Optional[float] = None,
+        hedge_delay: Optional[float] = None,
+        cache: Optional[bool] = None,
+        accumulate: bool = True,
+        keep_raw: bool = True,
         **kwargs: Any,
     ) -> "Union[CompletionResponse, SyncStreamResponse, AsyncStreamResponse]":
         """Create a completion with automatic fallbacks.
@@ -192,6 +241,26 @@ class Completion:
                 user: End-user identifier.
                 timeout: Request timeout in seconds. If None, no timeout is enforced.
 
+            Reliability:
+                hedge_delay: Enable hedged requests. If no response (or, for streams,
+                    no first chunk) arrives within this many seconds, the same request
+                    is also sent to the next routing candidate; the first success wins
+                    and the rest are cancelled. 0 races all candidates at once.
+                    Ignored for tool calls.
+
+            Caching:
+                cache: Set to False to bypass the response cache for this request
+                    (neither read nor written). None follows the ``cache`` config.
+                    Completed streams are cached too and replayed as a stream.
+                    Ignored for tool calls.
+
+            Streaming:
+                accumulate: Set to False to not keep the streamed text for
+                    get_final_response(), whose content is then empty but which
+                    still reports usage and cost. Memory per stream stays constant.
+                keep_raw: Set to False to drop each chunk's decoded provider data
+                    (``chunk.raw``) once it has been parsed.
+
         Returns:
             CompletionResponse: The model's response.
 
@@ -218,72 +287,309 @@ class Completion:
                 }
             )
         """
-        # Validate messages
-        formatted_messages = validate_messages(messages)
-
-        params = {
-            "messages": formatted_messages,
-            "model": model,
-            "provider": provider,
-            "stream": stream,
-            "temperature": temperature,
-            "top_p": top_p,
-            "top_k": top_k,
-            "max_tokens": max_tokens,
-            "stop": stop,
-            "n": n,
-            "presence_penalty": presence_penalty,
-            "frequency_penalty": frequency_penalty,
-            "generation_config": generation_config,
-            "tools": tools,
-            "tool_choice": tool_choice,
-            "response_format": response_format,
-            "seed": seed,
-            "user": user,
-            "timeout": timeout,
+        params = self._prepare_params(
+            messages,
+            model=model,
+            provider=provider,
+            stream=stream,
+            temperature=temperature,
+            top_p=top_p,
+            top_k=top_k,
+            max_tokens=max_tokens,
+            stop=stop,
+            n=n,
+            presence_penalty=presence_penalty,
+            frequency_penalty=frequency_penalty,
+            generation_config=generation_config,
+            tools=tools,
+            tool_choice=tool_choice,
+            response_format=response_format,
+            seed=seed,
+            user=user,
+            timeout=timeout,
+            hedge_delay=hedge_delay,
+            cache=cache,
+            accumulate=accumulate,
+            keep_raw=keep_raw,
             **kwargs,
-        }
+        )
 
-        # Filter out None values, but keep model=None for fallback selection and stream=False
-        params = {k: v for k, v in params.items() if v is not None or k in ("model", "stream")}
+        return self.client._create_completion(**params)  # type: ignore[no-any-return]
+
+    @overload
+    async def acreate(
+        self,
+        messages: Union[List[Dict[str, Any]], List[Message]],
+        *,
+        stream: Literal[False] = False,
+        model: Optional[str] = None,
+        provider: Optional[str] = None,
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+        top_k: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        stop: Optional[Union[str, List[str]]] = None,
+        n: Optional[int] = None,
+        presence_penalty: Optional[float] = None,
+        frequency_penalty: Optional[float] = None,
+        generation_config: Optional[Dict[str, Any]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        seed: Optional[int] = None,
+        user: Optional[str] = None,
+        timeout: Optional[float] = None,
+        hedge_delay: Optional[float] = None,
+        cache: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> CompletionResponse: ...
 
-        return self.client._create_completion(**params)
+    @overload
+    async def acreate(
+        self,
+        messages: Union[List[Dict[str, Any]], List[Message]],
+        *,
+        stream: Literal[True],
+        model: Optional[str] = None,
+        provider: Optional[str] = None,
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+        top_k: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        stop: Optional[Union[str, List[str]]] = None,
+        n: Optional[int] = None,
+        presence_penalty: Optional[float] = None,
+        frequency_penalty: Optional[float] = None,
+        generation_config: Optional[Dict[str, Any]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        seed: Optional[int] = None,
+        user: Optional[str] = None,
+        timeout: Optional[float] = None,
+        hedge_delay: Optional[float] = None,
+        cache: Optional[bool] = None,
+        accumulate: bool = True,
+        keep_raw: bool = True,
+        **kwargs: Any,
+    ) -> "AsyncStreamResponse": ...
 
-    def _create_with_tools(
+    async def acreate(
         self,
-        messages: List[Message],
-        tools: List[Any],  # Can be Tool objects or dicts
-        provider: str,
-        model: str,
-        tool_choice: Optional[Union[str, Dict[str, Any]]] = "auto",
-        execute_tools: bool = True,
-        max_iterations: int = 10,
+        messages: Union[List[Dict[str, Any]], List[Message]],
+        *,
+        model: Optional[str] = None,
+        provider: Optional[str] = None,
+        stream: bool = False,
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+        top_k: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        stop: Optional[Union[str, List[str]]] = None,
+        n: Optional[int] = None,
+        presence_penalty: Optional[float] = None,
+        frequency_penalty: Optional[float] = None,
+        generation_config: Optional[Dict[str, Any]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        seed: Optional[int] = None,
+        user: Optional[str] = None,
         timeout: Optional[float] = None,
+        hedge_delay: Optional[float] = None,
+        cache: Optional[bool] = None,
+        accumulate: bool = True,
+        keep_raw: bool = True,
         **kwargs: Any,
+    ) -> "Union[CompletionResponse, AsyncStreamResponse]":
+        """Async version of create() - accepts the same parameters.
+
+        Requests run on the providers' pooled async HTTP clients instead of a
+        thread pool, so a single event loop can keep many calls in flight.
+
+        Returns:
+            CompletionResponse, or AsyncStreamResponse when stream=True.
+
+        Examples:
+            response = await client.completion.acreate(
+                messages=[{"role": "user", "content": "Hello"}],
+                provider="openai",
+            )
+        """
+        params = self._prepare_params(
+            messages,
+            model=model,
+            provider=provider,
+            stream=stream,
+            temperature=temperature,
+            top_p=top_p,
+            top_k=top_k,
+            max_tokens=max_tokens,
+            stop=stop,
+            n=n,
+            presence_penalty=presence_penalty,
+            frequency_penalty=frequency_penalty,
+            generation_config=generation_config,
+            tools=tools,
+            tool_choice=tool_choice,
+            response_format=response_format,
+            seed=seed,
+            user=user,
+            timeout=timeout,
+            hedge_delay=hedge_delay,
+            cache=cache,
+            accumulate=accumulate,
+            keep_raw=keep_raw,
+            **kwargs,
+        )
+
+        return await self.client._acreate_completion(**params)
+
+    def batch(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        *,
+        concurrency: int = 10,
+        on_result: Optional[Callable[[BatchResult], Any]] = None,
+        **defaults: Any,
+    ) -> List[BatchResult]:
+        """Run many completions on a thread pool with bounded concurrency.
+
+        Each request goes through create(), so provider rate limits, adaptive
+        concurrency, retries, circuit breakers and caching all apply per call.
+        A failing request doesn't fail the batch; its error is captured in its
+        result.
+
+        Args:
+            requests: create() keyword arguments, one dict per request.
+            concurrency: Maximum number of requests in flight.
+            on_result: Optional callback invoked as each request completes
+                (e.g. to report progress).
+            **defaults: Parameters applied to every request unless it sets them.
+
+        Returns:
+            List[BatchResult]: One result per request, in input order.
+
+        Examples:
+            results = client.completion.batch(
+                [{"messages": [{"role": "user", "content": q}]} for q in questions],
+                concurrency=16,
+                model="gpt-4o-mini",
+                temperature=0,
+            )
+            answers = [r.response.content if r.ok else None for r in results]
+        """
+        return sorted(
+            self.iter_batch(requests, concurrency=concurrency, on_result=on_result, **defaults),
+            key=lambda result: result.index,
+        )
+
+    def iter_batch(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        *,
+        concurrency: int = 10,
+        on_result: Optional[Callable[[BatchResult], Any]] = None,
+        **defaults: Any,
+    ) -> Iterator[BatchResult]:
+        """Like batch(), but yield results as they complete.
+
+        ``requests`` is consumed lazily, so it can be a generator over a large
+        dataset. Use ``result.index`` to match results to requests.
+        """
+        return run_batch(
+            functools.partial(self._create_batch_item, defaults),
+            requests,
+            concurrency=concurrency,
+            on_result=on_result,
+        )
+
+    async def abatch(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        *,
+        concurrency: int = 10,
+        on_result: Optional[Callable[[BatchResult], Any]] = None,
+        **defaults: Any,
+    ) -> List[BatchResult]:
+        """Async version of batch() that runs requests as tasks via acreate()."""
+        results = [
+            result
+            async for result in self.aiter_batch(
+                requests, concurrency=concurrency, on_result=on_result, **defaults
+            )
+        ]
+        return sorted(results, key=lambda result: result.index)
+
+    def aiter_batch(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        *,
+        concurrency: int = 10,
+        on_result: Optional[Callable[[BatchResult], Any]] = None,
+        **defaults: Any,
+    ) -> AsyncIterator[BatchResult]:
+        """Async version of iter_batch()."""
+        return arun_batch(
+            functools.partial(self._acreate_batch_item, defaults),
+            requests,
+            concurrency=concurrency,
+            on_result=on_result,
+        )
+
+    def _create_batch_item(
+        self, defaults: Dict[str, Any], request: Dict[str, Any]
     ) -> CompletionResponse:
-        """Create completion with tool execution loop.
+        params = {**defaults, **request}
+        if params.get("stream"):
+            raise ValueError("Streaming requests are not supported in batches")
+        return self.create(**params)  # type: ignore[no-any-return]
 
-        This method handles the full tool calling cycle:
-        1. Format tools for the provider
-        2. Call LLM with tools
-        3. Extract tool calls from response
-        4. Execute tools (if execute_tools=True)
-        5. Add results to messages
-        6. Repeat until no more tool calls or max_iterations reached
+    async def _acreate_batch_item(
+        self, defaults: Dict[str, Any], request: Dict[str, Any]
+    ) -> CompletionResponse:
+        params = {**defaults, **request}
+        if params.get("stream"):
+            raise ValueError("Streaming requests are not supported in batches")
+        return await self.acreate(**params)  # type: ignore[no-any-return]
+
+    def _prepare_params(
+        self, messages: Union[List[Dict[str, Any]], List[Message]], **params: Any
+    ) -> Dict[str, Any]:
+        """Validate messages and drop unset parameters.
 
         Args:
-            messages: Conversation messages.
-            tools: List of Tool objects or tool definitions.
+            messages: List of messages in the conversation.
+            **params: Request parameters as passed to create().
+
+        Returns:
+            Dict[str, Any]: Keyword arguments for Client._create_completion().
+        """
+        # Validate messages
+        formatted_messages = validate_messages(messages)
+
+        # Filter out None values, but keep model=None for fallback selection and stream=False
+        return {
+            "messages": formatted_messages,
+            **{k: v for k, v in params.items() if v is not None or k in ("model", "stream")},
+        }
+
+    def _prepare_tools(
+        self,
+        tools: List[Any],
+        provider: str,
+        tool_choice: Optional[Union[str, Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Resolve the provider adapter and format tools for a tool loop.
+
+        Args:
+            tools: List of Tool objects, decorated functions or native tools.
             provider: Provider name to use.
-            model: Model name to use.
             tool_choice: Tool selection strategy.
-            execute_tools: Whether to automatically execute tools.
-            max_iterations: Maximum number of execution rounds.
-            timeout: Optional timeout for LLM requests.
-            **kwargs: Additional provider-specific parameters.
 
         Returns:
-            CompletionResponse with tool execution history.
+            Dict with provider_instance, adapter, formatted_tools,
+            formatted_tool_choice and executor.
         """
         from justllms.tools.executor import ToolExecutor
         from justllms.tools.models import Tool
@@ -346,141 +652,313 @@ class Completion:
                     "This request may fail. Use either native tools OR user functions, not both. "
                     "See: https://ai.google.dev/gemini-api/docs/live-tools",
                     UserWarning,
-                    stacklevel=2,
+                    stacklevel=3,
                 )
 
             formatted_tools = adapter.format_tools_with_native(tool_objects, native_tool_objects)
         else:
             formatted_tools = adapter.format_tools_for_api(tool_objects)
 
-        formatted_tool_choice = adapter.format_tool_choice(tool_choice)
-
         # Initialize executor
-        executor = ToolExecutor(
-            tools=tool_objects,
-            timeout=(
-                self.client.config.routing.tool_timeout
-                if hasattr(self.client, "config") and hasattr(self.client.config, "routing")
-                else 30.0
-            ),
-        )
+        routing = getattr(getattr(self.client, "config", None), "routing", None)
+        if routing is not None:
+            executor = ToolExecutor(
+                tools=tool_objects,
+                execute_in_parallel=routing.parallel_tool_execution,
+                timeout=routing.tool_timeout,
+                max_workers=routing.max_tool_workers,
+            )
+        else:
+            executor = ToolExecutor(tools=tool_objects, timeout=30.0)
+
+        return {
+            "provider_instance": provider_instance,
+            "adapter": adapter,
+            "formatted_tools": formatted_tools,
+            "formatted_tool_choice": adapter.format_tool_choice(tool_choice),
+            "executor": executor,
+        }
+
+    def _response_to_adapter_dict(self, response: BaseResponse) -> Dict[str, Any]:
+        """Return the full response dict that tool adapters parse.
+
+        This is the provider's decoded JSON when the response kept it; otherwise
+        it is rebuilt from raw_response and the parsed choices.
+        """
+        if response.data is not None:
+            return response.data
+
+        full_response_dict = dict(response.raw_response)
+
+        # Add choices back into the dict for adapters that need them
+        if response.choices:
+            full_response_dict["choices"] = [
+                {
+                    "index": choice.index,
+                    "message": {
+                        "role": choice.message.role.value,
+                        "content": choice.message.content,
+                        "tool_calls": choice.message.tool_calls,
+                    },
+                    "finish_reason": choice.finish_reason,
+                }
+                for choice in response.choices
+            ]
+
+        return full_response_dict
+
+    def _finalize_tool_response(
+        self,
+        response: Optional[BaseResponse],
+        provider: str,
+        model: str,
+        executor: Any,
+        execution_history: List[Any],
+        include_tools_used: bool = True,
+    ) -> CompletionResponse:
+        """Build the CompletionResponse returned from a tool loop.
+
+        Args:
+            response: Last provider response, or None if no call was made.
+            provider: Provider name used.
+            model: Model name used (when no response is available).
+            executor: ToolExecutor used for the loop.
+            execution_history: Tool execution entries collected so far.
+            include_tools_used: Whether to populate tools_used.
+
+        Returns:
+            CompletionResponse with tool execution history.
+        """
+        if response is None:
+            final_response = CompletionResponse(
+                id="unknown", model=model, choices=[], usage=None, provider=provider
+            )
+        else:
+            final_response = CompletionResponse.from_response(response, provider)
+        final_response.tool_execution_history = execution_history
+        if include_tools_used:
+            final_response.tools_used = (
+                list(set(entry.tool_call.name for entry in execution_history))
+                if execution_history
+                else []
+            )
+        final_response.tool_execution_cost = executor.calculate_total_cost(execution_history)
+        return final_response
+
+    def _record_tool_results(
+        self,
+        iteration: int,
+        tool_calls: List[Any],
+        tool_results: List[Any],
+        adapter: Any,
+        executor: Any,
+        conversation_messages: List[Message],
+        execution_history: List[Any],
+    ) -> None:
+        """Append a turn's tool results to the conversation and the execution history."""
+        # Format results as the message(s) the provider expects
+        conversation_messages.extend(adapter.format_tool_result_messages(tool_results, tool_calls))
+
+        # Track in history
+        for tool_call, tool_result in zip(tool_calls, tool_results):
+            entry = executor.create_execution_entry(
+                iteration=iteration,
+                tool_call=tool_call,
+                tool_result=tool_result,
+                messages=[],  # Can add generated messages here if needed
+            )
+            execution_history.append(entry)
+
+    def _create_with_tools(
+        self,
+        messages: List[Message],
+        tools: List[Any],  # Can be Tool objects or dicts
+        provider: str,
+        model: str,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = "auto",
+        execute_tools: bool = True,
+        max_iterations: int = 10,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> CompletionResponse:
+        """Create completion with tool execution loop.
+
+        This method handles the full tool calling cycle:
+        1. Format tools for the provider
+        2. Call LLM with tools
+        3. Extract tool calls from response
+        4. Execute tools (if execute_tools=True)
+        5. Add results to messages
+        6. Repeat until no more tool calls or max_iterations reached
+
+        Args:
+            messages: Conversation messages.
+            tools: List of Tool objects or tool definitions.
+            provider: Provider name to use.
+            model: Model name to use.
+            tool_choice: Tool selection strategy.
+            execute_tools: Whether to automatically execute tools.
+            max_iterations: Maximum number of execution rounds.
+            timeout: Optional timeout for LLM requests.
+            **kwargs: Additional provider-specific parameters.
+
+        Returns:
+            CompletionResponse with tool execution history.
+        """
+        prepared = self._prepare_tools(tools, provider, tool_choice)
+        provider_instance = prepared["provider_instance"]
+        adapter = prepared["adapter"]
+        executor = prepared["executor"]
 
         # Track execution history
         execution_history: List[Any] = []
         conversation_messages = list(messages)  # Copy to avoid mutation
+        response: Optional[BaseResponse] = None
 
         # Execution loop
         for iteration in range(max_iterations):
             # Call LLM with tools
-            response = provider_instance.complete_with_tools(
-                messages=conversation_messages,
-                tools=formatted_tools,
-                model=model,
-                tool_choice=formatted_tool_choice,
-                timeout=timeout,
-                **kwargs,
-            )
+            provider_instance.acquire_rate_limit(conversation_messages, model, **kwargs)
+            with self.client._track_circuit(provider, model):
+                response = provider_instance.complete_with_tools(
+                    messages=conversation_messages,
+                    tools=prepared["formatted_tools"],
+                    model=model,
+                    tool_choice=prepared["formatted_tool_choice"],
+                    timeout=timeout,
+                    **kwargs,
+                )
 
-            # Extract tool calls - reconstruct full response dict for adapter
-            # Adapters need choices, which are extracted into response.choices
-            full_response_dict = {}
-            if hasattr(response, "raw_response"):
-                full_response_dict = dict(response.raw_response)
-
-            # Add choices back into the dict for adapters that need them
-            if response.choices:
-                full_response_dict["choices"] = [
-                    {
-                        "index": choice.index,
-                        "message": {
-                            "role": choice.message.role.value,
-                            "content": choice.message.content,
-                            "tool_calls": choice.message.tool_calls,
-                        },
-                        "finish_reason": choice.finish_reason,
-                    }
-                    for choice in response.choices
-                ]
-
-            tool_calls = adapter.extract_tool_calls(full_response_dict)
+            tool_calls = adapter.extract_tool_calls(self._response_to_adapter_dict(response))
 
             # If no tool calls, we're done
             if not tool_calls:
-                # Create final response with history
-                final_response = CompletionResponse(
-                    id=response.id,
-                    model=response.model,
-                    choices=response.choices,
-                    usage=response.usage,
-                    created=response.created,
-                    system_fingerprint=response.system_fingerprint,
-                    provider=provider,
-                )
-                final_response.tool_execution_history = execution_history
-                final_response.tools_used = (
-                    list(set(entry.tool_call.name for entry in execution_history))
-                    if execution_history
-                    else []
-                )
-                final_response.tool_execution_cost = executor.calculate_total_cost(
-                    execution_history
+                return self._finalize_tool_response(
+                    response, provider, model, executor, execution_history
                 )
-                return final_response
 
             # Execute tools if requested
             if not execute_tools:
                 # Return response with tool calls but no execution
-                final_response = CompletionResponse(
-                    id=response.id,
-                    model=response.model,
-                    choices=response.choices,
-                    usage=response.usage,
-                    created=response.created,
-                    system_fingerprint=response.system_fingerprint,
-                    provider=provider,
+                return self._finalize_tool_response(
+                    response,
+                    provider,
+                    model,
+                    executor,
+                    execution_history,
+                    include_tools_used=False,
                 )
-                final_response.tool_execution_history = execution_history
-                final_response.tool_execution_cost = executor.calculate_total_cost(
-                    execution_history
-                )
-                return final_response
 
             # Add assistant message with tool calls
             assistant_msg = adapter.format_tool_calls_message(tool_calls)
             if assistant_msg:
                 conversation_messages.append(assistant_msg)
 
-            # Execute each tool call
-            for tool_call in tool_calls:
-                # Execute tool
-                tool_result = executor.execute_tool_call(tool_call)
-
-                # Format result as message
-                result_msg = adapter.format_tool_result_message(tool_result, tool_call)
-                conversation_messages.append(result_msg)
-
-                # Track in history
-                entry = executor.create_execution_entry(
-                    iteration=iteration,
-                    tool_call=tool_call,
-                    tool_result=tool_result,
-                    messages=[],  # Can add generated messages here if needed
-                )
-                execution_history.append(entry)
+            # Execute the turn's tool calls (concurrently if enabled)
+            tool_results = executor.execute_all(tool_calls)
+            self._record_tool_results(
+                iteration,
+                tool_calls,
+                tool_results,
+                adapter,
+                executor,
+                conversation_messages,
+                execution_history,
+            )
 
         # If we hit max iterations, return last response
-        final_response = CompletionResponse(
-            id=response.id if "response" in locals() else "unknown",
-            model=model,
-            choices=response.choices if "response" in locals() else [],
-            usage=response.usage if "response" in locals() else None,
-            provider=provider,
+        final_response = self._finalize_tool_response(
+            response, provider, model, executor, execution_history
         )
-        final_response.tool_execution_history = execution_history
-        final_response.tools_used = (
-            list(set(entry.tool_call.name for entry in execution_history))
-            if execution_history
-            else []
+        final_response.model = model
+        return final_response
+
+    async def _acreate_with_tools(
+        self,
+        messages: List[Message],
+        tools: List[Any],
+        provider: str,
+        model: str,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = "auto",
+        execute_tools: bool = True,
+        max_iterations: int = 10,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> CompletionResponse:
+        """Async version of _create_with_tools().
+
+        LLM calls go through the provider's async API. Async tools are awaited
+        on the running event loop; synchronous ones run in its default executor.
+
+        Args:
+            messages: Conversation messages.
+            tools: List of Tool objects or tool definitions.
+            provider: Provider name to use.
+            model: Model name to use.
+            tool_choice: Tool selection strategy.
+            execute_tools: Whether to automatically execute tools.
+            max_iterations: Maximum number of execution rounds.
+            timeout: Optional timeout for LLM requests.
+            **kwargs: Additional provider-specific parameters.
+
+        Returns:
+            CompletionResponse with tool execution history.
+        """
+        prepared = self._prepare_tools(tools, provider, tool_choice)
+        provider_instance = prepared["provider_instance"]
+        adapter = prepared["adapter"]
+        executor = prepared["executor"]
+
+        execution_history: List[Any] = []
+        conversation_messages = list(messages)
+        response: Optional[BaseResponse] = None
+
+        for iteration in range(max_iterations):
+            await provider_instance.aacquire_rate_limit(conversation_messages, model, **kwargs)
+            with self.client._track_circuit(provider, model):
+                response = await provider_instance.acomplete_with_tools(
+                    messages=conversation_messages,
+                    tools=prepared["formatted_tools"],
+                    model=model,
+                    tool_choice=prepared["formatted_tool_choice"],
+                    timeout=timeout,
+                    **kwargs,
+                )
+
+            tool_calls = adapter.extract_tool_calls(self._response_to_adapter_dict(response))
+
+            if not tool_calls:
+                return self._finalize_tool_response(
+                    response, provider, model, executor, execution_history
+                )
+
+            if not execute_tools:
+                return self._finalize_tool_response(
+                    response,
+                    provider,
+                    model,
+                    executor,
+                    execution_history,
+                    include_tools_used=False,
+                )
+
+            assistant_msg = adapter.format_tool_calls_message(tool_calls)
+            if assistant_msg:
+                conversation_messages.append(assistant_msg)
+
+            tool_results = await executor.aexecute_all(tool_calls)
+            self._record_tool_results(
+                iteration,
+                tool_calls,
+                tool_results,
+                adapter,
+                executor,
+                conversation_messages,
+                execution_history,
+            )
+
+        final_response = self._finalize_tool_response(
+            response, provider, model, executor, execution_history
         )
-        final_response.tool_execution_cost = executor.calculate_total_cost(execution_history)
+        final_response.model = model
         return final_response
@@ -0,0 +1,218 @@
+import asyncio
+import contextlib
+import threading
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, List, Mapping, Optional, Tuple
+
+import httpx
+
+if TYPE_CHECKING:
+    from justllms.core.models import ProviderConfig
+
+# (remaining, limit) header pairs reported by providers on every response
+_RATE_LIMIT_HEADER_PAIRS = (
+    ("x-ratelimit-remaining-requests", "x-ratelimit-limit-requests"),
+    ("x-ratelimit-remaining-tokens", "x-ratelimit-limit-tokens"),
+    ("anthropic-ratelimit-requests-remaining", "anthropic-ratelimit-requests-limit"),
+    ("anthropic-ratelimit-tokens-remaining", "anthropic-ratelimit-tokens-limit"),
+    ("anthropic-ratelimit-input-tokens-remaining", "anthropic-ratelimit-input-tokens-limit"),
+    ("anthropic-ratelimit-output-tokens-remaining", "anthropic-ratelimit-output-tokens-limit"),
+)
+
+# Statuses that mean the provider is shedding load
+_OVERLOAD_STATUSES = (429, 503, 529)
+
+
+def remaining_quota_fraction(headers: Mapping[str, str]) -> Optional[float]:
+    """Get the smallest remaining/limit ratio reported in rate-limit headers.
+
+    Args:
+        headers: Response headers (case-insensitive mapping such as httpx.Headers).
+
+    Returns:
+        Optional[float]: Fraction of the tightest quota still available, or None
+        if the response carries no rate-limit headers.
+    """
+    if not isinstance(headers, httpx.Headers):
+        headers = httpx.Headers(dict(headers))
+
+    fractions = []
+    for remaining_name, limit_name in _RATE_LIMIT_HEADER_PAIRS:
+        remaining, limit = headers.get(remaining_name), headers.get(limit_name)
+        if remaining is None or limit is None:
+            continue
+        try:
+            limit_value = float(limit)
+            if limit_value > 0:
+                fractions.append(max(0.0, float(remaining)) / limit_value)
+        except ValueError:
+            continue
+    return min(fractions) if fractions else None
+
+
+class AdaptiveConcurrencyLimiter:
+    """Self-tuning cap on in-flight requests to a provider (AIMD).
+
+    Every successful response grows the limit additively (by roughly one slot
+    per limit's worth of completions). Overload responses (429/503/529), or
+    rate-limit headers showing less than ``low_watermark`` of the quota left,
+    shrink it multiplicatively. Decreases are applied at most once per
+    ``decrease_cooldown`` seconds so a burst of responses from the same
+    congested window only counts once. Works for both threads (``slot()``)
+    and coroutines (``aslot()``), which share the same limit.
+
+    Args:
+        initial_limit: Starting number of allowed in-flight requests.
+        min_limit: Lower bound for the limit.
+        max_limit: Upper bound for the limit.
+        decrease_factor: Multiplier applied to the limit on overload.
+        low_watermark: Remaining quota fraction below which the limit shrinks.
+        decrease_cooldown: Minimum seconds between two decreases.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        decrease_factor: float = 0.5,
+        low_watermark: float = 0.1,
+        decrease_cooldown: float = 1.0,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.low_watermark = low_watermark
+        self.decrease_cooldown = decrease_cooldown
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = []
+
+    @classmethod
+    def from_config(cls, config: "ProviderConfig") -> "AdaptiveConcurrencyLimiter":
+        """Build a limiter from a provider config's concurrency settings.
+
+        Args:
+            config: Provider configuration.
+
+        Returns:
+            AdaptiveConcurrencyLimiter using the configured bounds.
+        """
+        return cls(
+            initial_limit=config.initial_concurrency,
+            min_limit=config.min_concurrency,
+            max_limit=config.max_concurrency,
+        )
+
+    @property
+    def limit(self) -> int:
+        """Current number of allowed in-flight requests."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    def acquire(self) -> None:
+        """Block until a slot is free and take it."""
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    async def aacquire(self) -> None:
+        """Wait without blocking the event loop until a slot is free and take it."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    return
+                future: asyncio.Future[None] = loop.create_future()
+                waiter = (loop, future)
+                self._async_waiters.append(waiter)
+            try:
+                await future
+            except asyncio.CancelledError:
+                with self._lock:
+                    try:
+                        self._async_waiters.remove(waiter)
+                    except ValueError:
+                        # Already woken: pass the wakeup on so the free slot isn't lost
+                        self._wake_waiters()
+                raise
+
+    def release(self) -> None:
+        """Give a slot back and wake waiters that may now proceed."""
+        with self._lock:
+            self._in_flight -= 1
+            self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        # Caller holds the lock. Woken waiters re-check the limit, so over-waking is harmless.
+        free = int(self._limit) - self._in_flight
+        if free <= 0:
+            return
+        self._condition.notify(free)
+        while free > 0 and self._async_waiters:
+            loop, future = self._async_waiters.pop(0)
+            if future.done():
+                continue
+            loop.call_soon_threadsafe(_resolve, future)
+            free -= 1
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Adjust the limit from a provider response.
+
+        Args:
+            status_code: HTTP status of the response.
+            headers: Response headers, inspected for remaining-quota hints.
+        """
+        if status_code in _OVERLOAD_STATUSES:
+            self._decrease()
+        elif status_code < 400:
+            fraction = remaining_quota_fraction(headers)
+            if fraction is not None and fraction < self.low_watermark:
+                self._decrease()
+            else:
+                self._increase()
+
+    def _increase(self) -> None:
+        with self._lock:
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+            self._wake_waiters()
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_decrease < self.decrease_cooldown:
+                return
+            self._last_decrease = now
+            self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+
+    @contextlib.contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold a slot for the duration of the block."""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    @contextlib.asynccontextmanager
+    async def aslot(self) -> AsyncIterator[None]:
+        """Async version of slot()."""
+        await self.aacquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
@@ -0,0 +1,156 @@
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Set, TypeVar
+
+T = TypeVar("T")
+
+
+def run_hedged(
+    attempts: Sequence[Callable[[], T]],
+    delay: float,
+    discard: Optional[Callable[[T], Any]] = None,
+) -> T:
+    """Run ``attempts`` as hedged requests and return the first success.
+
+    The first attempt starts immediately. Each time ``delay`` seconds pass
+    without a result, or an attempt fails, the next one is started. A delay of
+    0 starts all attempts at once. When one succeeds, pending attempts are
+    cancelled. Attempts already running can't be interrupted from another
+    thread, so their results are passed to ``discard`` (e.g. to close a stream)
+    when they finish.
+
+    Args:
+        attempts: Callables in priority order (primary first).
+        delay: Seconds to wait for a result before starting the next attempt.
+        discard: Optional cleanup for results that lost the race.
+
+    Returns:
+        Result of the first attempt to succeed.
+
+    Raises:
+        Exception: The error of the earliest attempt if all attempts fail.
+    """
+    executor = ThreadPoolExecutor(max_workers=len(attempts), thread_name_prefix="hedge")
+    order: Dict[Future[T], int] = {}
+    errors: Dict[int, BaseException] = {}
+    pending: Set[Future[T]] = set()
+
+    def launch() -> None:
+        index = len(order)
+        future = executor.submit(attempts[index])
+        order[future] = index
+        pending.add(future)
+
+    def discard_result(future: "Future[T]") -> None:
+        if discard is not None and not future.cancelled() and future.exception() is None:
+            discard(future.result())
+
+    try:
+        launch()
+        while delay <= 0 and len(order) < len(attempts):
+            launch()
+
+        while pending:
+            timeout = delay if len(order) < len(attempts) else None
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                launch()
+                continue
+
+            winner: Optional[Future[T]] = None
+            for future in sorted(done, key=order.__getitem__):
+                pending.discard(future)
+                error = future.exception()
+                if error is not None:
+                    errors[order[future]] = error
+                elif winner is None:
+                    winner = future
+                else:
+                    discard_result(future)
+
+            if winner is not None:
+                for future in pending:
+                    if not future.cancel():
+                        future.add_done_callback(discard_result)
+                return winner.result()
+
+            if len(order) < len(attempts):
+                launch()
+
+        raise errors[min(errors)]
+    finally:
+        executor.shutdown(wait=False)
+
+
+async def arun_hedged(
+    attempts: Sequence[Callable[[], Awaitable[T]]],
+    delay: float,
+    discard: Optional[Callable[[T], Awaitable[Any]]] = None,
+) -> T:
+    """Async version of run_hedged().
+
+    Losing attempts are cancelled, which also closes their HTTP requests.
+    Attempts that completed successfully but lost are passed to ``discard``.
+
+    Args:
+        attempts: Coroutine factories in priority order (primary first).
+        delay: Seconds to wait for a result before starting the next attempt.
+        discard: Optional async cleanup for results that lost the race.
+
+    Returns:
+        Result of the first attempt to succeed.
+
+    Raises:
+        Exception: The error of the earliest attempt if all attempts fail.
+    """
+    order: Dict[asyncio.Task[T], int] = {}
+    errors: Dict[int, BaseException] = {}
+    pending: Set[asyncio.Task[T]] = set()
+
+    def launch() -> None:
+        index = len(order)
+        task = asyncio.ensure_future(attempts[index]())
+        order[task] = index
+        pending.add(task)
+
+    async def discard_result(task: "asyncio.Task[T]") -> None:
+        if discard is not None and not task.cancelled() and task.exception() is None:
+            await discard(task.result())
+
+    try:
+        launch()
+        while delay <= 0 and len(order) < len(attempts):
+            launch()
+
+        while pending:
+            timeout = delay if len(order) < len(attempts) else None
+            done, _ = await asyncio.wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                launch()
+                continue
+
+            winner: Optional[asyncio.Task[T]] = None
+            for task in sorted(done, key=order.__getitem__):
+                pending.discard(task)
+                error = task.exception()
+                if error is not None:
+                    errors[order[task]] = error
+                elif winner is None:
+                    winner = task
+                else:
+                    await discard_result(task)
+
+            if winner is not None:
+                return winner.result()
+
+            if len(order) < len(attempts):
+                launch()
+
+        raise errors[min(errors)]
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+            for task in pending:
+                await discard_result(task)
@@ -61,6 +61,44 @@ class ModelInfo(BaseModel):
     tags: List[str] = Field(default_factory=list)
 
 
+class BatchStatus(str, Enum):
+    """Normalized status of a provider-native batch job."""
+
+    VALIDATING = "validating"
+    IN_PROGRESS = "in_progress"
+    FINALIZING = "finalizing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    EXPIRED = "expired"
+    CANCELLING = "cancelling"
+    CANCELLED = "cancelled"
+
+
+class BatchJob(BaseModel):
+    """A provider-native batch job (OpenAI Batch, Anthropic Message Batches, Gemini batch)."""
+
+    id: str
+    provider: str
+    model: Optional[str] = None
+    status: BatchStatus
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    created_at: Optional[int] = None
+    raw: Dict[str, Any] = Field(default_factory=dict)
+    """Provider's job object, including where to fetch results from."""
+
+    @property
+    def done(self) -> bool:
+        """Whether the job has reached a final state."""
+        return self.status in (
+            BatchStatus.COMPLETED,
+            BatchStatus.FAILED,
+            BatchStatus.EXPIRED,
+            BatchStatus.CANCELLED,
+        )
+
+
 class ProviderConfig(BaseModel):
     """Configuration for a provider instance.
 
@@ -81,10 +119,42 @@ class ProviderConfig(BaseModel):
     timeout: Optional[float] = None
     max_retries: int = 3
     retry_delay: float = 1.0
+    retry_max_delay: float = 60.0
     rate_limit: Optional[int] = None
+    """Maximum requests per minute per model, enforced client-side."""
+
+    token_rate_limit: Optional[int] = None
+    """Maximum tokens (prompt + max_tokens) per minute per model, enforced client-side."""
+
     headers: Dict[str, str] = Field(default_factory=dict)
     deployment_mapping: Dict[str, str] = Field(default_factory=dict)
 
+    # Connection pool configuration
+    max_connections: Optional[int] = 100
+    """Maximum number of concurrent connections to the provider host."""
+
+    max_keepalive_connections: Optional[int] = 20
+    """Maximum number of idle connections kept open for reuse."""
+
+    keepalive_expiry: Optional[float] = 5.0
+    """Seconds an idle keep-alive connection is held before being closed."""
+
+    http2: bool = False
+    """Multiplex requests over HTTP/2 connections (requires ``justllms[http2]``)."""
+
+    # Adaptive concurrency configuration
+    adaptive_concurrency: bool = False
+    """Tune the in-flight request limit from rate-limit headers and 429s (AIMD)."""
+
+    initial_concurrency: int = 10
+    """Starting in-flight request limit when adaptive concurrency is enabled."""
+
+    min_concurrency: int = 1
+    """Lower bound for the adaptive in-flight request limit."""
+
+    max_concurrency: int = 100
+    """Upper bound for the adaptive in-flight request limit."""
+
     # Tool-related configuration
     native_tools: Optional[Dict[str, Any]] = None
     """Configuration for provider-native tools (e.g., Google Search for Gemini)."""
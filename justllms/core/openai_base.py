@@ -1,10 +1,13 @@
+import functools
 import json
 import logging
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 from justllms.core.base import BaseProvider, BaseResponse
-from justllms.core.models import Message
-from justllms.core.streaming import StreamChunk, SyncStreamResponse
+from justllms.core.models import Choice, Message, Usage
+from justllms.core.sse import SSEEvent
+from justllms.core.streaming import AsyncStreamResponse, StreamChunk, SyncStreamResponse
+from justllms.utils import codec
 
 logger = logging.getLogger(__name__)
 
@@ -116,6 +119,7 @@ class BaseOpenAIChatProvider(BaseProvider):
             "response_format",
             "seed",
             "user",
+            "stream_options",
         }
 
         # Parameters to ignore (provider-specific or handled separately)
@@ -133,44 +137,44 @@ class BaseOpenAIChatProvider(BaseProvider):
 
         return payload
 
-    def _parse_sse_line(self, line: str) -> Optional[StreamChunk]:
-        """Parse a single SSE line into a StreamChunk.
+    def _parse_sse_event(self, event: SSEEvent) -> Optional[StreamChunk]:
+        """Parse a single SSE event into a StreamChunk.
 
         Args:
-            line: Raw SSE line to parse.
+            event: Event decoded from the response stream.
 
         Returns:
-            StreamChunk if line contains valid data, None otherwise.
+            StreamChunk if the event contains content, None otherwise.
         """
-        line = line.strip()
-        if not line:
-            return None
-
-        if not line.startswith("data: "):
+        try:
+            chunk_data = codec.loads(event.data)
+        except json.JSONDecodeError:
+            logger.warning(f"Failed to parse SSE chunk: {event.data.decode('utf-8', 'replace')}")
             return None
 
-        data = line[6:]  # Remove "data: " prefix
-
-        if data == "[DONE]":
-            return None  # Signal end of stream
+        content = finish_reason = None
+        choices = chunk_data.get("choices")
+        if choices:
+            content = choices[0].get("delta", {}).get("content")
+            finish_reason = choices[0].get("finish_reason")
+
+        # Sent in a final chunk without choices when stream_options.include_usage is set
+        usage = None
+        usage_data = chunk_data.get("usage")
+        if usage_data:
+            usage = Usage(
+                prompt_tokens=usage_data.get("prompt_tokens", 0),
+                completion_tokens=usage_data.get("completion_tokens", 0),
+                total_tokens=usage_data.get("total_tokens", 0),
+            )
 
-        try:
-            chunk_data = json.loads(data)
-            choices = chunk_data.get("choices", [])
-
-            if choices:
-                delta = choices[0].get("delta", {})
-                content = delta.get("content")
-                finish_reason = choices[0].get("finish_reason")
-
-                if content or finish_reason:
-                    return StreamChunk(
-                        content=content,
-                        finish_reason=finish_reason,
-                        raw=chunk_data,
-                    )
-        except json.JSONDecodeError:
-            logger.warning(f"Failed to parse SSE chunk: {data}")
+        if content or finish_reason or usage:
+            return StreamChunk(
+                content=content,
+                finish_reason=finish_reason,
+                usage=usage,
+                raw=chunk_data,
+            )
 
         return None
 
@@ -201,9 +205,30 @@ class BaseOpenAIChatProvider(BaseProvider):
             url=url,
             payload=payload,
             headers=headers,
-            parse_chunk_fn=self._parse_sse_line,
+            parse_event_fn=self._parse_sse_event,
+            timeout=timeout,
+            error_prefix="Streaming request",
+            client=self.http_client,
+        )
+
+    def _astream_sse_response(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        headers: Dict[str, str],
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[StreamChunk]:
+        """Async version of _stream_sse_response() using the pooled async client."""
+        from justllms.core.streaming import aparse_sse_stream
+
+        return aparse_sse_stream(
+            url=url,
+            payload=payload,
+            headers=headers,
+            parse_event_fn=self._parse_sse_event,
             timeout=timeout,
             error_prefix="Streaming request",
+            client=self.async_http_client,
         )
 
     def _parse_openai_response(
@@ -212,7 +237,7 @@ class BaseOpenAIChatProvider(BaseProvider):
         """Parse OpenAI-compatible API response.
 
         Handles standard OpenAI response format with choices and usage data.
-        Uses common parsing utilities from BaseProvider.
+        Choices and usage are parsed from ``response_data`` on first access.
 
         Args:
             response_data: Raw JSON response from API.
@@ -222,6 +247,16 @@ class BaseOpenAIChatProvider(BaseProvider):
         Returns:
             BaseResponse: Parsed response object with choices and usage.
         """
+        return self._create_base_response(
+            response_class,
+            response_data,
+            functools.partial(self._parse_openai_choices, response_data),
+            functools.partial(self._create_standard_usage, response_data.get("usage") or {}),
+            model,
+        )
+
+    def _parse_openai_choices(self, response_data: Dict[str, Any]) -> List[Choice]:
+        """Build Choice objects from the ``choices`` of an OpenAI-compatible response."""
         choices = []
         for choice_data in response_data.get("choices", []):
             message_data = choice_data.get("message", {})
@@ -230,16 +265,42 @@ class BaseOpenAIChatProvider(BaseProvider):
                 choice_data.get("index", 0),
             )
             choices.append(choice)
+        return choices
 
-        usage = self._create_standard_usage(response_data.get("usage", {}))
+    def _build_completion_payload(
+        self, messages: List[Message], model: str, **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Build the filtered and provider-customized request payload.
 
-        return self._create_base_response(
-            response_class,
-            response_data,
-            choices,
-            usage,
-            model,
-        )
+        Args:
+            messages: Conversation messages to process.
+            model: Model identifier for the request.
+            **kwargs: Additional parameters (temperature, max_tokens, etc.).
+
+        Returns:
+            Dict[str, Any]: Payload ready to send to the chat completions endpoint.
+        """
+        # Build base payload with parameter filtering
+        payload = self._build_base_payload(messages, model, **kwargs)
+
+        # Allow provider-specific customization
+        return self._customize_payload(payload, **kwargs)
+
+    def _get_response_class(self) -> type:
+        """Resolve the provider's response class (e.g. OpenAIResponse).
+
+        Looks up ``<Name>Response`` in the provider's module and falls back to
+        BaseResponse when no specific class is defined.
+        """
+        try:
+            import importlib
+
+            module = importlib.import_module(self.__module__)
+            response_class_name = f"{self.__class__.__name__.replace('Provider', 'Response')}"
+            response_class: type = getattr(module, response_class_name, BaseResponse)
+        except (ImportError, AttributeError):
+            response_class = BaseResponse
+        return response_class
 
     def complete(
         self,
@@ -266,31 +327,45 @@ class BaseOpenAIChatProvider(BaseProvider):
             ProviderError: If the API request fails.
             NotImplementedError: If required methods are not implemented.
         """
-        url = self._get_api_endpoint()
-
-        # Build base payload with parameter filtering
-        payload = self._build_base_payload(messages, model, **kwargs)
-
-        # Allow provider-specific customization
-        payload = self._customize_payload(payload, **kwargs)
-
         # Execute request using common HTTP handling
         response_data = self._make_http_request(
-            url=url,
-            payload=payload,
+            url=self._get_api_endpoint(),
+            payload=self._build_completion_payload(messages, model, **kwargs),
             headers=self._get_request_headers(),
             timeout=timeout,
         )
-        try:
-            import importlib
 
-            module = importlib.import_module(self.__module__)
-            response_class_name = f"{self.__class__.__name__.replace('Provider', 'Response')}"
-            response_class = getattr(module, response_class_name, BaseResponse)
-        except (ImportError, AttributeError):
-            response_class = BaseResponse
+        return self._parse_openai_response(response_data, model, self._get_response_class())
+
+    async def acomplete(
+        self,
+        messages: List[Message],
+        model: str,
+        timeout: Any = None,
+        **kwargs: Any,
+    ) -> BaseResponse:
+        """Execute OpenAI-compatible chat completion request asynchronously.
+
+        Args:
+            messages: Conversation messages to process.
+            model: Model identifier for the request.
+            timeout: Optional timeout in seconds. If None, no timeout is enforced.
+            **kwargs: Additional parameters (temperature, max_tokens, etc.).
+
+        Returns:
+            BaseResponse: Completed response from the provider.
+
+        Raises:
+            ProviderError: If the API request fails.
+        """
+        response_data = await self._amake_http_request(
+            url=self._get_api_endpoint(),
+            payload=self._build_completion_payload(messages, model, **kwargs),
+            headers=self._get_request_headers(),
+            timeout=timeout,
+        )
 
-        return self._parse_openai_response(response_data, model, response_class)
+        return self._parse_openai_response(response_data, model, self._get_response_class())
 
     def stream(
         self,
@@ -310,21 +385,10 @@ class BaseOpenAIChatProvider(BaseProvider):
         Returns:
             SyncStreamResponse: Streaming response iterator.
         """
-        url = self._get_api_endpoint()
-
-        # Build base payload with parameter filtering
-        payload = self._build_base_payload(messages, model, **kwargs)
-
-        # Enable streaming
-        payload["stream"] = True
-
-        # Allow provider-specific customization
-        payload = self._customize_payload(payload, **kwargs)
-
         # Use shared SSE streaming helper
         stream_iter = self._stream_sse_response(
-            url=url,
-            payload=payload,
+            url=self._get_api_endpoint(),
+            payload=self._build_stream_payload(messages, model, **kwargs),
             headers=self._get_request_headers(),
             timeout=timeout,
         )
@@ -333,6 +397,48 @@ class BaseOpenAIChatProvider(BaseProvider):
             provider=self, model=model, messages=messages, raw_stream=stream_iter
         )
 
+    async def astream(
+        self,
+        messages: List[Message],
+        model: str,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> AsyncStreamResponse:
+        """Async stream completion using Server-Sent Events.
+
+        Args:
+            messages: Conversation messages to process.
+            model: Model identifier for the request.
+            timeout: Optional timeout in seconds.
+            **kwargs: Additional parameters.
+
+        Returns:
+            AsyncStreamResponse: Async streaming response iterator.
+        """
+        stream_iter = self._astream_sse_response(
+            url=self._get_api_endpoint(),
+            payload=self._build_stream_payload(messages, model, **kwargs),
+            headers=self._get_request_headers(),
+            timeout=timeout,
+        )
+
+        return AsyncStreamResponse(
+            provider=self, model=model, messages=messages, async_stream=stream_iter
+        )
+
+    def _build_stream_payload(
+        self, messages: List[Message], model: str, **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Build a streaming payload for the chat completions endpoint."""
+        # Build base payload with parameter filtering
+        payload = self._build_base_payload(messages, model, **kwargs)
+
+        # Enable streaming
+        payload["stream"] = True
+
+        # Allow provider-specific customization
+        return self._customize_payload(payload, **kwargs)
+
     def supports_streaming(self) -> bool:
         """OpenAI-compatible providers support streaming."""
         return True
@@ -0,0 +1,121 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate.
+
+    Callers reserve capacity up front and are told how long to wait; the
+    balance may go negative, so concurrent callers queue in arrival order
+    instead of polling.
+
+    Args:
+        capacity: Maximum number of tokens the bucket can hold (burst size).
+        refill_per_second: Tokens added per second.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take ``amount`` tokens and return the seconds to wait until they are available.
+
+        Not thread-safe; RateLimiter serializes access.
+        """
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.refill_per_second
+        )
+        self._updated = now
+        # A single request larger than the bucket could never be admitted otherwise
+        self._tokens -= min(amount, self.capacity)
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.refill_per_second
+
+
+class RateLimiter:
+    """Client-side requests-per-minute and tokens-per-minute limiter.
+
+    Keeps one pair of token buckets per key (typically a model name) so
+    requests queue locally at the provider's limit instead of being rejected
+    with 429 and burning retries. Both ``acquire()`` (blocking) and
+    ``aacquire()`` (async) reserve capacity in both buckets and then wait for
+    the longer of the two.
+
+    Args:
+        requests_per_minute: Maximum requests per minute per key, or None for no limit.
+        tokens_per_minute: Maximum tokens (prompt + max completion) per minute per key,
+                           or None for no limit.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._buckets: Dict[str, Tuple[Optional[TokenBucket], Optional[TokenBucket]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any limit is configured."""
+        return bool(self.requests_per_minute or self.tokens_per_minute)
+
+    @property
+    def limits_tokens(self) -> bool:
+        """Whether a tokens-per-minute limit is configured."""
+        return bool(self.tokens_per_minute)
+
+    def _get_buckets(self, key: str) -> Tuple[Optional[TokenBucket], Optional[TokenBucket]]:
+        buckets = self._buckets.get(key)
+        if buckets is None:
+            request_bucket = (
+                TokenBucket(self.requests_per_minute, self.requests_per_minute / 60.0)
+                if self.requests_per_minute
+                else None
+            )
+            token_bucket = (
+                TokenBucket(self.tokens_per_minute, self.tokens_per_minute / 60.0)
+                if self.tokens_per_minute
+                else None
+            )
+            buckets = (request_bucket, token_bucket)
+            self._buckets[key] = buckets
+        return buckets
+
+    def reserve(self, key: str, tokens: int = 0) -> float:
+        """Reserve one request and ``tokens`` tokens for ``key``.
+
+        Args:
+            key: Bucket key, e.g. the model name.
+            tokens: Estimated tokens the request will consume.
+
+        Returns:
+            float: Seconds the caller must wait before sending the request.
+        """
+        now = time.monotonic()
+        with self._lock:
+            request_bucket, token_bucket = self._get_buckets(key)
+            wait = request_bucket.reserve(1, now) if request_bucket else 0.0
+            if token_bucket and tokens > 0:
+                wait = max(wait, token_bucket.reserve(tokens, now))
+        return wait
+
+    def acquire(self, key: str, tokens: int = 0) -> None:
+        """Block until a request with ``tokens`` tokens may be sent for ``key``."""
+        wait = self.reserve(key, tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, key: str, tokens: int = 0) -> None:
+        """Async version of acquire() that waits without blocking the event loop."""
+        wait = self.reserve(key, tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
@@ -0,0 +1,323 @@
+import asyncio
+import random
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Deque, Mapping, Optional, TypeVar
+
+import httpx
+
+from justllms.exceptions import ProviderError
+
+if TYPE_CHECKING:
+    from justllms.core.models import ProviderConfig
+
+T = TypeVar("T")
+
+# Duration format used by OpenAI-style x-ratelimit-reset-* headers, e.g. "6m0s", "1.5s", "20ms"
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+# (reset header, remaining header) for each rate-limit bucket
+_RATE_LIMIT_BUCKETS = (
+    ("x-ratelimit-reset-requests", "x-ratelimit-remaining-requests"),
+    ("x-ratelimit-reset-tokens", "x-ratelimit-remaining-tokens"),
+    ("anthropic-ratelimit-requests-reset", "anthropic-ratelimit-requests-remaining"),
+    ("anthropic-ratelimit-tokens-reset", "anthropic-ratelimit-tokens-remaining"),
+    ("anthropic-ratelimit-input-tokens-reset", "anthropic-ratelimit-input-tokens-remaining"),
+    ("anthropic-ratelimit-output-tokens-reset", "anthropic-ratelimit-output-tokens-remaining"),
+)
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """Determine if an exception is worth retrying.
+
+    Retries on:
+    - Network/connection errors (httpx.RequestError)
+    - Rate limiting (429)
+    - Server errors (500+)
+    - Request timeout (408)
+
+    Does NOT retry on:
+    - Client errors (400-499 except 429, 408)
+    """
+    if isinstance(exc, httpx.RequestError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in (429, 408) or exc.response.status_code >= 500
+    if isinstance(exc, ProviderError):
+        status = getattr(exc, "status_code", None)
+        if status is None:
+            # Streaming requests wrap the httpx error they failed with
+            cause = exc.__cause__
+            return cause is not None and is_retryable_error(cause)
+        return status in (429, 408) or status >= 500
+    return False
+
+
+def _parse_duration(value: str) -> Optional[float]:
+    """Parse a Go-style duration ("1m30s", "250ms") or plain seconds into seconds."""
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(num + unit for num, unit in parts) != value:
+        return None
+    return sum(float(num) * _DURATION_UNITS[unit] for num, unit in parts)
+
+
+def _parse_timestamp(value: str) -> Optional[float]:
+    """Parse an RFC 3339 or HTTP-date timestamp into seconds from now."""
+    value = value.strip()
+    try:
+        moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            moment = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max(0.0, (moment - datetime.now(timezone.utc)).total_seconds())
+
+
+def retry_after_from_headers(
+    headers: Optional[Mapping[str, str]], rate_limited: bool = True
+) -> Optional[float]:
+    """Extract a server-provided backoff hint from response headers.
+
+    Checks, in order of precedence, ``retry-after-ms``, ``Retry-After`` (seconds
+    or HTTP-date) and, for rate-limited (429) responses only, the provider
+    rate-limit reset headers (``x-ratelimit-reset-*``,
+    ``anthropic-ratelimit-*-reset``). Providers send the reset headers on
+    almost every response, so they say nothing about when a server error will
+    clear. Among the buckets, those whose ``remaining`` header is 0 are the
+    exhausted ones and their reset is used; if none is marked exhausted the
+    shortest reset wins.
+
+    Args:
+        headers: Response headers (case-insensitive mapping such as httpx.Headers).
+        rate_limited: Whether the response was a 429, enabling the reset headers.
+
+    Returns:
+        Optional[float]: Seconds to wait before retrying, or None if no hint.
+    """
+    if not headers:
+        return None
+    if not isinstance(headers, httpx.Headers):
+        headers = httpx.Headers(dict(headers))
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000.0)
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            parsed = _parse_timestamp(retry_after)
+            if parsed is not None:
+                return parsed
+
+    if not rate_limited:
+        return None
+
+    resets = []
+    exhausted = []
+    for reset_name, remaining_name in _RATE_LIMIT_BUCKETS:
+        value = headers.get(reset_name)
+        if not value:
+            continue
+        seconds = _parse_duration(value) if reset_name.startswith("x-") else _parse_timestamp(value)
+        if seconds is None:
+            continue
+        resets.append(seconds)
+        if headers.get(remaining_name, "").strip() == "0":
+            exhausted.append(seconds)
+    if exhausted:
+        # Every exhausted bucket has to refill before the request can pass
+        return max(exhausted)
+    return min(resets) if resets else None
+
+
+class RetryBudget:
+    """Client-wide cap on the share of traffic that may be retries.
+
+    Original requests and retries are counted over a sliding time window. A
+    retry is allowed only while retries stay below ``ratio`` times the original
+    requests in the window (plus a small floor so low-traffic clients can still
+    retry). During a provider outage this keeps retries from multiplying the
+    outbound load.
+
+    Args:
+        ratio: Maximum retries per original request within the window.
+        min_retries: Retries always allowed per window regardless of traffic.
+        window: Length of the sliding window in seconds.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: float = 10.0):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window
+        for events in (self._requests, self._retries):
+            while events and events[0] < cutoff:
+                events.popleft()
+
+    def record_request(self) -> None:
+        """Record an original (non-retry) request."""
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            self._requests.append(now)
+
+    def try_acquire_retry(self) -> bool:
+        """Reserve a retry if the budget allows it.
+
+        Returns:
+            bool: True if the retry may proceed (and has been recorded).
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            allowed = max(self.min_retries, int(self.ratio * len(self._requests)))
+            if len(self._retries) >= allowed:
+                return False
+            self._retries.append(now)
+            return True
+
+
+class RetryPolicy:
+    """Retry policy for provider HTTP requests.
+
+    Backoff uses decorrelated jitter (each delay is drawn uniformly between
+    ``base_delay`` and three times the previous delay, capped at ``max_delay``),
+    so retries from many workers spread out instead of arriving together.
+    When the failed response carries a ``Retry-After`` header (or, for a 429,
+    rate-limit reset headers), that hint is used instead, capped at
+    ``max_delay``.
+
+    Args:
+        max_retries: Maximum number of retries after the first attempt.
+        base_delay: Minimum delay between attempts in seconds.
+        max_delay: Maximum delay between attempts in seconds.
+        budget: Optional shared RetryBudget limiting retries client-wide.
+        retryable: Predicate deciding whether an exception may be retried.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        budget: Optional[RetryBudget] = None,
+        retryable: Callable[[BaseException], bool] = is_retryable_error,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.retryable = retryable
+
+    @classmethod
+    def from_config(cls, config: "ProviderConfig") -> "RetryPolicy":
+        """Build a policy from a provider config's retry settings.
+
+        Args:
+            config: Provider configuration.
+
+        Returns:
+            RetryPolicy using max_retries, retry_delay and retry_max_delay.
+        """
+        return cls(
+            max_retries=config.max_retries,
+            base_delay=config.retry_delay,
+            max_delay=config.retry_max_delay,
+        )
+
+    def next_delay(self, exc: BaseException, previous_delay: float) -> float:
+        """Compute the wait before the next attempt.
+
+        Args:
+            exc: Exception raised by the failed attempt.
+            previous_delay: Delay used before the failed attempt.
+
+        Returns:
+            float: Seconds to wait, at most max_delay.
+        """
+        hint = getattr(exc, "retry_after", None)
+        if hint is None:
+            hint = retry_after_from_headers(
+                getattr(exc, "headers", None),
+                rate_limited=getattr(exc, "status_code", None) == 429,
+            )
+        if hint is not None:
+            # Small jitter so clients released by the same reset don't stampede
+            return min(self.max_delay, hint + random.uniform(0, self.base_delay))
+
+        upper = max(self.base_delay, previous_delay * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+    def _retry_delay(self, exc: BaseException, attempt: int, delay: float) -> Optional[float]:
+        """Return the delay before retrying ``exc``, or None if it must be raised."""
+        if attempt >= self.max_retries or not self.retryable(exc):
+            return None
+        next_delay = self.next_delay(exc, delay)
+        if self.budget is not None and not self.budget.try_acquire_retry():
+            return None
+        return next_delay
+
+    def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call ``fn`` with retries, sleeping between attempts.
+
+        Raises:
+            Exception: The last error once retries are exhausted or not allowed.
+        """
+        if self.budget is not None:
+            self.budget.record_request()
+
+        delay = self.base_delay
+        attempt = 0
+        while True:
+            try:
+                return fn(*args, **kwargs)
+            except Exception as exc:
+                next_delay = self._retry_delay(exc, attempt, delay)
+                if next_delay is None:
+                    raise
+                delay = next_delay
+                attempt += 1
+                time.sleep(delay)
+
+    async def acall(self, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """Async version of call() that awaits ``fn`` and sleeps without blocking."""
+        if self.budget is not None:
+            self.budget.record_request()
+
+        delay = self.base_delay
+        attempt = 0
+        while True:
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as exc:
+                next_delay = self._retry_delay(exc, attempt, delay)
+                if next_delay is None:
+                    raise
+                delay = next_delay
+                attempt += 1
+                await asyncio.sleep(delay)
@@ -0,0 +1,239 @@
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+from justllms.utils import codec
+
+_BOM = b"\xef\xbb\xbf"
+# Membership tests with an int are a plain memchr, much cheaper than with b"\n"
+_LF = 0x0A
+_CR = 0x0D
+
+
+class SSEEvent(NamedTuple):
+    """A dispatched Server-Sent Event.
+
+    Attributes:
+        data: The event's ``data`` lines joined with newlines, as raw bytes.
+        event: Event type from the ``event`` field ("message" if absent).
+        id: Last event ID seen on the stream, if any.
+        retry: Reconnection time in milliseconds, if the event set one.
+    """
+
+    data: bytes
+    event: str = "message"
+    id: Optional[str] = None
+    retry: Optional[int] = None
+
+    def json(self) -> Any:
+        """Decode the event data as JSON.
+
+        Raises:
+            json.JSONDecodeError: If the data is not valid JSON.
+        """
+        return codec.loads(self.data)
+
+
+# Builds an SSEEvent from a complete field tuple without the Python-level __new__
+_new_event = tuple.__new__
+
+
+class SSEDecoder:
+    """Incremental Server-Sent Events parser.
+
+    Implements the event stream format of the HTML specification: ``data``
+    fields spanning several lines, ``event``, ``id`` and ``retry`` fields,
+    comment lines and CR, LF or CRLF line endings, which may fall anywhere
+    across chunk boundaries. Event data stays bytes, so it reaches the JSON
+    codec without being decoded, stripped and sliced as ``str`` first.
+
+    Examples:
+        decoder = SSEDecoder()
+        for chunk in response.iter_bytes():
+            for event in decoder.feed(chunk):
+                ...
+    """
+
+    def __init__(self) -> None:
+        self._pending: List[bytes] = []
+        self._skip_lf = False
+        self._started = False
+        # ID to resume from when reconnecting (sent as Last-Event-ID)
+        self.last_event_id: Optional[str] = None
+
+    def feed(self, chunk: bytes) -> List[SSEEvent]:
+        """Parse a chunk of the stream and return the events it completes."""
+        if not self._started:
+            if not chunk:
+                return []
+            self._started = True
+            if chunk.startswith(_BOM):
+                chunk = chunk[3:]
+        if self._skip_lf:
+            # The previous chunk ended in CR; an LF starting this one completes a CRLF
+            self._skip_lf = False
+            if chunk[:1] == b"\n":
+                chunk = chunk[1:]
+        if _CR in chunk:
+            self._skip_lf = chunk.endswith(b"\r")
+            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+        # Events end at a blank line; buffer until one is complete
+        end = chunk.rfind(b"\n\n")
+        if end < 0 and not (
+            chunk[:1] == b"\n" and self._pending and self._pending[-1].endswith(b"\n")
+        ):
+            if chunk:
+                self._pending.append(chunk)
+            return []
+        if self._pending:
+            self._pending.append(chunk)
+            chunk = b"".join(self._pending)
+            self._pending.clear()
+            end = chunk.rfind(b"\n\n")
+        end += 2
+        if end < len(chunk):
+            self._pending.append(chunk[end:])
+        last_event_id = self.last_event_id
+
+        if chunk.startswith(b"data: "):
+            # By far the most common case is a run of single-line "data: ..."
+            # events, in which every newline is part of an event separator
+            payloads = chunk[6 : end - 2].split(b"\n\ndata: ")
+            if chunk.count(b"\n", 0, end) == 2 * len(payloads):
+                return [
+                    _new_event(SSEEvent, (data, "message", last_event_id, None))
+                    for data in payloads
+                ]
+
+        events = []
+        for block in chunk[:end].split(b"\n\n"):
+            if block.startswith(b"data: ") and _LF not in block:
+                events.append(_new_event(SSEEvent, (block[6:], "message", last_event_id, None)))
+                continue
+            event = self._parse_block(block)
+            last_event_id = self.last_event_id
+            if event is not None:
+                events.append(event)
+        return events
+
+    def flush(self) -> List[SSEEvent]:
+        """Finish the stream and return its last event, if unterminated.
+
+        The specification discards an event not followed by a blank line;
+        it is dispatched here instead, since some servers close the
+        connection right after the final ``data`` line.
+        """
+        if not self._pending:
+            return []
+        event = self._parse_block(b"".join(self._pending))
+        self._pending.clear()
+        return [event] if event is not None else []
+
+    def _parse_block(self, block: bytes) -> Optional[SSEEvent]:
+        """Parse the lines of one event (the text between two blank lines)."""
+        data: List[bytes] = []
+        event_type = b""
+        retry = None
+        for line in block.split(b"\n"):
+            # Empty lines only occur at the edges of a block and dispatch nothing
+            if not line or line[0] == 0x3A:  # ":" starts a comment (used for keep-alives)
+                continue
+            name, _, value = line.partition(b":")
+            if value[:1] == b" ":
+                value = value[1:]
+            if name == b"data":
+                data.append(value)
+            elif name == b"event":
+                event_type = value
+            elif name == b"id":
+                if b"\0" not in value:
+                    self.last_event_id = value.decode("utf-8", "replace")
+            elif name == b"retry" and value.isdigit():
+                retry = int(value)
+
+        if not data:
+            return None
+        return SSEEvent(
+            b"\n".join(data),
+            event_type.decode("utf-8", "replace") if event_type else "message",
+            self.last_event_id,
+            retry,
+        )
+
+
+class NDJSONDecoder:
+    """Incremental splitter for newline-delimited JSON streams.
+
+    Yields each non-blank line as bytes, ready for ``codec.loads()``. Lines
+    may end in LF or CRLF (the CR is JSON whitespace).
+    """
+
+    def __init__(self) -> None:
+        self._pending: List[bytes] = []
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Split a chunk of the stream and return the lines it completes."""
+        if _LF not in chunk:
+            if chunk:
+                self._pending.append(chunk)
+            return []
+        if self._pending:
+            self._pending.append(chunk)
+            chunk = b"".join(self._pending)
+            self._pending.clear()
+
+        lines = chunk.split(b"\n")
+        rest = lines.pop()
+        if rest:
+            self._pending.append(rest)
+        return [line for line in lines if line and not line.isspace()]
+
+    def flush(self) -> List[bytes]:
+        """Finish the stream, returning a last line without a trailing newline."""
+        line = b"".join(self._pending)
+        self._pending.clear()
+        return [line] if line and not line.isspace() else []
+
+
+def iter_sse_events(chunks: Iterable[bytes]) -> Iterator[SSEEvent]:
+    """Parse Server-Sent Events from byte chunks, e.g. ``response.iter_bytes()``."""
+    decoder = SSEDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.flush()
+
+
+async def aiter_sse_events(chunks: AsyncIterable[bytes]) -> AsyncIterator[SSEEvent]:
+    """Async version of iter_sse_events(), e.g. over ``response.aiter_bytes()``."""
+    decoder = SSEDecoder()
+    async for chunk in chunks:
+        for event in decoder.feed(chunk):
+            yield event
+    for event in decoder.flush():
+        yield event
+
+
+def iter_ndjson(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Split byte chunks of a newline-delimited JSON stream into lines."""
+    decoder = NDJSONDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.flush()
+
+
+async def aiter_ndjson(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Async version of iter_ndjson(), e.g. over ``response.aiter_bytes()``."""
+    decoder = NDJSONDecoder()
+    async for chunk in chunks:
+        for line in decoder.feed(chunk):
+            yield line
+    for line in decoder.flush():
+        yield line
@@ -1,10 +1,28 @@
+import asyncio
+import contextlib
+import sys
+import time
 import uuid
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 import httpx
 
 from justllms.core.models import Choice, Message, Role, Usage
+from justllms.core.sse import SSEEvent, aiter_sse_events, iter_sse_events
+from justllms.utils.codec import json_body
+from justllms.utils.token_counter import TokenCounter
 
 if TYPE_CHECKING:
     from justllms.core.base import BaseProvider
@@ -15,22 +33,30 @@ def parse_sse_stream(
     url: str,
     payload: Dict[str, Any],
     headers: Dict[str, str],
-    parse_chunk_fn: Callable[[str], Optional["StreamChunk"]],
+    parse_event_fn: Callable[[SSEEvent], Optional["StreamChunk"]],
     timeout: Optional[float] = None,
     error_prefix: str = "Streaming request",
+    client: Optional[httpx.Client] = None,
+    http2: bool = False,
 ) -> Iterator["StreamChunk"]:
     """Parse Server-Sent Events (SSE) stream from an HTTP endpoint.
 
     This is a shared helper for streaming responses that follow the SSE protocol.
-    Both OpenAI-compatible and Azure OpenAI providers use this format.
+    Both OpenAI-compatible and Azure OpenAI providers use this format. The
+    response bytes are parsed incrementally by SSEDecoder; a ``[DONE]`` event
+    ends the stream.
 
     Args:
         url: API endpoint URL.
         payload: Request payload (should have stream=True).
         headers: Request headers including authorization.
-        parse_chunk_fn: Callback to parse SSE line into StreamChunk.
+        parse_event_fn: Callback to parse an SSE event into a StreamChunk.
         timeout: Optional timeout in seconds.
         error_prefix: Prefix for error messages (e.g., "OpenAI streaming request").
+        client: Pooled HTTP client to send the request with. A short-lived client
+               is created for this stream only if none is given.
+        http2: Whether the short-lived client should negotiate HTTP/2. Ignored
+               when a pooled client is passed, which carries its own setting.
 
     Yields:
         StreamChunk objects parsed from the SSE stream.
@@ -41,23 +67,85 @@ def parse_sse_stream(
     from justllms.exceptions import ProviderError
 
     try:
-        with httpx.Client(timeout=timeout) as client, client.stream(
-            "POST", url, json=payload, headers=headers
-        ) as response:
+        with contextlib.ExitStack() as stack:
+            if client is None:
+                client = stack.enter_context(httpx.Client(timeout=timeout, http2=http2))
+            response = stack.enter_context(
+                client.stream("POST", url, timeout=timeout, **json_body(payload, headers))
+            )
             response.raise_for_status()
 
-            for line in response.iter_lines():
-                chunk = parse_chunk_fn(line)
+            for event in iter_sse_events(response.iter_bytes()):
+                if event.data == b"[DONE]":
+                    break
+                chunk = parse_event_fn(event)
                 if chunk is not None:
                     yield chunk
-                elif line.strip() == "data: [DONE]":
+    except (httpx.HTTPError, httpx.RequestError) as e:
+        raise ProviderError(f"{error_prefix} failed: {str(e)}") from e
+
+
+async def aparse_sse_stream(
+    url: str,
+    payload: Dict[str, Any],
+    headers: Dict[str, str],
+    parse_event_fn: Callable[[SSEEvent], Optional["StreamChunk"]],
+    timeout: Optional[float] = None,
+    error_prefix: str = "Streaming request",
+    client: Optional[httpx.AsyncClient] = None,
+    http2: bool = False,
+) -> AsyncIterator["StreamChunk"]:
+    """Async version of parse_sse_stream().
+
+    Args:
+        url: API endpoint URL.
+        payload: Request payload (should have stream=True).
+        headers: Request headers including authorization.
+        parse_event_fn: Callback to parse an SSE event into a StreamChunk.
+        timeout: Optional timeout in seconds.
+        error_prefix: Prefix for error messages (e.g., "OpenAI streaming request").
+        client: Pooled async HTTP client to send the request with. A short-lived
+               client is created for this stream only if none is given.
+        http2: Whether the short-lived client should negotiate HTTP/2. Ignored
+               when a pooled client is passed, which carries its own setting.
+
+    Yields:
+        StreamChunk objects parsed from the SSE stream.
+
+    Raises:
+        ProviderError: If the streaming request fails.
+    """
+    from justllms.exceptions import ProviderError
+
+    try:
+        async with contextlib.AsyncExitStack() as stack:
+            if client is None:
+                client = await stack.enter_async_context(
+                    httpx.AsyncClient(timeout=timeout, http2=http2)
+                )
+            response = await stack.enter_async_context(
+                client.stream("POST", url, timeout=timeout, **json_body(payload, headers))
+            )
+            response.raise_for_status()
+
+            async for event in aiter_sse_events(response.aiter_bytes()):
+                if event.data == b"[DONE]":
                     break
+                chunk = parse_event_fn(event)
+                if chunk is not None:
+                    yield chunk
     except (httpx.HTTPError, httpx.RequestError) as e:
         raise ProviderError(f"{error_prefix} failed: {str(e)}") from e
 
 
 class StreamChunk:
-    """Individual chunk from a streaming response."""
+    """Individual chunk from a streaming response.
+
+    One is created per streamed delta, so it is a plain slotted class
+    rather than a pydantic model.
+    """
+
+    __slots__ = ("content", "finish_reason", "usage", "raw")
 
     def __init__(
         self,
@@ -83,22 +171,40 @@ class StreamChunk:
 class StreamResponse:
     """Accumulates streaming chunks and builds final CompletionResponse."""
 
-    def __init__(self, provider: "BaseProvider", model: str, messages: List[Message]):
+    def __init__(
+        self,
+        provider: "BaseProvider",
+        model: str,
+        messages: List[Message],
+        cached: bool = False,
+        keep_content: bool = True,
+        keep_raw: bool = True,
+    ):
         """Initialize stream accumulator.
 
         Args:
             provider: Provider instance for cost estimation.
             model: Model name for token counting.
             messages: Original messages for token counting.
+            cached: Whether the chunks are replayed from cache (cost is then 0).
+            keep_content: Whether to keep the streamed text for the final
+                response. If False, only its length is tracked (for usage
+                estimates) and the final response has empty content.
+            keep_raw: Whether chunks keep their decoded provider data
+                (``chunk.raw``) after being accumulated.
         """
         self.provider = provider
         self.model = model
         self.messages = messages
+        self.cached = cached
         self.id = f"chatcmpl-{uuid.uuid4().hex[:29]}"
         self.created = int(datetime.now().timestamp())
         self._content_chunks: List[str] = []
         self._finish_reason: Optional[str] = None
         self._usage: Optional[Usage] = None
+        self._content_length = 0
+        self.keep_content = keep_content
+        self.keep_raw = keep_raw
         self.completed = False
 
     def accumulate(self, chunk: StreamChunk) -> None:
@@ -108,7 +214,13 @@ class StreamResponse:
             chunk: Stream chunk to accumulate.
         """
         if chunk.content:
-            self._content_chunks.append(chunk.content)
+            if self.keep_content:
+                self._content_chunks.append(chunk.content)
+            else:
+                self._content_length += len(chunk.content)
+        if not self.keep_raw and not self.cached:
+            # Replayed chunks are shared with the cache, which keeps their raw data
+            chunk.raw = None
         if chunk.finish_reason:
             self._finish_reason = chunk.finish_reason
         if chunk.usage:
@@ -144,7 +256,12 @@ class StreamResponse:
         # Build or estimate Usage
         if not self._usage:
             prompt_tokens = self.provider.count_message_tokens(self.messages, self.model)
-            completion_tokens = self.provider.count_tokens(message.content, self.model)
+            if self.keep_content:
+                completion_tokens = self.provider.count_tokens(message.content, self.model)
+            else:
+                completion_tokens = -(
+                    -self._content_length // TokenCounter.CHARS_PER_TOKEN["default"]
+                )
             self._usage = Usage(
                 prompt_tokens=prompt_tokens,
                 completion_tokens=completion_tokens,
@@ -152,9 +269,12 @@ class StreamResponse:
             )
 
         # Set cost on Usage object
-        self._usage.estimated_cost = self.provider.estimate_cost(self._usage, self.model)
+        if self.cached:
+            self._usage.estimated_cost = 0.0
+        else:
+            self._usage.estimated_cost = self.provider.estimate_cost(self._usage, self.model)
 
-        return CompletionResponse(
+        response = CompletionResponse(
             id=self.id,
             model=self.model,
             choices=[choice],
@@ -162,6 +282,8 @@ class StreamResponse:
             created=self.created,
             provider=self.provider.name,
         )
+        response.cached = self.cached
+        return response
 
 
 class SyncStreamResponse:
@@ -173,6 +295,7 @@ class SyncStreamResponse:
         model: str,
         messages: List[Message],
         raw_stream: Iterator[StreamChunk],
+        cached: bool = False,
     ):
         """Initialize sync stream response.
 
@@ -181,10 +304,13 @@ class SyncStreamResponse:
             model: Model name.
             messages: Original messages.
             raw_stream: Iterator of StreamChunks.
+            cached: Whether the chunks are replayed from cache.
         """
-        self.accumulator = StreamResponse(provider, model, messages)
+        self.accumulator = StreamResponse(provider, model, messages, cached=cached)
+        self.cached = cached
         self.raw_stream = raw_stream
         self._iterator_started = False
+        self._primed: Optional[Iterator[StreamChunk]] = None
 
     def __iter__(self) -> Iterator[StreamChunk]:
         """Iterate over stream chunks.
@@ -208,6 +334,76 @@ class SyncStreamResponse:
 
         self.accumulator.mark_complete()
 
+    def coalesce(
+        self, window: Optional[float] = 0.03, min_chars: Optional[int] = None
+    ) -> "SyncStreamResponse":
+        """Merge small deltas into fewer, larger chunks.
+
+        See coalesce_stream() for how chunks are merged. Must be called
+        before iteration starts.
+
+        Args:
+            window: Seconds of deltas to merge into one chunk, or None.
+            min_chars: Emit a merged chunk once it holds this many characters.
+
+        Returns:
+            SyncStreamResponse: This response, for chaining.
+
+        Raises:
+            RuntimeError: If iteration already started.
+            ValueError: If neither ``window`` nor ``min_chars`` is set.
+
+        Examples:
+            for chunk in client.completion.create(..., stream=True).coalesce(0.05):
+                websocket.send(chunk.content)
+        """
+        if self._iterator_started:
+            raise RuntimeError("Cannot coalesce a stream after iteration started")
+        if window is None and min_chars is None:
+            raise ValueError("Set a coalescing window, min_chars, or both")
+        self.raw_stream = coalesce_stream(self.raw_stream, window, min_chars)
+        return self
+
+    def passthrough(self, accumulate: bool = False, keep_raw: bool = False) -> "SyncStreamResponse":
+        """Relay chunks without keeping the text or provider data of the stream.
+
+        The final response then has empty content but still reports the
+        usage the provider sent (or an estimate from the text length) and
+        its cost, and memory per stream stays constant however long the
+        generation is. Also available as ``create(..., accumulate=False,
+        keep_raw=False)``.
+
+        Args:
+            accumulate: Keep the streamed text for get_final_response().
+            keep_raw: Keep each chunk's decoded provider data (``chunk.raw``).
+
+        Returns:
+            SyncStreamResponse: This response, for chaining.
+        """
+        self.accumulator.keep_content = accumulate
+        self.accumulator.keep_raw = keep_raw
+        return self
+
+    def prime(self) -> None:
+        """Send the request and wait for the first chunk without consuming it.
+
+        The chunk is buffered and yielded first when the stream is iterated.
+        """
+        if self._iterator_started:
+            return
+        iterator = iter(self.raw_stream)
+        first = next(iterator, None)
+        self._primed = iterator
+        self.raw_stream = _prepend_chunk(first, iterator)
+
+    def close(self) -> None:
+        """Abandon the stream and release its HTTP connection."""
+        # Closing a generator that never started doesn't close what it wraps
+        for stream in (self.raw_stream, self._primed):
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+
     def drain(self) -> None:
         """Consume remaining chunks without yielding.
 
@@ -248,6 +444,7 @@ class AsyncStreamResponse:
         model: str,
         messages: List[Message],
         async_stream: AsyncIterator[StreamChunk],
+        cached: bool = False,
     ):
         """Initialize async stream response.
 
@@ -256,10 +453,13 @@ class AsyncStreamResponse:
             model: Model name.
             messages: Original messages.
             async_stream: Async iterator of StreamChunks.
+            cached: Whether the chunks are replayed from cache.
         """
-        self.accumulator = StreamResponse(provider, model, messages)
+        self.accumulator = StreamResponse(provider, model, messages, cached=cached)
+        self.cached = cached
         self.async_stream = async_stream
         self._iterator_started = False
+        self._primed: Optional[AsyncIterator[StreamChunk]] = None
 
     async def __aiter__(self) -> AsyncIterator[StreamChunk]:
         """Async iterate over stream chunks.
@@ -283,6 +483,77 @@ class AsyncStreamResponse:
 
         self.accumulator.mark_complete()
 
+    def coalesce(
+        self, window: Optional[float] = 0.03, min_chars: Optional[int] = None
+    ) -> "AsyncStreamResponse":
+        """Merge small deltas into fewer, larger chunks.
+
+        See coalesce_stream() for how chunks are merged. Must be called
+        before iteration starts.
+
+        Args:
+            window: Seconds of deltas to merge into one chunk, or None.
+            min_chars: Emit a merged chunk once it holds this many characters.
+
+        Returns:
+            AsyncStreamResponse: This response, for chaining.
+
+        Raises:
+            RuntimeError: If iteration already started.
+            ValueError: If neither ``window`` nor ``min_chars`` is set.
+        """
+        if self._iterator_started:
+            raise RuntimeError("Cannot coalesce a stream after iteration started")
+        if window is None and min_chars is None:
+            raise ValueError("Set a coalescing window, min_chars, or both")
+        self.async_stream = acoalesce_stream(self.async_stream, window, min_chars)
+        return self
+
+    def passthrough(
+        self, accumulate: bool = False, keep_raw: bool = False
+    ) -> "AsyncStreamResponse":
+        """Relay chunks without keeping the text or provider data of the stream.
+
+        The final response then has empty content but still reports the
+        usage the provider sent (or an estimate from the text length) and
+        its cost, and memory per stream stays constant however long the
+        generation is. Also available as ``create(..., accumulate=False,
+        keep_raw=False)``.
+
+        Args:
+            accumulate: Keep the streamed text for get_final_response().
+            keep_raw: Keep each chunk's decoded provider data (``chunk.raw``).
+
+        Returns:
+            AsyncStreamResponse: This response, for chaining.
+        """
+        self.accumulator.keep_content = accumulate
+        self.accumulator.keep_raw = keep_raw
+        return self
+
+    async def aprime(self) -> None:
+        """Send the request and wait for the first chunk without consuming it.
+
+        The chunk is buffered and yielded first when the stream is iterated.
+        """
+        if self._iterator_started:
+            return
+        iterator = self.async_stream.__aiter__()
+        try:
+            first: Optional[StreamChunk] = await iterator.__anext__()
+        except StopAsyncIteration:
+            first = None
+        self._primed = iterator
+        self.async_stream = _aprepend_chunk(first, iterator)
+
+    async def aclose(self) -> None:
+        """Abandon the stream and release its HTTP connection."""
+        # Closing a generator that never started doesn't close what it wraps
+        for stream in (self.async_stream, self._primed):
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
     async def drain(self) -> None:
         """Consume remaining chunks without yielding.
 
@@ -312,3 +583,305 @@ class AsyncStreamResponse:
         if not self.accumulator.completed:
             await self.drain()
         return self.accumulator.to_completion_response()
+
+
+def record_stream(
+    stream: Iterator[StreamChunk],
+    on_complete: Callable[[List[Tuple[float, StreamChunk]]], Any],
+) -> Iterator[StreamChunk]:
+    """Pass chunks through while recording them with their timing.
+
+    Offsets are seconds since the first chunk, so time-to-first-chunk is not
+    part of the recording. ``on_complete`` receives the (offset, chunk) pairs
+    only if the stream ends normally; errors and early closes record nothing.
+
+    Args:
+        stream: Stream to record.
+        on_complete: Called with the recording once the stream is exhausted.
+
+    Yields:
+        The chunks of ``stream``, unchanged.
+    """
+    recorded: List[Tuple[float, StreamChunk]] = []
+    start: Optional[float] = None
+    try:
+        for chunk in stream:
+            now = time.monotonic()
+            if start is None:
+                start = now
+            recorded.append((now - start, chunk))
+            yield chunk
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            close()
+    on_complete(recorded)
+
+
+async def arecord_stream(
+    stream: AsyncIterator[StreamChunk],
+    on_complete: Callable[[List[Tuple[float, StreamChunk]]], Any],
+) -> AsyncIterator[StreamChunk]:
+    """Async version of record_stream(); ``on_complete`` runs in the default executor."""
+    recorded: List[Tuple[float, StreamChunk]] = []
+    start: Optional[float] = None
+    try:
+        async for chunk in stream:
+            now = time.monotonic()
+            if start is None:
+                start = now
+            recorded.append((now - start, chunk))
+            yield chunk
+    finally:
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    await asyncio.get_running_loop().run_in_executor(None, on_complete, recorded)
+
+
+def track_stream(
+    stream: Iterator[StreamChunk], tracker: ContextManager[None]
+) -> Iterator[StreamChunk]:
+    """Pass chunks through, reporting how the stream ended to an entered context manager.
+
+    ``tracker`` is exited once: without an exception when the stream is
+    exhausted, with the error when it fails, and with GeneratorExit when it
+    is closed early.
+
+    Args:
+        stream: Stream to track.
+        tracker: Context manager already entered when the stream was started.
+
+    Yields:
+        The chunks of ``stream``, unchanged.
+    """
+    try:
+        yield from stream
+    except BaseException:
+        tracker.__exit__(*sys.exc_info())
+        raise
+    else:
+        tracker.__exit__(None, None, None)
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            close()
+
+
+async def atrack_stream(
+    stream: AsyncIterator[StreamChunk], tracker: ContextManager[None]
+) -> AsyncIterator[StreamChunk]:
+    """Async version of track_stream(); cancellation is reported like an early close."""
+    try:
+        async for chunk in stream:
+            yield chunk
+    except BaseException:
+        tracker.__exit__(*sys.exc_info())
+        raise
+    else:
+        tracker.__exit__(None, None, None)
+    finally:
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def replay_stream(
+    recorded: List[Tuple[float, StreamChunk]], speed: Optional[float] = None
+) -> Iterator[StreamChunk]:
+    """Yield recorded chunks, either at once or paced like the original stream.
+
+    Args:
+        recorded: (offset, chunk) pairs as produced by record_stream().
+        speed: Multiple of the original pace (1.0 = as recorded, 2.0 = twice as
+            fast). None or 0 yields all chunks immediately.
+
+    Yields:
+        The recorded chunks.
+    """
+    start = time.monotonic()
+    for offset, chunk in recorded:
+        if speed:
+            delay = start + offset / speed - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        yield chunk
+
+
+async def areplay_stream(
+    recorded: List[Tuple[float, StreamChunk]], speed: Optional[float] = None
+) -> AsyncIterator[StreamChunk]:
+    """Async version of replay_stream()."""
+    start = time.monotonic()
+    for offset, chunk in recorded:
+        if speed:
+            delay = start + offset / speed - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        yield chunk
+
+
+def coalesce_stream(
+    stream: Iterator[StreamChunk],
+    window: Optional[float] = 0.03,
+    min_chars: Optional[int] = None,
+) -> Iterator[StreamChunk]:
+    """Merge consecutive deltas of a stream into fewer, larger chunks.
+
+    The first delta is yielded at once, so time to first token is unchanged.
+    Later deltas are buffered until ``window`` seconds have passed since the
+    first buffered one or the buffered text reaches ``min_chars``, whichever
+    comes first, and then yielded as one chunk. Here the window is
+    best-effort: it is checked when a delta arrives, so during a pause in
+    the stream buffered text waits for the next delta (or the end of the
+    stream). acoalesce_stream() flushes on time instead. A chunk carrying a
+    finish reason or usage is merged and yielded at once. A merged chunk
+    has the concatenated content, the latest finish reason and usage, and
+    the ``raw`` data of its last delta.
+
+    Args:
+        stream: Stream to coalesce.
+        window: Seconds of deltas to merge into one chunk, or None to merge
+            by size only.
+        min_chars: Yield once the merged text is at least this long, or None
+            to merge by time only.
+
+    Yields:
+        Merged StreamChunks.
+
+    Raises:
+        ValueError: If neither ``window`` nor ``min_chars`` is set.
+    """
+    if window is None and min_chars is None:
+        raise ValueError("Set a coalescing window, min_chars, or both")
+    buffer = _ChunkBuffer(window, min_chars)
+    try:
+        for chunk in stream:
+            if buffer.add(chunk):
+                yield buffer.pop()
+        if buffer.chunks:
+            yield buffer.pop()
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            close()
+
+
+async def acoalesce_stream(
+    stream: AsyncIterator[StreamChunk],
+    window: Optional[float] = 0.03,
+    min_chars: Optional[int] = None,
+) -> AsyncIterator[StreamChunk]:
+    """Async version of coalesce_stream().
+
+    Unlike the sync version, buffered text is yielded once ``window`` has
+    passed even if the provider pauses before the next delta.
+    """
+    if window is None and min_chars is None:
+        raise ValueError("Set a coalescing window, min_chars, or both")
+    buffer = _ChunkBuffer(window, min_chars)
+    iterator = stream.__aiter__()
+    # Wait for the next delta in a task, so a timeout doesn't cancel the stream
+    pending: Optional[asyncio.Future[StreamChunk]] = None
+    try:
+        while True:
+            if buffer.chunks and window is not None:
+                if pending is None:
+                    pending = asyncio.ensure_future(iterator.__anext__())
+                done, _ = await asyncio.wait(
+                    {pending}, timeout=max(buffer.deadline - time.monotonic(), 0.0)
+                )
+                if not done:
+                    yield buffer.pop()
+                    continue
+            try:
+                chunk = await (pending if pending is not None else iterator.__anext__())
+            except StopAsyncIteration:
+                break
+            pending = None
+            if buffer.add(chunk):
+                yield buffer.pop()
+        if buffer.chunks:
+            yield buffer.pop()
+    finally:
+        if pending is not None:
+            pending.cancel()
+            with contextlib.suppress(Exception, asyncio.CancelledError):
+                await pending
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+class _ChunkBuffer:
+    """Deltas waiting to be merged by coalesce_stream()."""
+
+    def __init__(self, window: Optional[float], min_chars: Optional[int]):
+        self.window = window
+        self.min_chars = min_chars
+        self.chunks: List[StreamChunk] = []
+        self.chars = 0
+        self.deadline = 0.0
+        self.started = False
+
+    def add(self, chunk: StreamChunk) -> bool:
+        """Buffer a delta and return whether the buffer should be yielded now."""
+        if not self.started:
+            self.started = True
+            self.chunks.append(chunk)
+            return True
+        if not self.chunks and self.window is not None:
+            self.deadline = time.monotonic() + self.window
+        self.chunks.append(chunk)
+        if chunk.finish_reason or chunk.usage:
+            return True
+        if chunk.content:
+            self.chars += len(chunk.content)
+            if self.min_chars is not None and self.chars >= self.min_chars:
+                return True
+        return self.window is not None and time.monotonic() >= self.deadline
+
+    def pop(self) -> StreamChunk:
+        """Merge the buffered deltas into one chunk and empty the buffer."""
+        chunks = self.chunks
+        self.chunks = []
+        self.chars = 0
+        if len(chunks) == 1:
+            return chunks[0]
+
+        finish_reason = None
+        usage = None
+        for chunk in chunks:
+            finish_reason = chunk.finish_reason or finish_reason
+            usage = chunk.usage or usage
+        content = "".join([chunk.content for chunk in chunks if chunk.content])
+        return StreamChunk(
+            content=content or None,
+            finish_reason=finish_reason,
+            usage=usage,
+            raw=chunks[-1].raw,
+        )
+
+
+def _prepend_chunk(
+    first: Optional[StreamChunk], rest: Iterator[StreamChunk]
+) -> Iterator[StreamChunk]:
+    """Yield an already received chunk, then the rest of the stream."""
+    if first is not None:
+        yield first
+    yield from rest
+
+
+async def _aprepend_chunk(
+    first: Optional[StreamChunk], rest: AsyncIterator[StreamChunk]
+) -> AsyncIterator[StreamChunk]:
+    """Async version of _prepend_chunk() that closes ``rest`` when closed early."""
+    try:
+        if first is not None:
+            yield first
+        async for chunk in rest:
+            yield chunk
+    finally:
+        aclose = getattr(rest, "aclose", None)
+        if aclose is not None:
+            await aclose()
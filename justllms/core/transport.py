@@ -0,0 +1,187 @@
+import asyncio
+import threading
+import warnings
+from typing import TYPE_CHECKING, Any, Optional
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
+if TYPE_CHECKING:
+    from justllms.core.models import ProviderConfig
+
+DEFAULT_TIMEOUT = 300.0
+
+
+class HTTPTransport:
+    """Long-lived pooled HTTP client owned by a single provider.
+
+    Each provider talks to one upstream host, so the pool limits configured
+    here effectively act as per-host limits. The underlying ``httpx.Client`` is
+    created lazily on first use and reused for every completion and stream,
+    which means the TCP/TLS handshake is paid once instead of per request.
+    An ``httpx.AsyncClient`` with the same limits backs the async API and is
+    shared by every coroutine running on the same event loop.
+
+    With ``http2=True`` requests to the host are multiplexed as concurrent
+    streams over a few HTTP/2 connections instead of one socket per in-flight
+    request. HTTP/2 is negotiated via TLS ALPN, so plain ``http://`` endpoints
+    keep using HTTP/1.1. Requires the optional ``h2`` package; without it the
+    transport warns and falls back to HTTP/1.1.
+
+    Args:
+        max_connections: Maximum number of concurrent connections in the pool.
+        max_keepalive_connections: Maximum number of idle connections kept alive.
+        keepalive_expiry: Seconds an idle connection is kept before closing.
+        http2: Whether to negotiate HTTP/2 with the provider host.
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+    ):
+        if http2 and not HAS_H2:
+            warnings.warn(
+                "HTTP/2 support requires the 'h2' package; falling back to HTTP/1.1. "
+                "Install it with: pip install 'justllms[http2]'",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            http2 = False
+        self.http2 = http2
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: "ProviderConfig") -> "HTTPTransport":
+        """Build a transport using the pool settings from a provider config.
+
+        Args:
+            config: Provider configuration with connection pool settings.
+
+        Returns:
+            HTTPTransport configured with the provider's limits.
+        """
+        return cls(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+            http2=config.http2,
+        )
+
+    @property
+    def client(self) -> httpx.Client:
+        """Get the pooled sync client, creating it on first access.
+
+        A closed transport transparently reopens a fresh pool when used again.
+        """
+        client = self._client
+        if client is None or client.is_closed:
+            with self._lock:
+                client = self._client
+                if client is None or client.is_closed:
+                    client = httpx.Client(
+                        limits=self.limits, timeout=DEFAULT_TIMEOUT, http2=self.http2
+                    )
+                    self._client = client
+        return client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Get the pooled async client for the running event loop.
+
+        Async connections are bound to the loop that opened them, so a new pool
+        is created when the transport is first used from a different loop
+        (e.g. across successive ``asyncio.run()`` calls).
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_client
+        if client is None or client.is_closed or self._async_loop is not loop:
+            with self._lock:
+                client = self._async_client
+                if client is None or client.is_closed or self._async_loop is not loop:
+                    previous, previous_loop = self._async_client, self._async_loop
+                    client = httpx.AsyncClient(
+                        limits=self.limits, timeout=DEFAULT_TIMEOUT, http2=self.http2
+                    )
+                    self._async_client = client
+                    self._async_loop = loop
+                    if previous is not None and not previous.is_closed:
+                        _discard_async_client(previous, previous_loop)
+        return client
+
+    def close(self) -> None:
+        """Close the sync pool and release all of its connections.
+
+        The async pool can only be closed from its event loop; use ``aclose()``.
+        """
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Close both the sync and the async pool."""
+        self.close()
+        with self._lock:
+            client, self._async_client = self._async_client, None
+            loop, self._async_loop = self._async_loop, None
+        if client is None:
+            return
+        if loop is asyncio.get_running_loop():
+            await client.aclose()
+        else:
+            _discard_async_client(client, loop)
+
+    def __enter__(self) -> "HTTPTransport":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "HTTPTransport":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+def _discard_async_client(
+    client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]
+) -> None:
+    """Close an async client left behind on another event loop.
+
+    If that loop is still running, ``aclose()`` is scheduled on it. Otherwise
+    (typically after ``asyncio.run()`` returned) the loop can no longer run
+    the close, so the pooled sockets are closed directly.
+    """
+    if loop is not None and loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        return
+
+    pool = getattr(client._transport, "_pool", None)
+    for connection in getattr(pool, "connections", ()):
+        # httpcore keeps the stream on the protocol-level connection
+        stream = getattr(getattr(connection, "_connection", None), "_network_stream", None)
+        transport: Any = getattr(getattr(stream, "_stream", None), "_transport", None)
+        sock = getattr(transport, "_sock", None)
+        if sock is not None:
+            # The loop is gone, so close the socket in its place and
+            # detach it from the transport, which would warn about it
+            sock.close()
+            transport._sock = None
@@ -36,6 +36,7 @@ class ProviderError(JustLLMsError):
         provider: Name of the provider that generated the error.
         status_code: HTTP status code if applicable.
         response_body: Raw response body from the provider API.
+        headers: Response headers, used for retry and rate-limit hints.
         **kwargs: Additional arguments passed to parent JustLLMsError.
     """
 
@@ -45,12 +46,14 @@ class ProviderError(JustLLMsError):
         provider: Optional[str] = None,
         status_code: Optional[int] = None,
         response_body: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
         **kwargs: Any,
     ):
         super().__init__(message, **kwargs)
         self.provider = provider
         self.status_code = status_code
         self.response_body = response_body
+        self.headers = headers or {}
 
 
 class ValidationError(JustLLMsError):
@@ -74,7 +77,7 @@ class RateLimitError(ProviderError):
     def __init__(
         self,
         message: str,
-        retry_after: Optional[int] = None,
+        retry_after: Optional[float] = None,
         **kwargs: Any,
     ):
         super().__init__(message, **kwargs)
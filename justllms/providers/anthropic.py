@@ -1,8 +1,13 @@
-from typing import Any, Dict, List, Optional
+import functools
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from justllms.core.base import BaseProvider, BaseResponse
-from justllms.core.models import Choice, Message, ModelInfo, Role, Usage
+from justllms.core.models import BatchJob, BatchStatus, Choice, Message, ModelInfo, Role, Usage
+from justllms.exceptions import ProviderError
 from justllms.tools.adapters.base import BaseToolAdapter
+from justllms.utils import codec
 
 
 class AnthropicResponse(BaseResponse):
@@ -17,6 +22,11 @@ class AnthropicProvider(BaseProvider):
     supports_tools = True
     """Anthropic Claude supports tool use."""
 
+    supports_batch = True
+    """Anthropic supports the Message Batches API."""
+
+    batch_cost_factor = 0.5
+
     MODELS = {
         "claude-opus-4.1": ModelInfo(
             name="claude-opus-4.1",
@@ -125,6 +135,16 @@ class AnthropicProvider(BaseProvider):
 
     def _parse_response(self, response_data: Dict[str, Any], model: str) -> AnthropicResponse:
         """Parse Anthropic API response."""
+        return self._create_base_response(  # type: ignore[return-value]
+            AnthropicResponse,
+            response_data,
+            functools.partial(self._parse_choices, response_data),
+            functools.partial(self._parse_usage, response_data.get("usage", {})),
+            model,
+        )
+
+    def _parse_choices(self, response_data: Dict[str, Any]) -> List[Choice]:
+        """Build the single Choice of a Messages API response."""
         content = response_data.get("content", [])
 
         text_content = ""
@@ -143,39 +163,22 @@ class AnthropicProvider(BaseProvider):
             message=message,
             finish_reason=response_data.get("stop_reason"),
         )
+        return [choice]
 
-        usage_data = response_data.get("usage", {})
-        usage = Usage(
+    def _parse_usage(self, usage_data: Dict[str, Any]) -> Usage:
+        """Build Usage from Anthropic's input/output token counts."""
+        return Usage(
             prompt_tokens=usage_data.get("input_tokens", 0),
             completion_tokens=usage_data.get("output_tokens", 0),
             total_tokens=usage_data.get("input_tokens", 0) + usage_data.get("output_tokens", 0),
         )
 
-        return self._create_base_response(  # type: ignore[return-value]
-            AnthropicResponse,
-            response_data,
-            [choice],
-            usage,
-            model,
-        )
-
-    def complete(
-        self,
-        messages: List[Message],
-        model: str,
-        timeout: Optional[float] = None,
-        **kwargs: Any,
-    ) -> BaseResponse:
-        """Synchronous completion.
-
-        Args:
-            messages: List of messages for the completion.
-            model: Model identifier to use.
-            timeout: Optional timeout in seconds. If None, no timeout is enforced.
-            **kwargs: Additional provider-specific parameters.
-        """
-        url = f"{self.config.api_base or 'https://api.anthropic.com'}/v1/messages"
+    def _get_api_endpoint(self) -> str:
+        """Get the Messages API endpoint."""
+        return f"{self.config.api_base or 'https://api.anthropic.com'}/v1/messages"
 
+    def _build_payload(self, messages: List[Message], model: str, **kwargs: Any) -> Dict[str, Any]:
+        """Build a Messages API request payload from common parameters."""
         system_message, formatted_messages = self._format_messages(messages)
 
         payload = {
@@ -197,9 +200,50 @@ class AnthropicProvider(BaseProvider):
                 kwargs["stop"] if isinstance(kwargs["stop"], list) else [kwargs["stop"]]
             )
 
+        return payload
+
+    def complete(
+        self,
+        messages: List[Message],
+        model: str,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> BaseResponse:
+        """Synchronous completion.
+
+        Args:
+            messages: List of messages for the completion.
+            model: Model identifier to use.
+            timeout: Optional timeout in seconds. If None, no timeout is enforced.
+            **kwargs: Additional provider-specific parameters.
+        """
         response_data = self._make_http_request(
-            url=url,
-            payload=payload,
+            url=self._get_api_endpoint(),
+            payload=self._build_payload(messages, model, **kwargs),
+            headers=self._get_headers(),
+            timeout=timeout,
+        )
+
+        return self._parse_response(response_data, model)
+
+    async def acomplete(
+        self,
+        messages: List[Message],
+        model: str,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> BaseResponse:
+        """Asynchronous completion.
+
+        Args:
+            messages: List of messages for the completion.
+            model: Model identifier to use.
+            timeout: Optional timeout in seconds. If None, no timeout is enforced.
+            **kwargs: Additional provider-specific parameters.
+        """
+        response_data = await self._amake_http_request(
+            url=self._get_api_endpoint(),
+            payload=self._build_payload(messages, model, **kwargs),
             headers=self._get_headers(),
             timeout=timeout,
         )
@@ -211,3 +255,100 @@ class AnthropicProvider(BaseProvider):
         from justllms.tools.adapters.anthropic import AnthropicToolAdapter
 
         return AnthropicToolAdapter()
+
+    def create_batch(
+        self, requests: List[Tuple[str, List[Message], Dict[str, Any]]], model: str
+    ) -> BatchJob:
+        """Submit the requests as a Message Batch."""
+        job_data = self._make_http_request(
+            url=f"{self._get_api_endpoint()}/batches",
+            payload={
+                "requests": [
+                    {
+                        "custom_id": custom_id,
+                        "params": self._build_payload(messages, model, **params),
+                    }
+                    for custom_id, messages, params in requests
+                ]
+            },
+            headers=self._get_headers(),
+            retry=False,
+        )
+        return self._parse_batch_job(job_data, model)
+
+    def retrieve_batch(self, batch_id: str) -> BatchJob:
+        """Fetch a Message Batch."""
+        job_data = self._make_http_request(
+            url=f"{self._get_api_endpoint()}/batches/{batch_id}",
+            payload={},
+            headers=self._get_headers(),
+            method="GET",
+        )
+        return self._parse_batch_job(job_data)
+
+    def cancel_batch(self, batch_id: str) -> BatchJob:
+        """Cancel a Message Batch; requests already processed keep their results."""
+        job_data = self._make_http_request(
+            url=f"{self._get_api_endpoint()}/batches/{batch_id}/cancel",
+            payload={},
+            headers=self._get_headers(),
+        )
+        return self._parse_batch_job(job_data)
+
+    def iter_batch_results(
+        self, job: BatchJob
+    ) -> Iterator[Tuple[str, Optional[BaseResponse], Optional[Exception]]]:
+        """Stream results from the batch's results_url (JSONL)."""
+        results_url = job.raw.get("results_url")
+        if not results_url:
+            return
+        for line in self._iter_remote_lines(results_url, headers=self._get_headers()):
+            if not line.strip():
+                continue
+            item = codec.loads(line)
+            result = item.get("result") or {}
+            if result.get("type") == "succeeded":
+                message = result["message"]
+                yield item["custom_id"], self._parse_response(
+                    message, message.get("model") or job.model or ""
+                ), None
+            else:
+                error = result.get("error") or result
+                yield item["custom_id"], None, ProviderError(
+                    f"anthropic batch request {result.get('type', 'failed')}: {error}",
+                    provider=self.name,
+                    response_body=json.dumps(error),
+                )
+
+    def _parse_batch_job(self, job_data: Dict[str, Any], model: Optional[str] = None) -> BatchJob:
+        """Convert a Message Batch object to a BatchJob."""
+        counts = job_data.get("request_counts") or {}
+        processing_status = job_data.get("processing_status")
+        if processing_status == "ended":
+            status = (
+                BatchStatus.CANCELLED
+                if job_data.get("cancel_initiated_at")
+                else BatchStatus.COMPLETED
+            )
+        elif processing_status == "canceling":
+            status = BatchStatus.CANCELLING
+        else:
+            status = BatchStatus.IN_PROGRESS
+
+        failed = counts.get("errored", 0) + counts.get("canceled", 0) + counts.get("expired", 0)
+        created_at = job_data.get("created_at")
+        return BatchJob(
+            id=job_data["id"],
+            provider=self.name,
+            model=model,
+            status=status,
+            total=counts.get("processing", 0) + counts.get("succeeded", 0) + failed,
+            succeeded=counts.get("succeeded", 0),
+            failed=failed,
+            created_at=(
+                int(datetime.fromisoformat(created_at[:19] + "+00:00").timestamp())
+                if created_at
+                else None
+            ),
+            raw=job_data,
+        )
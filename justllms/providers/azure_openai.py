@@ -1,15 +1,14 @@
+import functools
 import json
 import logging
-from typing import Any, Dict, List, Optional
-
-import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 from justllms.core.base import DEFAULT_TIMEOUT, BaseProvider, BaseResponse
 from justllms.core.models import Choice, Message, ModelInfo, Usage
-from justllms.core.streaming import StreamChunk, SyncStreamResponse
-from justllms.exceptions import ProviderError
+from justllms.core.sse import SSEEvent
+from justllms.core.streaming import AsyncStreamResponse, StreamChunk, SyncStreamResponse
 from justllms.tools.adapters.base import BaseToolAdapter
+from justllms.utils import codec
 
 logger = logging.getLogger(__name__)
 
@@ -251,9 +250,19 @@ class AzureOpenAIProvider(BaseProvider):
 
     def _parse_response(self, response_data: Dict[str, Any]) -> AzureOpenAIResponse:
         """Parse Azure OpenAI API response (same format as OpenAI)."""
+        return self._create_base_response(  # type: ignore[return-value]
+            AzureOpenAIResponse,
+            response_data,
+            functools.partial(self._parse_choices, response_data.get("choices", [])),
+            functools.partial(self._create_standard_usage, response_data.get("usage", {})),
+            response_data.get("model", ""),
+        )
+
+    def _parse_choices(self, choices_data: List[Dict[str, Any]]) -> List[Choice]:
+        """Build Choice objects, including logprobs, from an Azure OpenAI response."""
         choices = []
 
-        for choice_data in response_data.get("choices", []):
+        for choice_data in choices_data:
             message_data = choice_data.get("message", {})
             message = Message(
                 role=message_data.get("role", "assistant"),
@@ -271,51 +280,10 @@ class AzureOpenAIProvider(BaseProvider):
             )
             choices.append(choice)
 
-        usage_data = response_data.get("usage", {})
-        usage = Usage(
-            prompt_tokens=usage_data.get("prompt_tokens", 0),
-            completion_tokens=usage_data.get("completion_tokens", 0),
-            total_tokens=usage_data.get("total_tokens", 0),
-        )
-
-        # Extract only the keys we want to avoid conflicts
-        raw_response = {
-            k: v
-            for k, v in response_data.items()
-            if k not in ["id", "model", "choices", "usage", "created", "system_fingerprint"]
-        }
-
-        return AzureOpenAIResponse(
-            id=response_data.get("id", ""),
-            model=response_data.get("model", ""),
-            choices=choices,
-            usage=usage,
-            created=response_data.get("created"),
-            system_fingerprint=response_data.get("system_fingerprint"),
-            **raw_response,
-        )
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-    )
-    def complete(
-        self,
-        messages: List[Message],
-        model: str,
-        timeout: Optional[float] = None,
-        **kwargs: Any,
-    ) -> BaseResponse:
-        """Synchronous completion with parameter filtering.
-
-        Args:
-            messages: List of messages for the completion.
-            model: Model identifier to use.
-            timeout: Optional timeout in seconds. If None, no timeout is enforced.
-            **kwargs: Additional provider-specific parameters.
-        """
-        url = self._build_url(model)
+        return choices
 
+    def _build_completion_payload(self, messages: List[Message], **kwargs: Any) -> Dict[str, Any]:
+        """Build a chat completions payload, passing through unknown parameters."""
         supported_params = {
             "temperature",
             "top_p",
@@ -329,6 +297,7 @@ class AzureOpenAIProvider(BaseProvider):
             "response_format",
             "seed",
             "user",
+            "stream_options",
             "logprobs",
             "top_logprobs",
             "logit_bias",
@@ -350,64 +319,96 @@ class AzureOpenAIProvider(BaseProvider):
                     logger.debug(f"Unknown parameter '{key}' passed to Azure OpenAI API")
                     payload[key] = value
 
-        from justllms.core.base import DEFAULT_TIMEOUT
+        return payload
 
-        timeout_config = timeout if timeout is not None else DEFAULT_TIMEOUT
+    def complete(
+        self,
+        messages: List[Message],
+        model: str,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> BaseResponse:
+        """Synchronous completion with parameter filtering.
 
-        with httpx.Client(timeout=timeout_config) as client:
-            response = client.post(
-                url,
-                json=payload,
-                headers=self._get_headers(),
-            )
+        Args:
+            messages: List of messages for the completion.
+            model: Model identifier to use.
+            timeout: Optional timeout in seconds. If None, no timeout is enforced.
+            **kwargs: Additional provider-specific parameters.
+        """
+        response_data = self._make_http_request(
+            url=self._build_url(model),
+            payload=self._build_completion_payload(messages, **kwargs),
+            headers=self._get_headers(),
+            timeout=timeout,
+        )
+
+        return self._parse_response(response_data)
+
+    async def acomplete(
+        self,
+        messages: List[Message],
+        model: str,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> BaseResponse:
+        """Asynchronous completion with parameter filtering.
 
-            if response.status_code != 200:
-                raise ProviderError(
-                    f"Azure OpenAI API error: {response.status_code} - {response.text}"
-                )
+        Args:
+            messages: List of messages for the completion.
+            model: Model identifier to use.
+            timeout: Optional timeout in seconds. If None, no timeout is enforced.
+            **kwargs: Additional provider-specific parameters.
+        """
+        response_data = await self._amake_http_request(
+            url=self._build_url(model),
+            payload=self._build_completion_payload(messages, **kwargs),
+            headers=self._get_headers(),
+            timeout=timeout,
+        )
 
-            return self._parse_response(response.json())
+        return self._parse_response(response_data)
 
-    def _parse_sse_line(self, line: str) -> Optional[StreamChunk]:
-        """Parse a single SSE line into a StreamChunk.
+    def _parse_sse_event(self, event: SSEEvent) -> Optional[StreamChunk]:
+        """Parse a single SSE event into a StreamChunk.
 
         Uses OpenAI-compatible SSE format parsing.
 
         Args:
-            line: Raw SSE line to parse.
+            event: Event decoded from the response stream.
 
         Returns:
-            StreamChunk if line contains valid data, None otherwise.
+            StreamChunk if the event contains content, None otherwise.
         """
-        line = line.strip()
-        if not line:
-            return None
-
-        if not line.startswith("data: "):
+        try:
+            chunk_data = codec.loads(event.data)
+        except json.JSONDecodeError:
+            logger.warning(f"Failed to parse SSE chunk: {event.data.decode('utf-8', 'replace')}")
             return None
 
-        data = line[6:]  # Remove "data: " prefix
-
-        if data == "[DONE]":
-            return None  # Signal end of stream
+        content = finish_reason = None
+        choices = chunk_data.get("choices")
+        if choices:
+            content = choices[0].get("delta", {}).get("content")
+            finish_reason = choices[0].get("finish_reason")
+
+        # Sent in a final chunk without choices when stream_options.include_usage is set
+        usage = None
+        usage_data = chunk_data.get("usage")
+        if usage_data:
+            usage = Usage(
+                prompt_tokens=usage_data.get("prompt_tokens", 0),
+                completion_tokens=usage_data.get("completion_tokens", 0),
+                total_tokens=usage_data.get("total_tokens", 0),
+            )
 
-        try:
-            chunk_data = json.loads(data)
-            choices = chunk_data.get("choices", [])
-
-            if choices:
-                delta = choices[0].get("delta", {})
-                content = delta.get("content")
-                finish_reason = choices[0].get("finish_reason")
-
-                if content or finish_reason:
-                    return StreamChunk(
-                        content=content,
-                        finish_reason=finish_reason,
-                        raw=chunk_data,
-                    )
-        except json.JSONDecodeError:
-            logger.warning(f"Failed to parse SSE chunk: {data}")
+        if content or finish_reason or usage:
+            return StreamChunk(
+                content=content,
+                finish_reason=finish_reason,
+                usage=usage,
+                raw=chunk_data,
+            )
 
         return None
 
@@ -429,9 +430,46 @@ class AzureOpenAIProvider(BaseProvider):
         Returns:
             SyncStreamResponse: Streaming response iterator.
         """
-        url = self._build_url(model)
+        raw_stream = self._stream_sse_response(
+            url=self._build_url(model),
+            payload=self._build_stream_payload(messages, **kwargs),
+            timeout=timeout,
+        )
+
+        return SyncStreamResponse(
+            provider=self, model=model, messages=messages, raw_stream=raw_stream
+        )
+
+    async def astream(
+        self,
+        messages: List[Message],
+        model: str,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> AsyncStreamResponse:
+        """Async stream completion using Server-Sent Events.
 
-        # Build payload with streaming enabled
+        Args:
+            messages: Conversation messages to process.
+            model: Model identifier for the request.
+            timeout: Optional timeout in seconds.
+            **kwargs: Additional parameters.
+
+        Returns:
+            AsyncStreamResponse: Async streaming response iterator.
+        """
+        raw_stream = self._astream_sse_response(
+            url=self._build_url(model),
+            payload=self._build_stream_payload(messages, **kwargs),
+            timeout=timeout,
+        )
+
+        return AsyncStreamResponse(
+            provider=self, model=model, messages=messages, async_stream=raw_stream
+        )
+
+    def _build_stream_payload(self, messages: List[Message], **kwargs: Any) -> Dict[str, Any]:
+        """Build a streaming payload, dropping unsupported parameters."""
         payload: Dict[str, Any] = {
             "messages": self._format_messages(messages),
             "stream": True,
@@ -450,6 +488,7 @@ class AzureOpenAIProvider(BaseProvider):
             "response_format",
             "seed",
             "user",
+            "stream_options",
             "logprobs",
             "top_logprobs",
             "logit_bias",
@@ -464,22 +503,45 @@ class AzureOpenAIProvider(BaseProvider):
                 elif key in supported_params:
                     payload[key] = value
 
+        return payload
+
+    def _stream_sse_response(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> Iterator[StreamChunk]:
+        """Stream an SSE response from the Azure deployment endpoint."""
         # Use shared SSE parsing helper
         from justllms.core.streaming import parse_sse_stream
 
-        timeout_config = timeout if timeout is not None else DEFAULT_TIMEOUT
-
-        raw_stream = parse_sse_stream(
+        return parse_sse_stream(
             url=url,
             payload=payload,
             headers=self._get_headers(),
-            parse_chunk_fn=self._parse_sse_line,
-            timeout=timeout_config,
+            parse_event_fn=self._parse_sse_event,
+            timeout=timeout if timeout is not None else DEFAULT_TIMEOUT,
             error_prefix="Azure OpenAI streaming request",
+            client=self.http_client,
         )
 
-        return SyncStreamResponse(
-            provider=self, model=model, messages=messages, raw_stream=raw_stream
+    def _astream_sse_response(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[StreamChunk]:
+        """Async version of _stream_sse_response() using the pooled async client."""
+        from justllms.core.streaming import aparse_sse_stream
+
+        return aparse_sse_stream(
+            url=url,
+            payload=payload,
+            headers=self._get_headers(),
+            parse_event_fn=self._parse_sse_event,
+            timeout=timeout if timeout is not None else DEFAULT_TIMEOUT,
+            error_prefix="Azure OpenAI streaming request",
+            client=self.async_http_client,
         )
 
     def supports_streaming(self) -> bool:
@@ -1,14 +1,20 @@
+import functools
 import json
 import logging
 import time
-from typing import Any, Dict, Iterator, List, Optional
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
 import httpx
 
 from justllms.core.base import BaseProvider, BaseResponse
-from justllms.core.models import Choice, Message, ModelInfo, Role, Usage
-from justllms.core.streaming import StreamChunk, SyncStreamResponse
+from justllms.core.models import BatchJob, BatchStatus, Choice, Message, ModelInfo, Role, Usage
+from justllms.core.sse import SSEEvent, aiter_sse_events, iter_sse_events
+from justllms.core.streaming import AsyncStreamResponse, StreamChunk, SyncStreamResponse
+from justllms.exceptions import ProviderError
 from justllms.tools.adapters.base import BaseToolAdapter
+from justllms.utils import codec
+from justllms.utils.codec import json_body
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +34,11 @@ class GoogleProvider(BaseProvider):
     supports_native_tools = True
     """Gemini supports native tools like Google Search and Code Execution."""
 
+    supports_batch = True
+    """Gemini supports batch mode (batchGenerateContent)."""
+
+    batch_cost_factor = 0.5
+
     MODELS = {
         "gemini-2.5-pro": ModelInfo(
             name="gemini-2.5-pro",
@@ -111,6 +122,10 @@ class GoogleProvider(BaseProvider):
     def get_available_models(self) -> Dict[str, ModelInfo]:
         return self.MODELS.copy()
 
+    def _get_base_url(self) -> str:
+        """Get the versioned API base URL."""
+        return f"{self.config.api_base or 'https://generativelanguage.googleapis.com'}/v1beta"
+
     def _get_api_endpoint(self, model: str, streaming: bool = False) -> str:
         """Get the API endpoint for a model.
 
@@ -118,9 +133,8 @@ class GoogleProvider(BaseProvider):
             model: Model identifier.
             streaming: If True, return streaming endpoint.
         """
-        base_url = self.config.api_base or "https://generativelanguage.googleapis.com"
         endpoint_type = "streamGenerateContent" if streaming else "generateContent"
-        return f"{base_url}/v1beta/models/{model}:{endpoint_type}"
+        return f"{self._get_base_url()}/models/{model}:{endpoint_type}"
 
     def _format_messages(self, messages: List[Message]) -> Dict[str, Any]:
         """Format messages for Gemini API."""
@@ -228,15 +242,27 @@ class GoogleProvider(BaseProvider):
         """Parse Gemini API response.
 
         Handles multiple candidates when candidateCount > 1 is specified.
-        Each candidate becomes a separate choice in the response.
+        Each candidate becomes a separate choice in the response, built on
+        first access.
         """
-        candidates = response_data.get("candidates", [])
+        if not response_data.get("candidates"):
+            raise ProviderError("No candidates in Gemini response")
 
-        if not candidates:
-            from justllms.exceptions import ProviderError
+        if "id" not in response_data:
+            response_data["id"] = f"gemini-{int(time.time())}"
+        if "created" not in response_data:
+            response_data["created"] = int(time.time())
 
-            raise ProviderError("No candidates in Gemini response")
+        return self._create_base_response(  # type: ignore[return-value]
+            GoogleResponse,
+            response_data,
+            functools.partial(self._parse_candidates, response_data["candidates"]),
+            functools.partial(self._parse_usage_metadata, response_data.get("usageMetadata", {})),
+            model,
+        )
 
+    def _parse_candidates(self, candidates: List[Dict[str, Any]]) -> List[Choice]:
+        """Build one Choice per Gemini candidate."""
         choices = []
         for idx, candidate in enumerate(candidates):
             content = candidate.get("content", {})
@@ -261,28 +287,16 @@ class GoogleProvider(BaseProvider):
                 finish_reason=candidate.get("finishReason", "stop").lower(),
             )
             choices.append(choice)
+        return choices
 
-        # Parse usage metadata
-        usage_metadata = response_data.get("usageMetadata", {})
-        usage = Usage(
+    def _parse_usage_metadata(self, usage_metadata: Dict[str, Any]) -> Usage:
+        """Build Usage from Gemini's usageMetadata."""
+        return Usage(
             prompt_tokens=usage_metadata.get("promptTokenCount", 0),
             completion_tokens=usage_metadata.get("candidatesTokenCount", 0),
             total_tokens=usage_metadata.get("totalTokenCount", 0),
         )
 
-        if "id" not in response_data:
-            response_data["id"] = f"gemini-{int(time.time())}"
-        if "created" not in response_data:
-            response_data["created"] = int(time.time())
-
-        return self._create_base_response(  # type: ignore[return-value]
-            GoogleResponse,
-            response_data,
-            choices,  # Pass all choices
-            usage,
-            model,
-        )
-
     def _get_headers(self) -> Dict[str, str]:
         """Get request headers."""
         return {
@@ -295,6 +309,53 @@ class GoogleProvider(BaseProvider):
             "key": self.config.api_key or "",
         }
 
+    def _build_request_data(self, messages: List[Message], **kwargs: Any) -> Dict[str, Any]:
+        """Build a generateContent request body from messages and parameters."""
+        request_data = self._format_messages(messages)
+
+        # Add generation config
+        generation_config = self._format_generation_config(**kwargs)
+        if generation_config:
+            request_data["generationConfig"] = generation_config
+
+        # Add safety settings if provided
+        if "safety_settings" in kwargs:
+            request_data["safetySettings"] = kwargs["safety_settings"]
+
+        return request_data
+
+    def _add_tools_to_request(
+        self,
+        request_data: Dict[str, Any],
+        tools: Optional[List[Dict[str, Any]]],
+        tool_choice: Optional[Any],
+    ) -> None:
+        """Add adapter-formatted tools and tool config to a request body."""
+        # Add tools - already in Gemini format from adapter
+        if tools is not None and tools:
+            request_data["tools"] = tools
+
+        # Add tool choice configuration
+        # Only add toolConfig if we have ONLY user-defined functions (no native tools)
+        # Native tools (google_search, code_execution) don't support toolConfig
+        # Mixed (native + user) also doesn't support toolConfig per Gemini live-tools docs
+        if tool_choice and tools:
+            # Check if there are any native tools
+            has_native_tools = any(
+                "google_search" in tool_entry or "code_execution" in tool_entry
+                for tool_entry in tools
+            )
+
+            # Check if there are user functions
+            has_function_declarations = any(
+                "functionDeclarations" in tool_entry or "function_declarations" in tool_entry
+                for tool_entry in tools
+            )
+
+            # Only send toolConfig for user-only functions (no native tools)
+            if has_function_declarations and not has_native_tools:
+                request_data["toolConfig"] = tool_choice
+
     def complete(
         self,
         messages: List[Message],
@@ -310,23 +371,34 @@ class GoogleProvider(BaseProvider):
             timeout: Optional timeout in seconds. If None, no timeout is enforced.
             **kwargs: Additional provider-specific parameters.
         """
-        url = self._get_api_endpoint(model)
-
-        # Format request
-        request_data = self._format_messages(messages)
+        response_data = self._make_http_request(
+            url=self._get_api_endpoint(model),
+            payload=self._build_request_data(messages, **kwargs),
+            headers=self._get_headers(),
+            params=self._get_params(),
+            timeout=timeout,
+        )
 
-        # Add generation config
-        generation_config = self._format_generation_config(**kwargs)
-        if generation_config:
-            request_data["generationConfig"] = generation_config
+        return self._parse_response(response_data, model)
 
-        # Add safety settings if provided
-        if "safety_settings" in kwargs:
-            request_data["safetySettings"] = kwargs["safety_settings"]
+    async def acomplete(
+        self,
+        messages: List[Message],
+        model: str,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> BaseResponse:
+        """Asynchronous completion.
 
-        response_data = self._make_http_request(
-            url=url,
-            payload=request_data,
+        Args:
+            messages: List of messages for the completion.
+            model: Model identifier to use.
+            timeout: Optional timeout in seconds. If None, no timeout is enforced.
+            **kwargs: Additional provider-specific parameters.
+        """
+        response_data = await self._amake_http_request(
+            url=self._get_api_endpoint(model),
+            payload=self._build_request_data(messages, **kwargs),
             headers=self._get_headers(),
             params=self._get_params(),
             timeout=timeout,
@@ -356,47 +428,46 @@ class GoogleProvider(BaseProvider):
         Returns:
             BaseResponse with tool call information.
         """
-        url = self._get_api_endpoint(model)
-
-        # Format request
-        request_data = self._format_messages(messages)
-
-        # Add generation config
-        generation_config = self._format_generation_config(**kwargs)
-        if generation_config:
-            request_data["generationConfig"] = generation_config
+        request_data = self._build_request_data(messages, **kwargs)
+        self._add_tools_to_request(request_data, tools, tool_choice)
 
-        # Add tools - already in Gemini format from adapter
-        if tools is not None and tools:
-            request_data["tools"] = tools
+        response_data = self._make_http_request(
+            url=self._get_api_endpoint(model),
+            payload=request_data,
+            headers=self._get_headers(),
+            params=self._get_params(),
+            timeout=timeout,
+        )
 
-        # Add tool choice configuration
-        # Only add toolConfig if we have ONLY user-defined functions (no native tools)
-        # Native tools (google_search, code_execution) don't support toolConfig
-        # Mixed (native + user) also doesn't support toolConfig per Gemini live-tools docs
-        if tool_choice and tools:
-            # Check if there are any native tools
-            has_native_tools = any(
-                "google_search" in tool_entry or "code_execution" in tool_entry
-                for tool_entry in tools
-            )
+        return self._parse_response(response_data, model)
 
-            # Check if there are user functions
-            has_function_declarations = any(
-                "functionDeclarations" in tool_entry or "function_declarations" in tool_entry
-                for tool_entry in tools
-            )
+    async def acomplete_with_tools(
+        self,
+        messages: List[Message],
+        tools: Optional[List[Dict[str, Any]]] = None,
+        model: str = "",
+        tool_choice: Optional[Any] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> BaseResponse:
+        """Async version of complete_with_tools(), including native Google tools.
 
-            # Only send toolConfig for user-only functions (no native tools)
-            if has_function_declarations and not has_native_tools:
-                request_data["toolConfig"] = tool_choice
+        Args:
+            messages: List of messages for the completion.
+            tools: Formatted tool definitions (already formatted by adapter).
+            model: Model identifier to use.
+            tool_choice: Tool selection configuration (already formatted).
+            timeout: Optional timeout in seconds.
+            **kwargs: Additional provider-specific parameters.
 
-        # Add safety settings if provided
-        if "safety_settings" in kwargs:
-            request_data["safetySettings"] = kwargs["safety_settings"]
+        Returns:
+            BaseResponse with tool call information.
+        """
+        request_data = self._build_request_data(messages, **kwargs)
+        self._add_tools_to_request(request_data, tools, tool_choice)
 
-        response_data = self._make_http_request(
-            url=url,
+        response_data = await self._amake_http_request(
+            url=self._get_api_endpoint(model),
             payload=request_data,
             headers=self._get_headers(),
             params=self._get_params(),
@@ -405,31 +476,21 @@ class GoogleProvider(BaseProvider):
 
         return self._parse_response(response_data, model)
 
-    def _parse_sse_chunk(self, line: str) -> Optional[StreamChunk]:
-        """Parse a single SSE line from Gemini streaming response.
+    def _parse_sse_event(self, event: SSEEvent) -> Optional[StreamChunk]:
+        """Parse a single SSE event from Gemini streaming response.
 
         Args:
-            line: Raw SSE line to parse.
+            event: Event decoded from the response stream.
 
         Returns:
-            StreamChunk if line contains valid data, None otherwise.
+            StreamChunk if the event contains content, None otherwise.
         """
-        line = line.strip()
-        if not line:
-            return None
-
-        # Gemini SSE format: "data: {...}"
-        if not line.startswith("data: "):
-            return None
-
-        data = line[6:]  # Remove "data: " prefix
-
         # Ignore [DONE] marker (if sent by API)
-        if data == "[DONE]":
+        if event.data == b"[DONE]":
             return None
 
         try:
-            chunk_data = json.loads(data)
+            chunk_data = codec.loads(event.data)
             candidates = chunk_data.get("candidates", [])
 
             if not candidates:
@@ -447,15 +508,10 @@ class GoogleProvider(BaseProvider):
 
             finish_reason = candidate.get("finishReason")
 
-            # Get usage metadata if available (typically only in final chunk)
-            usage_metadata = chunk_data.get("usageMetadata")
-            usage = None
-            if usage_metadata:
-                usage = Usage(
-                    prompt_tokens=usage_metadata.get("promptTokenCount", 0),
-                    completion_tokens=usage_metadata.get("candidatesTokenCount", 0),
-                    total_tokens=usage_metadata.get("totalTokenCount", 0),
-                )
+            # Gemini repeats usageMetadata on every chunk, but only the final
+            # one is complete, so skip building Usage objects for the rest
+            usage_metadata = chunk_data.get("usageMetadata") if finish_reason else None
+            usage = self._parse_usage_metadata(usage_metadata) if usage_metadata else None
 
             if text_content or finish_reason:
                 return StreamChunk(
@@ -465,7 +521,9 @@ class GoogleProvider(BaseProvider):
                     raw=chunk_data,
                 )
         except json.JSONDecodeError:
-            logger.warning(f"Failed to parse Gemini SSE chunk: {data}")
+            logger.warning(
+                f"Failed to parse Gemini SSE chunk: {event.data.decode('utf-8', 'replace')}"
+            )
 
         return None
 
@@ -496,17 +554,44 @@ class GoogleProvider(BaseProvider):
         stream_params = {**params, "alt": "sse"}
 
         try:
-            with httpx.Client(timeout=timeout) as client, client.stream(
+            with self.http_client.stream(
                 "POST",
                 url,
-                json=payload,
-                headers=self._get_headers(),
                 params=stream_params,
+                timeout=timeout,
+                **json_body(payload, self._get_headers()),
+            ) as response:
+                response.raise_for_status()
+
+                for event in iter_sse_events(response.iter_bytes()):
+                    chunk = self._parse_sse_event(event)
+                    if chunk is not None:
+                        yield chunk
+        except (httpx.HTTPError, httpx.RequestError) as e:
+            raise ProviderError(f"Google streaming request failed: {str(e)}") from e
+
+    async def _astream_gemini_response(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        params: Dict[str, str],
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[StreamChunk]:
+        """Async version of _stream_gemini_response() using the pooled async client."""
+        from justllms.exceptions import ProviderError
+
+        try:
+            async with self.async_http_client.stream(
+                "POST",
+                url,
+                params={**params, "alt": "sse"},
+                timeout=timeout,
+                **json_body(payload, self._get_headers()),
             ) as response:
                 response.raise_for_status()
 
-                for line in response.iter_lines():
-                    chunk = self._parse_sse_chunk(line)
+                async for event in aiter_sse_events(response.aiter_bytes()):
+                    chunk = self._parse_sse_event(event)
                     if chunk is not None:
                         yield chunk
         except (httpx.HTTPError, httpx.RequestError) as e:
@@ -530,24 +615,10 @@ class GoogleProvider(BaseProvider):
         Returns:
             SyncStreamResponse: Streaming response iterator.
         """
-        url = self._get_api_endpoint(model, streaming=True)
-
-        # Format request
-        request_data = self._format_messages(messages)
-
-        # Add generation config
-        generation_config = self._format_generation_config(**kwargs)
-        if generation_config:
-            request_data["generationConfig"] = generation_config
-
-        # Add safety settings if provided
-        if "safety_settings" in kwargs:
-            request_data["safetySettings"] = kwargs["safety_settings"]
-
         # Use streaming helper
         stream_iter = self._stream_gemini_response(
-            url=url,
-            payload=request_data,
+            url=self._get_api_endpoint(model, streaming=True),
+            payload=self._build_request_data(messages, **kwargs),
             params=self._get_params(),
             timeout=timeout,
         )
@@ -556,6 +627,35 @@ class GoogleProvider(BaseProvider):
             provider=self, model=model, messages=messages, raw_stream=stream_iter
         )
 
+    async def astream(
+        self,
+        messages: List[Message],
+        model: str,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> AsyncStreamResponse:
+        """Async stream completion using Server-Sent Events.
+
+        Args:
+            messages: List of messages for the completion.
+            model: Model identifier to use.
+            timeout: Optional timeout in seconds.
+            **kwargs: Additional provider-specific parameters.
+
+        Returns:
+            AsyncStreamResponse: Async streaming response iterator.
+        """
+        stream_iter = self._astream_gemini_response(
+            url=self._get_api_endpoint(model, streaming=True),
+            payload=self._build_request_data(messages, **kwargs),
+            params=self._get_params(),
+            timeout=timeout,
+        )
+
+        return AsyncStreamResponse(
+            provider=self, model=model, messages=messages, async_stream=stream_iter
+        )
+
     def supports_streaming(self) -> bool:
         """Google Gemini supports streaming."""
         return True
@@ -572,3 +672,103 @@ class GoogleProvider(BaseProvider):
         from justllms.tools.adapters.google import GoogleToolAdapter
 
         return GoogleToolAdapter()
+
+    def create_batch(
+        self, requests: List[Tuple[str, List[Message], Dict[str, Any]]], model: str
+    ) -> BatchJob:
+        """Submit the requests as an inline batch (batchGenerateContent)."""
+        operation = self._make_http_request(
+            url=f"{self._get_base_url()}/models/{model}:batchGenerateContent",
+            payload={
+                "batch": {
+                    "display_name": f"justllms-{int(time.time())}",
+                    "input_config": {
+                        "requests": {
+                            "requests": [
+                                {
+                                    "request": self._build_request_data(messages, **params),
+                                    "metadata": {"key": custom_id},
+                                }
+                                for custom_id, messages, params in requests
+                            ]
+                        }
+                    },
+                }
+            },
+            headers=self._get_headers(),
+            params=self._get_params(),
+            retry=False,
+        )
+        return self._parse_batch_job(operation, model)
+
+    def retrieve_batch(self, batch_id: str) -> BatchJob:
+        """Fetch a batch by name (``batches/...``)."""
+        operation = self._make_http_request(
+            url=f"{self._get_base_url()}/{batch_id}",
+            payload={},
+            headers=self._get_headers(),
+            params=self._get_params(),
+            method="GET",
+        )
+        return self._parse_batch_job(operation)
+
+    def cancel_batch(self, batch_id: str) -> BatchJob:
+        """Cancel a batch; the cancel call returns nothing, so the batch is re-fetched."""
+        self._make_http_request(
+            url=f"{self._get_base_url()}/{batch_id}:cancel",
+            payload={},
+            headers=self._get_headers(),
+            params=self._get_params(),
+        )
+        return self.retrieve_batch(batch_id)
+
+    def iter_batch_results(
+        self, job: BatchJob
+    ) -> Iterator[Tuple[str, Optional[BaseResponse], Optional[Exception]]]:
+        """Yield the inlined responses of a finished batch."""
+        batch = job.raw.get("response") or job.raw.get("metadata") or {}
+        output = batch.get("output") or batch
+        inlined = (output.get("inlinedResponses") or {}).get("inlinedResponses") or []
+        for index, item in enumerate(inlined):
+            custom_id = (item.get("metadata") or {}).get("key") or f"request-{index}"
+            if "response" in item:
+                yield custom_id, self._parse_response(item["response"], job.model or ""), None
+            else:
+                error = item.get("error") or {}
+                yield custom_id, None, ProviderError(
+                    f"google batch request failed: {error.get('message', error)}",
+                    provider=self.name,
+                    status_code=error.get("code"),
+                    response_body=json.dumps(error),
+                )
+
+    def _parse_batch_job(self, operation: Dict[str, Any], model: Optional[str] = None) -> BatchJob:
+        """Convert a batch operation to a BatchJob."""
+        batch = operation.get("response") or operation.get("metadata") or operation
+        state = str(batch.get("state", "")).rsplit("_", 1)[-1]
+        status = {
+            "SUCCEEDED": BatchStatus.COMPLETED,
+            "FAILED": BatchStatus.FAILED,
+            "CANCELLED": BatchStatus.CANCELLED,
+            "EXPIRED": BatchStatus.EXPIRED,
+            "PENDING": BatchStatus.VALIDATING,
+        }.get(state, BatchStatus.IN_PROGRESS)
+
+        stats = batch.get("batchStats") or {}
+        create_time = batch.get("createTime")
+        batch_model = batch.get("model")
+        return BatchJob(
+            id=batch.get("name") or operation["name"],
+            provider=self.name,
+            model=model or (batch_model.split("/", 1)[-1] if batch_model else None),
+            status=status,
+            total=int(stats.get("requestCount", 0)),
+            succeeded=int(stats.get("successfulRequestCount", 0)),
+            failed=int(stats.get("failedRequestCount", 0)),
+            created_at=(
+                int(datetime.fromisoformat(create_time[:19] + "+00:00").timestamp())
+                if create_time
+                else None
+            ),
+            raw=operation,
+        )
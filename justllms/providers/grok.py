@@ -1,11 +1,9 @@
+import functools
 import time
 from typing import Any, Dict, List, Optional
 
-import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
-
-from justllms.core.base import DEFAULT_TIMEOUT, BaseProvider, BaseResponse
-from justllms.core.models import Choice, Message, ModelInfo, Usage
+from justllms.core.base import BaseProvider, BaseResponse
+from justllms.core.models import Choice, Message, ModelInfo
 from justllms.exceptions import ProviderError
 
 
@@ -132,12 +130,24 @@ class GrokProvider(BaseProvider):
 
     def _parse_response(self, response_data: Dict[str, Any], model: str) -> GrokResponse:
         """Parse Grok API response."""
-        choices_data = response_data.get("choices", [])
-
-        if not choices_data:
+        if not response_data.get("choices"):
             raise ProviderError("No choices in Grok response")
 
-        # Parse choices
+        if "id" not in response_data:
+            response_data["id"] = f"grok-{int(time.time())}"
+        if "created" not in response_data:
+            response_data["created"] = int(time.time())
+
+        return self._create_base_response(  # type: ignore[return-value]
+            GrokResponse,
+            response_data,
+            functools.partial(self._parse_choices, response_data["choices"]),
+            functools.partial(self._create_standard_usage, response_data.get("usage", {})),
+            model,
+        )
+
+    def _parse_choices(self, choices_data: List[Dict[str, Any]]) -> List[Choice]:
+        """Build Choice objects from the ``choices`` of a Grok response."""
         choices = []
         for choice_data in choices_data:
             message_data = choice_data.get("message", {})
@@ -151,54 +161,11 @@ class GrokProvider(BaseProvider):
                 finish_reason=choice_data.get("finish_reason", "stop"),
             )
             choices.append(choice)
+        return choices
 
-        # Parse usage
-        usage_data = response_data.get("usage", {})
-        usage = Usage(
-            prompt_tokens=usage_data.get("prompt_tokens", 0),
-            completion_tokens=usage_data.get("completion_tokens", 0),
-            total_tokens=usage_data.get("total_tokens", 0),
-        )
-
-        # Extract only the keys we want to avoid conflicts
-        raw_response = {
-            k: v
-            for k, v in response_data.items()
-            if k not in ["id", "model", "choices", "usage", "created"]
-        }
-
-        return GrokResponse(
-            id=response_data.get("id", f"grok-{int(time.time())}"),
-            model=model,
-            choices=choices,
-            usage=usage,
-            created=response_data.get("created", int(time.time())),
-            **raw_response,
-        )
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-    )
-    def complete(
-        self,
-        messages: List[Message],
-        model: str,
-        timeout: Optional[float] = None,
-        **kwargs: Any,
-    ) -> BaseResponse:
-        """Synchronous completion.
-
-        Args:
-            messages: List of messages for the completion.
-            model: Model identifier to use.
-            timeout: Optional timeout in seconds. If None, no timeout is enforced.
-            **kwargs: Additional provider-specific parameters.
-        """
-        url = self._get_api_endpoint()
-
-        # Format request
-        request_data = {
+    def _build_payload(self, messages: List[Message], model: str, **kwargs: Any) -> Dict[str, Any]:
+        """Build a chat completions request payload with supported parameters."""
+        return {
             "model": model,
             "messages": self._format_messages(messages),
             **{
@@ -217,16 +184,50 @@ class GrokProvider(BaseProvider):
             },
         }
 
-        timeout_config = timeout if timeout is not None else DEFAULT_TIMEOUT
+    def complete(
+        self,
+        messages: List[Message],
+        model: str,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> BaseResponse:
+        """Synchronous completion.
+
+        Args:
+            messages: List of messages for the completion.
+            model: Model identifier to use.
+            timeout: Optional timeout in seconds. If None, no timeout is enforced.
+            **kwargs: Additional provider-specific parameters.
+        """
+        response_data = self._make_http_request(
+            url=self._get_api_endpoint(),
+            payload=self._build_payload(messages, model, **kwargs),
+            headers=self._get_headers(),
+            timeout=timeout,
+        )
 
-        with httpx.Client(timeout=timeout_config) as client:
-            response = client.post(
-                url,
-                json=request_data,
-                headers=self._get_headers(),
-            )
+        return self._parse_response(response_data, model)
 
-            if response.status_code != 200:
-                raise ProviderError(f"Grok API error: {response.status_code} - {response.text}")
+    async def acomplete(
+        self,
+        messages: List[Message],
+        model: str,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> BaseResponse:
+        """Asynchronous completion.
+
+        Args:
+            messages: List of messages for the completion.
+            model: Model identifier to use.
+            timeout: Optional timeout in seconds. If None, no timeout is enforced.
+            **kwargs: Additional provider-specific parameters.
+        """
+        response_data = await self._amake_http_request(
+            url=self._get_api_endpoint(),
+            payload=self._build_payload(messages, model, **kwargs),
+            headers=self._get_headers(),
+            timeout=timeout,
+        )
 
-            return self._parse_response(response.json(), model)
+        return self._parse_response(response_data, model)
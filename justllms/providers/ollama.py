@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import functools
 import json
 from datetime import datetime
-from typing import Any, Iterator
+from typing import Any, AsyncIterator, Iterator
 from uuid import uuid4
 
 import httpx
 
 from justllms.core.base import BaseProvider, BaseResponse
-from justllms.core.models import Message, ModelInfo
-from justllms.core.streaming import StreamChunk, SyncStreamResponse
+from justllms.core.models import Choice, Message, ModelInfo
+from justllms.core.sse import aiter_ndjson, iter_ndjson
+from justllms.core.streaming import AsyncStreamResponse, StreamChunk, SyncStreamResponse
 from justllms.exceptions import ProviderError
+from justllms.utils import codec
+from justllms.utils.codec import json_body
 
 
 class OllamaResponse(BaseResponse):
@@ -131,10 +135,65 @@ class OllamaProvider(BaseProvider):
         Raises:
             ProviderError: If the Ollama API request fails or returns an error.
         """
+        response_data = self._make_http_request(
+            url=self._chat_endpoint,
+            payload=self._build_payload(
+                messages, model, stream=kwargs.pop("stream", False), **kwargs
+            ),
+            headers=self._get_request_headers(),
+            timeout=timeout,
+        )
+
+        return self._parse_response(response_data, model)
+
+    async def acomplete(
+        self, messages: list[Message], model: str, timeout: Any = None, **kwargs: Any
+    ) -> BaseResponse:
+        """Execute a chat completion request asynchronously using the Ollama API.
+
+        Args:
+            messages: List of conversation messages to send to the model.
+            model: Name of the Ollama model to use (e.g., 'llama3.1:8b').
+            timeout: Optional timeout in seconds. If None, no timeout is enforced.
+            **kwargs: Additional parameters, same as complete().
+
+        Returns:
+            BaseResponse containing the model output, usage statistics, and metadata.
+
+        Raises:
+            ProviderError: If the Ollama API request fails or returns an error.
+        """
+        response_data = await self._amake_http_request(
+            url=self._chat_endpoint,
+            payload=self._build_payload(
+                messages, model, stream=kwargs.pop("stream", False), **kwargs
+            ),
+            headers=self._get_request_headers(),
+            timeout=timeout,
+        )
+
+        return self._parse_response(response_data, model)
+
+    def _build_payload(
+        self, messages: list[Message], model: str, stream: bool, **kwargs: Any
+    ) -> dict[str, Any]:
+        """Build an /api/chat request payload.
+
+        Common sampling parameters are mapped into Ollama's ``options`` dict.
+
+        Args:
+            messages: List of conversation messages to send to the model.
+            model: Name of the Ollama model to use.
+            stream: Whether to request a newline-delimited JSON stream.
+            **kwargs: Generation parameters (see complete()).
+
+        Returns:
+            Request payload for the /api/chat endpoint.
+        """
         payload = {
             "model": model,
             "messages": self._format_messages_base(messages),
-            "stream": kwargs.pop("stream", False),
+            "stream": stream,
         }
 
         stop_sequences = kwargs.pop("stop", None)
@@ -175,14 +234,7 @@ class OllamaProvider(BaseProvider):
         if options:
             payload["options"] = options
 
-        response_data = self._make_http_request(
-            url=self._chat_endpoint,
-            payload=payload,
-            headers=self._get_request_headers(),
-            timeout=timeout,
-        )
-
-        return self._parse_response(response_data, model)
+        return payload
 
     @property
     def _chat_endpoint(self) -> str:
@@ -336,10 +388,6 @@ class OllamaProvider(BaseProvider):
             usage statistics, and metadata.
         """
         message_data = response_data.get("message", {})
-        choice = self._create_standard_choice(
-            {**message_data, "finish_reason": "stop"},
-            index=0,
-        )
 
         prompt_tokens = int(response_data.get("prompt_eval_count") or 0)
         completion_tokens = int(response_data.get("eval_count") or 0)
@@ -348,7 +396,6 @@ class OllamaProvider(BaseProvider):
             "completion_tokens": completion_tokens,
             "total_tokens": prompt_tokens + completion_tokens,
         }
-        usage = self._create_standard_usage(usage_payload)
 
         created_at = self._parse_created_timestamp(response_data.get("created_at"))
 
@@ -370,11 +417,15 @@ class OllamaProvider(BaseProvider):
         return self._create_base_response(
             OllamaResponse,
             response_payload,
-            [choice],
-            usage,
+            functools.partial(self._parse_choices, message_data),
+            functools.partial(self._create_standard_usage, usage_payload),
             model,
         )
 
+    def _parse_choices(self, message_data: dict[str, Any]) -> list[Choice]:
+        """Build the single Choice of an Ollama chat response."""
+        return [self._create_standard_choice({**message_data, "finish_reason": "stop"}, index=0)]
+
     def _parse_created_timestamp(self, value: Any) -> int | None:
         """Parse Ollama's ISO timestamp string to Unix epoch seconds.
 
@@ -402,7 +453,7 @@ class OllamaProvider(BaseProvider):
         """
         return self._get_default_headers()
 
-    def _parse_json_chunk(self, line: str) -> StreamChunk | None:
+    def _parse_json_chunk(self, line: bytes) -> StreamChunk | None:
         """Parse a single JSON line from Ollama streaming response.
 
         Ollama uses newline-delimited JSON format (not SSE).
@@ -413,12 +464,8 @@ class OllamaProvider(BaseProvider):
         Returns:
             StreamChunk if line contains valid data, None otherwise.
         """
-        line = line.strip()
-        if not line:
-            return None
-
         try:
-            chunk_data = json.loads(line)
+            chunk_data = codec.loads(line)
 
             # Ollama response format: {"message": {"role": "assistant", "content": "..."}, "done": false}
             message = chunk_data.get("message", {})
@@ -476,16 +523,40 @@ class OllamaProvider(BaseProvider):
             ProviderError: If the streaming request fails.
         """
         try:
-            with httpx.Client(timeout=timeout) as client, client.stream(
+            with self.http_client.stream(
                 "POST",
                 url,
-                json=payload,
-                headers=headers,
+                timeout=timeout,
+                **json_body(payload, headers),
             ) as response:
                 response.raise_for_status()
 
                 # Ollama streams newline-delimited JSON
-                for line in response.iter_lines():
+                for line in iter_ndjson(response.iter_bytes()):
+                    chunk = self._parse_json_chunk(line)
+                    if chunk is not None:
+                        yield chunk
+        except (httpx.HTTPError, httpx.RequestError) as e:
+            raise ProviderError(f"Ollama streaming request failed: {str(e)}") from e
+
+    async def _astream_ollama_response(
+        self,
+        url: str,
+        payload: dict[str, Any],
+        headers: dict[str, str],
+        timeout: float | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        """Async version of _stream_ollama_response() using the pooled async client."""
+        try:
+            async with self.async_http_client.stream(
+                "POST",
+                url,
+                timeout=timeout,
+                **json_body(payload, headers),
+            ) as response:
+                response.raise_for_status()
+
+                async for line in aiter_ndjson(response.aiter_bytes()):
                     chunk = self._parse_json_chunk(line)
                     if chunk is not None:
                         yield chunk
@@ -510,59 +581,10 @@ class OllamaProvider(BaseProvider):
         Returns:
             SyncStreamResponse: Streaming response iterator.
         """
-        # Build payload similar to complete() but with stream=True
-        payload = {
-            "model": model,
-            "messages": self._format_messages_base(messages),
-            "stream": True,  # Enable streaming
-        }
-
-        # Add stop sequences
-        stop_sequences = kwargs.pop("stop", None)
-        if stop_sequences is not None:
-            payload["stop"] = stop_sequences
-
-        # Add keep_alive
-        keep_alive = kwargs.pop("keep_alive", None) or getattr(self.config, "keep_alive", None)
-        if keep_alive is not None:
-            payload["keep_alive"] = keep_alive
-
-        # Add metadata
-        metadata = kwargs.pop("metadata", None) or getattr(self.config, "metadata", None)
-        if metadata is not None:
-            payload["metadata"] = metadata
-
-        # Build options dict
-        options: dict[str, Any] = {}
-        option_keys = {
-            "temperature": "temperature",
-            "top_p": "top_p",
-            "top_k": "top_k",
-            "presence_penalty": "presence_penalty",
-            "frequency_penalty": "frequency_penalty",
-            "repeat_penalty": "repeat_penalty",
-            "seed": "seed",
-        }
-        for kwarg, option_name in option_keys.items():
-            value = kwargs.pop(kwarg, None)
-            if value is not None:
-                options[option_name] = value
-
-        max_tokens = kwargs.pop("max_tokens", None)
-        if max_tokens is not None:
-            options["num_predict"] = max_tokens
-
-        extra_options = kwargs.pop("options", None)
-        if isinstance(extra_options, dict):
-            options.update(extra_options)
-
-        if options:
-            payload["options"] = options
-
         # Use streaming helper
         stream_iter = self._stream_ollama_response(
             url=self._chat_endpoint,
-            payload=payload,
+            payload=self._build_payload(messages, model, stream=True, **kwargs),
             headers=self._get_request_headers(),
             timeout=timeout,
         )
@@ -571,6 +593,35 @@ class OllamaProvider(BaseProvider):
             provider=self, model=model, messages=messages, raw_stream=stream_iter
         )
 
+    async def astream(
+        self,
+        messages: list[Message],
+        model: str,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> AsyncStreamResponse:
+        """Async stream completion using Ollama's newline-delimited JSON format.
+
+        Args:
+            messages: List of messages for the completion.
+            model: Model identifier to use.
+            timeout: Optional timeout in seconds.
+            **kwargs: Additional provider-specific parameters.
+
+        Returns:
+            AsyncStreamResponse: Async streaming response iterator.
+        """
+        stream_iter = self._astream_ollama_response(
+            url=self._chat_endpoint,
+            payload=self._build_payload(messages, model, stream=True, **kwargs),
+            headers=self._get_request_headers(),
+            timeout=timeout,
+        )
+
+        return AsyncStreamResponse(
+            provider=self, model=model, messages=messages, async_stream=stream_iter
+        )
+
     def supports_streaming(self) -> bool:
         """Ollama supports streaming."""
         return True
@@ -1,9 +1,12 @@
-from typing import Dict, Optional
+import json
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from justllms.core.base import BaseResponse
-from justllms.core.models import ModelInfo
+from justllms.core.models import BatchJob, BatchStatus, Message, ModelInfo
 from justllms.core.openai_base import BaseOpenAIChatProvider
+from justllms.exceptions import ProviderError
 from justllms.tools.adapters.base import BaseToolAdapter
+from justllms.utils import codec
 
 
 class OpenAIResponse(BaseResponse):
@@ -18,6 +21,11 @@ class OpenAIProvider(BaseOpenAIChatProvider):
     supports_tools = True
     """OpenAI supports function calling."""
 
+    supports_batch = True
+    """OpenAI supports the Batch API (JSONL file upload, 24h completion window)."""
+
+    batch_cost_factor = 0.5
+
     MODELS = {
         "gpt-5": ModelInfo(
             name="gpt-5",
@@ -127,13 +135,17 @@ class OpenAIProvider(BaseOpenAIChatProvider):
     def get_available_models(self) -> Dict[str, ModelInfo]:
         return self.MODELS.copy()
 
-    def _get_api_endpoint(self) -> str:
-        """Get OpenAI chat completions endpoint."""
+    def _get_base_url(self) -> str:
+        """Get the API root URL, without the /v1 suffix."""
         base_url = self.config.api_base or "https://api.openai.com"
         base_url = base_url.rstrip("/")
         if base_url.endswith("/v1"):
             base_url = base_url[:-3]
-        return f"{base_url}/v1/chat/completions"
+        return base_url
+
+    def _get_api_endpoint(self) -> str:
+        """Get OpenAI chat completions endpoint."""
+        return f"{self._get_base_url()}/v1/chat/completions"
 
     def _get_request_headers(self) -> Dict[str, str]:
         """Generate HTTP headers for OpenAI API requests."""
@@ -153,3 +165,106 @@ class OpenAIProvider(BaseOpenAIChatProvider):
         from justllms.tools.adapters.openai import OpenAIToolAdapter
 
         return OpenAIToolAdapter()
+
+    def create_batch(
+        self, requests: List[Tuple[str, List[Message], Dict[str, Any]]], model: str
+    ) -> BatchJob:
+        """Upload the requests as a JSONL file and start a batch job."""
+        lines = [
+            codec.dumps(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._build_completion_payload(messages, model, **params),
+                }
+            )
+            for custom_id, messages, params in requests
+        ]
+        upload_headers = {
+            key: value
+            for key, value in self._get_request_headers().items()
+            if key.lower() != "content-type"
+        }
+        input_file = self._upload_file(
+            f"{self._get_base_url()}/v1/files",
+            b"\n".join(lines),
+            filename="batch.jsonl",
+            fields={"purpose": "batch"},
+            headers=upload_headers,
+        )
+
+        job_data = self._make_http_request(
+            url=f"{self._get_base_url()}/v1/batches",
+            payload={
+                "input_file_id": input_file["id"],
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h",
+            },
+            headers=self._get_request_headers(),
+            retry=False,
+        )
+        return self._parse_batch_job(job_data, model)
+
+    def retrieve_batch(self, batch_id: str) -> BatchJob:
+        """Fetch a batch job."""
+        job_data = self._make_http_request(
+            url=f"{self._get_base_url()}/v1/batches/{batch_id}",
+            payload={},
+            headers=self._get_request_headers(),
+            method="GET",
+        )
+        return self._parse_batch_job(job_data)
+
+    def cancel_batch(self, batch_id: str) -> BatchJob:
+        """Cancel a batch job; requests already completed keep their results."""
+        job_data = self._make_http_request(
+            url=f"{self._get_base_url()}/v1/batches/{batch_id}/cancel",
+            payload={},
+            headers=self._get_request_headers(),
+        )
+        return self._parse_batch_job(job_data)
+
+    def iter_batch_results(
+        self, job: BatchJob
+    ) -> Iterator[Tuple[str, Optional[BaseResponse], Optional[Exception]]]:
+        """Stream results from the job's output file, then errors from its error file."""
+        for file_id in (job.raw.get("output_file_id"), job.raw.get("error_file_id")):
+            if not file_id:
+                continue
+            for line in self._iter_remote_lines(
+                f"{self._get_base_url()}/v1/files/{file_id}/content",
+                headers=self._get_request_headers(),
+            ):
+                if not line.strip():
+                    continue
+                item = codec.loads(line)
+                response = item.get("response") or {}
+                body = response.get("body") or {}
+                if item.get("error") or response.get("status_code") != 200:
+                    error = item.get("error") or body.get("error") or body
+                    yield item["custom_id"], None, ProviderError(
+                        f"openai batch request failed: {error}",
+                        provider=self.name,
+                        status_code=response.get("status_code"),
+                        response_body=json.dumps(error),
+                    )
+                    continue
+                yield item["custom_id"], self._parse_openai_response(
+                    body, body.get("model") or job.model or "", self._get_response_class()
+                ), None
+
+    def _parse_batch_job(self, job_data: Dict[str, Any], model: Optional[str] = None) -> BatchJob:
+        """Convert an OpenAI batch object to a BatchJob."""
+        counts = job_data.get("request_counts") or {}
+        return BatchJob(
+            id=job_data["id"],
+            provider=self.name,
+            model=model,
+            status=BatchStatus(job_data.get("status", "validating")),
+            total=counts.get("total", 0),
+            succeeded=counts.get("completed", 0),
+            failed=counts.get("failed", 0),
+            created_at=job_data.get("created_at"),
+            raw=job_data,
+        )
@@ -0,0 +1,205 @@
+import contextlib
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+
+from justllms.core.retry import is_retryable_error
+
+
+class CircuitState(str, Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker for a single provider/model pair.
+
+    Outcomes are tracked over a sliding time window. Once at least
+    ``min_requests`` calls have been seen and the failure rate reaches
+    ``error_threshold``, the circuit opens and requests are rejected for
+    ``open_duration`` seconds. It then goes half-open and lets up to
+    ``half_open_probes`` probe requests through: a successful probe closes
+    the circuit, a failed one opens it again. Calls slower than
+    ``latency_threshold`` count as failures.
+
+    Args:
+        error_threshold: Failure rate (0-1) at which the circuit opens.
+        latency_threshold: Seconds after which a successful call counts as failed.
+        min_requests: Minimum calls in the window before the circuit can open.
+        window: Length of the sliding window in seconds.
+        open_duration: Seconds the circuit stays open before probing.
+        half_open_probes: Concurrent probe requests allowed while half-open.
+    """
+
+    def __init__(
+        self,
+        error_threshold: float = 0.5,
+        latency_threshold: Optional[float] = None,
+        min_requests: int = 5,
+        window: float = 60.0,
+        open_duration: float = 30.0,
+        half_open_probes: int = 1,
+    ):
+        self.error_threshold = error_threshold
+        self.latency_threshold = latency_threshold
+        self.min_requests = min_requests
+        self.window = window
+        self.open_duration = open_duration
+        self.half_open_probes = half_open_probes
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probe_started: Deque[float] = deque()
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving from open to half-open once open_duration has passed."""
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> CircuitState:
+        if self._state == CircuitState.OPEN and now - self._opened_at >= self.open_duration:
+            self._state = CircuitState.HALF_OPEN
+            self._probe_started.clear()
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent, reserving a probe slot when half-open.
+
+        Returns:
+            bool: False if the circuit is open (or all probe slots are taken).
+        """
+        now = time.monotonic()
+        with self._lock:
+            state = self._current_state(now)
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.OPEN:
+                return False
+
+            # Probes that never reported back (e.g. the caller gave up) expire
+            while self._probe_started and now - self._probe_started[0] >= self.open_duration:
+                self._probe_started.popleft()
+            if len(self._probe_started) >= self.half_open_probes:
+                return False
+            self._probe_started.append(now)
+            return True
+
+    def release_probe(self) -> None:
+        """Give back a half-open probe slot without recording an outcome.
+
+        For reserved requests that were never sent or ended without telling
+        anything about the provider's health (client errors, cancellation).
+        """
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            if state == CircuitState.HALF_OPEN and self._probe_started:
+                self._probe_started.pop()
+
+    def record_success(self, latency: float) -> None:
+        """Record a completed call.
+
+        Args:
+            latency: Call duration in seconds.
+        """
+        if self.latency_threshold is not None and latency > self.latency_threshold:
+            self.record_failure()
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            if self._current_state(now) == CircuitState.HALF_OPEN:
+                self._state = CircuitState.CLOSED
+                self._outcomes.clear()
+            self._outcomes.append((now, True))
+            self._prune(now)
+
+    def record_failure(self) -> None:
+        """Record a failed (or too slow) call."""
+        now = time.monotonic()
+        with self._lock:
+            state = self._current_state(now)
+            if state == CircuitState.HALF_OPEN:
+                self._open(now)
+                return
+
+            self._outcomes.append((now, False))
+            self._prune(now)
+            if state == CircuitState.CLOSED and len(self._outcomes) >= self.min_requests:
+                failures = sum(1 for _, ok in self._outcomes if not ok)
+                if failures / len(self._outcomes) >= self.error_threshold:
+                    self._open(now)
+
+    def _open(self, now: float) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = now
+        self._outcomes.clear()
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            self._outcomes.popleft()
+
+
+class CircuitBreakerRegistry:
+    """Circuit breakers keyed by (provider, model), created on first use.
+
+    Args:
+        **breaker_options: Options passed to every CircuitBreaker.
+    """
+
+    def __init__(self, **breaker_options: Any):
+        self.breaker_options = breaker_options
+        self._breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, provider: str, model: str) -> CircuitBreaker:
+        """Get the breaker for a provider/model pair.
+
+        Args:
+            provider: Provider name.
+            model: Model name.
+
+        Returns:
+            CircuitBreaker for the pair.
+        """
+        key = (provider, model)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(key, CircuitBreaker(**self.breaker_options))
+        return breaker
+
+    def allow_request(self, provider: str, model: str) -> bool:
+        """Check (and reserve a half-open probe for) a provider/model pair."""
+        return self.get(provider, model).allow_request()
+
+    def release_probe(self, provider: str, model: str) -> None:
+        """Give back a half-open probe reserved by allow_request() for an unsent request."""
+        self.get(provider, model).release_probe()
+
+    @contextlib.contextmanager
+    def track(self, provider: str, model: str) -> Iterator[None]:
+        """Record the outcome and latency of the wrapped call.
+
+        Only errors that indicate an unhealthy provider (network errors,
+        timeouts, 429 and 5xx) count as failures. Client errors and
+        cancellation don't; they give back the probe slot instead.
+        """
+        breaker = self.get(provider, model)
+        start = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            if isinstance(e, Exception) and is_retryable_error(e):
+                breaker.record_failure()
+            else:
+                breaker.release_probe()
+            raise
+        breaker.record_success(time.monotonic() - start)
@@ -1,8 +1,11 @@
-from typing import Any, Dict, List, Optional, Tuple, Union
+import contextlib
+from typing import Any, ContextManager, Dict, List, Optional, Tuple, Union
 
+from justllms.config.config import CircuitBreakerConfig
 from justllms.core.base import BaseProvider
 from justllms.core.models import Message
 from justllms.exceptions import ProviderError
+from justllms.routing.circuit_breaker import CircuitBreakerRegistry
 
 
 class Router:
@@ -12,6 +15,10 @@ class Router:
     1. If model explicitly specified (e.g., "provider/model"), use it
     2. Else if fallback configured, use fallback
     3. Else use first available provider/model
+
+    Candidates whose circuit breaker is open are skipped in favor of the next
+    candidate: the configured ``failover_models`` and, when no model was
+    requested, the first model of every other provider.
     """
 
     def __init__(
@@ -37,8 +44,47 @@ class Router:
         # Get fallback values from config if not provided
         self.fallback_provider = fallback_provider or self.config.get("fallback_provider")
         self.fallback_model = fallback_model or self.config.get("fallback_model")
+        self.failover_models: List[str] = list(self.config.get("failover_models") or [])
+
+        breaker_config = CircuitBreakerConfig(**(self.config.get("circuit_breaker") or {}))
+        self.circuit_breakers: Optional[CircuitBreakerRegistry] = (
+            CircuitBreakerRegistry(
+                error_threshold=breaker_config.error_threshold,
+                latency_threshold=breaker_config.latency_threshold,
+                min_requests=breaker_config.min_requests,
+                window=breaker_config.window,
+                open_duration=breaker_config.open_duration,
+                half_open_probes=breaker_config.half_open_probes,
+            )
+            if breaker_config.enabled
+            else None
+        )
+
+    def track(self, provider: str, model: str) -> ContextManager[None]:
+        """Context manager recording a call's outcome in the provider/model circuit.
+
+        Args:
+            provider: Provider name the request was sent to.
+            model: Model name the request was sent to.
 
-    def route(  # noqa: C901
+        Returns:
+            ContextManager that records success, latency or failure on exit.
+        """
+        if self.circuit_breakers is None:
+            return contextlib.nullcontext()
+        return self.circuit_breakers.track(provider, model)
+
+    def release(self, provider: str, model: str) -> None:
+        """Give back the circuit probe route() reserved for a request that wasn't sent.
+
+        Args:
+            provider: Provider name the request was routed to.
+            model: Model name the request was routed to.
+        """
+        if self.circuit_breakers is not None:
+            self.circuit_breakers.release_probe(provider, model)
+
+    def route(
         self,
         messages: List[Message],
         model: Optional[str] = None,
@@ -58,12 +104,47 @@ class Router:
         Returns:
             Tuple of (provider_name, model_name)
 
+        Raises:
+            ValueError: If no providers or suitable models available.
+            ProviderError: If the circuit of every candidate is open.
+        """
+        candidates = self.get_candidates(messages, model=model, providers=providers)
+
+        for provider_name, model_name in candidates:
+            if self.circuit_breakers is None or self.circuit_breakers.allow_request(
+                provider_name, model_name
+            ):
+                return provider_name, model_name
+
+        raise ProviderError(
+            "Circuit breaker open for all candidates: "
+            + ", ".join(f"{provider_name}/{model_name}" for provider_name, model_name in candidates)
+        )
+
+    def get_candidates(  # noqa: C901
+        self,
+        messages: List[Message],
+        model: Optional[str] = None,
+        providers: Optional[Dict[str, BaseProvider]] = None,
+    ) -> List[Tuple[str, str]]:
+        """List provider/model candidates in routing order, ignoring circuit state.
+
+        Args:
+            messages: The messages to process (unused in selection).
+            model: Optional specific model requested.
+            providers: Available providers.
+
+        Returns:
+            Non-empty list of (provider_name, model_name) tuples, primary first.
+
         Raises:
             ValueError: If no providers or suitable models available.
         """
         if not providers:
             raise ValueError("No providers available")
 
+        candidates: List[Tuple[str, str]] = []
+
         # If specific model requested, try to find it
         if model:
             # Check if it's in format "provider/model"
@@ -78,14 +159,18 @@ class Router:
                         f"Model '{model_name}' not found in provider '{provider_name}'"
                     )
 
-                return provider_name, model_name
-
-            # Check all providers for the model
-            for provider_name, provider in providers.items():
-                if provider.validate_model(model):
-                    return provider_name, model
+                candidates.append((provider_name, model_name))
+            else:
+                # Check all providers for the model
+                candidates.extend(
+                    (provider_name, model)
+                    for provider_name, provider in providers.items()
+                    if provider.validate_model(model)
+                )
+                if not candidates:
+                    raise ValueError(f"Model '{model}' not found in any available provider")
 
-            raise ValueError(f"Model '{model}' not found in any available provider")
+            return self._add_failover_candidates(candidates, providers)
 
         # No specific model requested - use fallback or first available
         # First, try configured fallback if provided
@@ -93,16 +178,37 @@ class Router:
             provider = providers[self.fallback_provider]
             available_models = provider.get_available_models()
             if self.fallback_model in available_models:
-                return self.fallback_provider, self.fallback_model
+                candidates.append((self.fallback_provider, self.fallback_model))
+
+        candidates = self._add_failover_candidates(candidates, providers)
 
         # Fall back to first available provider and model
         for provider_name, provider in providers.items():
             models = provider.get_available_models()
             if models:
-                model_name = list(models.keys())[0]
-                return provider_name, model_name
-
-        raise ValueError("No models available in any provider")
+                candidate = (provider_name, list(models.keys())[0])
+                if candidate not in candidates:
+                    candidates.append(candidate)
+
+        if not candidates:
+            raise ValueError("No models available in any provider")
+
+        return candidates
+
+    def _add_failover_candidates(
+        self, candidates: List[Tuple[str, str]], providers: Dict[str, BaseProvider]
+    ) -> List[Tuple[str, str]]:
+        """Append configured failover models that are available in ``providers``."""
+        for entry in self.failover_models:
+            if "/" not in entry:
+                continue
+            provider_name, model_name = entry.split("/", 1)
+            provider = providers.get(provider_name)
+            if provider is None or not provider.validate_model(model_name):
+                continue
+            if (provider_name, model_name) not in candidates:
+                candidates.append((provider_name, model_name))
+        return candidates
 
     def route_streaming(
         self,
@@ -154,6 +260,7 @@ class Router:
             # Validate model supports streaming
             provider = streaming_providers[provider_name]
             if not provider.supports_streaming_for_model(model_name):
+                self.release(provider_name, model_name)
                 raise ProviderError(
                     f"Model '{model_name}' does not support streaming on provider '{provider_name}'. "
                     f"Use stream=False or choose a different model."
@@ -169,9 +276,15 @@ class Router:
         # Double-check model supports streaming
         provider = streaming_providers[provider_name]
         if not provider.supports_streaming_for_model(model_name):
+            # The request won't go to model_name, so give back any probe route() reserved
+            self.release(provider_name, model_name)
+
             # Try to find another model from this provider that supports streaming
             for available_model in provider.get_available_models():
-                if provider.supports_streaming_for_model(available_model):
+                if provider.supports_streaming_for_model(available_model) and (
+                    self.circuit_breakers is None
+                    or self.circuit_breakers.allow_request(provider_name, available_model)
+                ):
                     return provider_name, available_model
 
             raise ProviderError(
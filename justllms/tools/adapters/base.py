@@ -77,6 +77,27 @@ class BaseToolAdapter(ABC):
         """
         pass
 
+    def format_tool_result_messages(
+        self, tool_results: List[ToolResult], tool_calls: List[ToolCall]
+    ) -> List[Message]:
+        """Format the results of one turn's tool calls as messages.
+
+        The default is one message per result, as format_tool_result_message()
+        builds them. Providers that expect all results of a turn in a single
+        message override this.
+
+        Args:
+            tool_results: Results from tool execution, in call order.
+            tool_calls: Tool calls that produced the results.
+
+        Returns:
+            Messages to append to the conversation.
+        """
+        return [
+            self.format_tool_result_message(tool_result, tool_call)
+            for tool_result, tool_call in zip(tool_results, tool_calls)
+        ]
+
     def format_tool_calls_message(self, tool_calls: List[ToolCall]) -> Optional[Message]:
         """Format tool calls as an assistant message.
 
@@ -225,6 +225,31 @@ class GoogleToolAdapter(BaseToolAdapter):
             content=parts,  # Pass as list for GoogleProvider to handle
         )
 
+    def format_tool_result_messages(
+        self, tool_results: List[ToolResult], tool_calls: List[ToolCall]
+    ) -> List[Message]:
+        """Format all tool results of a turn as one message for Gemini.
+
+        Gemini expects one functionResponse part per functionCall of the
+        previous turn, in a single content.
+
+        Args:
+            tool_results: Results from tool execution, in call order.
+            tool_calls: Tool calls that produced the results.
+
+        Returns:
+            A single message with one functionResponse part per call.
+        """
+        if not tool_results:
+            return []
+
+        content: List[Dict[str, Any]] = []
+        for tool_result, tool_call in zip(tool_results, tool_calls):
+            message = self.format_tool_result_message(tool_result, tool_call)
+            content.extend(message.content)  # type: ignore[arg-type]
+
+        return [Message(role=Role.USER, content=content)]
+
     def format_tool_calls_message(self, tool_calls: List[ToolCall]) -> Optional[Message]:
         """Format tool calls as an assistant message for Gemini.
 
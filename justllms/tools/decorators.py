@@ -16,6 +16,7 @@ def tool(
     description: Optional[str] = None,
     parameter_descriptions: Optional[Dict[str, str]] = None,
     register: bool = False,
+    max_concurrency: Optional[int] = None,
 ) -> Union[Callable, Tool]:
     """Decorator to convert a function into a Tool.
 
@@ -33,6 +34,8 @@ def tool(
         description: Custom description (defaults to function docstring).
         parameter_descriptions: Additional parameter descriptions.
         register: Whether to register globally (default: False).
+        max_concurrency: Maximum number of calls of this tool running at once,
+            across all completions using it (default: no limit).
 
     Returns:
         Tool instance when used as decorator, or decorator function.
@@ -56,6 +59,10 @@ def tool(
         ... )
         ... def search(query: str, limit: int = 10) -> list:
         ...     return [f"Result for {query}"]
+
+        >>> @tool(max_concurrency=2)
+        ... def fetch_page(url: str) -> str:
+        ...     return requests.get(url).text
     """
 
     def decorator(f: Callable) -> Tool:
@@ -97,6 +104,7 @@ def tool(
             parameters=parameters,
             parameter_descriptions=merged_descriptions,
             return_type=return_type,
+            max_concurrency=max_concurrency,
         )
 
         # Register globally if requested
@@ -126,6 +134,7 @@ def tool_from_callable(
     namespace: Optional[str] = None,
     description: Optional[str] = None,
     parameter_descriptions: Optional[Dict[str, str]] = None,
+    max_concurrency: Optional[int] = None,
 ) -> Tool:
     """Convert an existing callable into a Tool.
 
@@ -138,6 +147,7 @@ def tool_from_callable(
         namespace: Optional namespace for the tool.
         description: Custom description (defaults to function docstring).
         parameter_descriptions: Parameter descriptions.
+        max_concurrency: Maximum number of calls of this tool running at once.
 
     Returns:
         Tool instance.
@@ -189,4 +199,5 @@ def tool_from_callable(
         parameters=parameters,
         parameter_descriptions=merged_descriptions,
         return_type=return_type,
+        max_concurrency=max_concurrency,
     )
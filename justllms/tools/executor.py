@@ -1,24 +1,51 @@
+import asyncio
 import json
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 from justllms.core.base import BaseResponse
 from justllms.tools.models import Tool, ToolCall, ToolExecutionEntry, ToolResult, ToolResultStatus
 from justllms.tools.utils import validate_tool_arguments
 
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Event loop that runs async tools for synchronous callers, started on first use."""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="justllms-tool-loop", daemon=True
+            ).start()
+            _background_loop = loop
+    return _background_loop
+
 
 class ToolExecutor:
-    """Executes tools sequentially with error handling.
+    """Executes tools with validation, timeouts and error handling.
 
     This executor handles tool validation, argument parsing, execution,
-    and error recovery. It does NOT support parallel execution - all
-    tools run sequentially.
+    and error recovery. With ``execute_in_parallel``, the tool calls of one
+    turn run concurrently on a bounded pool of worker threads. A tool's
+    ``max_concurrency`` caps how many of its calls run at once across all
+    executors, so it also holds between concurrent completions.
+
+    Tools defined with ``async def`` are awaited rather than given a thread:
+    on the caller's event loop with aexecute_tool_call()/aexecute_all(), or
+    on a shared background loop with execute_tool_call()/execute_all(). A
+    timeout cancels them. aexecute_all() always runs async tools
+    concurrently, whether or not ``execute_in_parallel`` is set.
 
     Attributes:
         tools: Dictionary mapping tool names to Tool instances.
         timeout: Maximum execution time per tool in seconds.
-        execute_in_parallel: Always False (no parallel execution).
+        execute_in_parallel: Whether execute_all() runs calls concurrently.
+        max_workers: Maximum number of sync tool calls running at once.
     """
 
     def __init__(
@@ -26,17 +53,20 @@ class ToolExecutor:
         tools: List[Tool],
         execute_in_parallel: bool = False,
         timeout: float = 30.0,
+        max_workers: int = 8,
     ):
         """Initialize the tool executor.
 
         Args:
             tools: List of Tool instances available for execution.
-            execute_in_parallel: Ignored (always False, no parallel support).
+            execute_in_parallel: Run the calls passed to execute_all() concurrently.
             timeout: Maximum execution time per tool in seconds.
+            max_workers: Size of the worker pool used for parallel execution.
         """
         self.tools = {tool.name: tool for tool in tools}
-        self.execute_in_parallel = False  # Always False per requirements
+        self.execute_in_parallel = execute_in_parallel
         self.timeout = timeout
+        self.max_workers = max_workers
         self._execution_count = 0
 
     def execute_tool_call(self, tool_call: ToolCall) -> ToolResult:
@@ -73,8 +103,12 @@ class ToolExecutor:
                 status=ToolResultStatus.ERROR,
             )
 
+        if tool.is_async:
+            return self._run_on_background_loop(tool_call, tool, validated_args)
+
         # Execute with timeout
         result_container: Dict[str, Any] = {}
+        slots = tool.concurrency_limit
 
         def execute_tool() -> None:
             """Execute tool in separate thread for timeout control."""
@@ -84,6 +118,15 @@ class ToolExecutor:
             except Exception as e:
                 result_container["error"] = str(e)
                 result_container["success"] = False
+            finally:
+                # Held until the tool returns, even if the call timed out
+                if slots is not None:
+                    slots.release()
+
+        if slots is not None:
+            slots.acquire()
+            # Waiting for a slot doesn't count towards the timeout or execution time
+            start_time = time.time()
 
         # Run with timeout
         thread = threading.Thread(target=execute_tool, daemon=True)
@@ -121,6 +164,120 @@ class ToolExecutor:
             status=ToolResultStatus.SUCCESS,
         )
 
+    async def aexecute_tool_call(self, tool_call: ToolCall) -> ToolResult:
+        """Execute a single tool call from a coroutine.
+
+        Async tools are awaited on the running event loop; other tools run
+        in the loop's default executor via execute_tool_call().
+
+        Args:
+            tool_call: The tool call to execute.
+
+        Returns:
+            ToolResult with execution outcome.
+        """
+        tool = self.tools.get(tool_call.name)
+        if tool is None or not tool.is_async:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.execute_tool_call, tool_call)
+
+        try:
+            validated_args = validate_tool_arguments(tool, tool_call.arguments)
+        except ValueError as e:
+            return ToolResult(
+                tool_call_id=tool_call.id,
+                result=None,
+                error=f"Invalid arguments: {str(e)}",
+                status=ToolResultStatus.ERROR,
+            )
+
+        slots = tool.concurrency_limit
+        if slots is None:
+            return await self._await_tool(tool_call, tool, validated_args)
+        async with slots.aslot():
+            return await self._await_tool(tool_call, tool, validated_args)
+
+    async def aexecute_all(self, tool_calls: List[ToolCall]) -> List[ToolResult]:
+        """Execute tool calls from a coroutine.
+
+        Async tools always run concurrently, with each other and with the
+        sync tools: coroutines sharing one event loop can't race the way
+        threads can. Sync tools run in threads, so they overlap only when
+        ``execute_in_parallel`` is set (up to ``max_workers`` at once) and
+        otherwise run one at a time.
+
+        Args:
+            tool_calls: List of tool calls to execute.
+
+        Returns:
+            List of ToolResult objects, in the order of ``tool_calls``.
+        """
+        if len(tool_calls) < 2:
+            return [await self.aexecute_tool_call(tool_call) for tool_call in tool_calls]
+
+        workers = asyncio.Semaphore(self.max_workers if self.execute_in_parallel else 1)
+
+        async def execute(tool_call: ToolCall) -> ToolResult:
+            tool = self.tools.get(tool_call.name)
+            if tool is not None and tool.is_async:
+                return await self.aexecute_tool_call(tool_call)
+            async with workers:
+                return await self.aexecute_tool_call(tool_call)
+
+        return list(await asyncio.gather(*(execute(tool_call) for tool_call in tool_calls)))
+
+    async def _await_tool(
+        self, tool_call: ToolCall, tool: Tool, validated_args: Dict[str, Any]
+    ) -> ToolResult:
+        """Await an async tool, cancelling it if it exceeds the timeout."""
+        start_time = time.time()
+        try:
+            result = await asyncio.wait_for(tool.callable(**validated_args), self.timeout)
+        except asyncio.TimeoutError:
+            return ToolResult(
+                tool_call_id=tool_call.id,
+                result=None,
+                error=f"Tool execution timed out after {self.timeout}s",
+                execution_time_ms=(time.time() - start_time) * 1000,
+                status=ToolResultStatus.TIMEOUT,
+            )
+        except Exception as e:
+            return ToolResult(
+                tool_call_id=tool_call.id,
+                result=None,
+                error=str(e),
+                execution_time_ms=(time.time() - start_time) * 1000,
+                status=ToolResultStatus.ERROR,
+            )
+
+        return ToolResult(
+            tool_call_id=tool_call.id,
+            result=result,
+            error=None,
+            execution_time_ms=(time.time() - start_time) * 1000,
+            status=ToolResultStatus.SUCCESS,
+        )
+
+    def _run_on_background_loop(
+        self, tool_call: ToolCall, tool: Tool, validated_args: Dict[str, Any]
+    ) -> ToolResult:
+        """Run an async tool on the shared background loop and wait for its result."""
+        slots = tool.concurrency_limit
+        if slots is not None:
+            slots.acquire()
+        future = asyncio.run_coroutine_threadsafe(
+            self._await_tool(tool_call, tool, validated_args), _get_background_loop()
+        )
+        try:
+            return future.result()
+        except BaseException:
+            # e.g. KeyboardInterrupt while waiting: don't leave the tool running
+            future.cancel()
+            raise
+        finally:
+            if slots is not None:
+                slots.release()
+
     def _extract_tool_calls(self, response: BaseResponse) -> List[ToolCall]:
         """Extract tool calls from a response.
 
@@ -218,19 +375,27 @@ class ToolExecutor:
         }
 
     def execute_all(self, tool_calls: List[ToolCall]) -> List[ToolResult]:
-        """Execute all tool calls sequentially.
+        """Execute tool calls, concurrently if ``execute_in_parallel`` is set.
 
         Args:
             tool_calls: List of tool calls to execute.
 
         Returns:
-            List of ToolResult objects.
+            List of ToolResult objects, in the order of ``tool_calls``.
         """
-        results = []
-        for tool_call in tool_calls:
-            result = self.execute_tool_call(tool_call)
-            results.append(result)
-        return results
+        if not self.execute_in_parallel or len(tool_calls) < 2:
+            return [self.execute_tool_call(tool_call) for tool_call in tool_calls]
+
+        pool = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(tool_calls)),
+            thread_name_prefix="justllms-tool",
+        )
+        try:
+            futures = [pool.submit(self.execute_tool_call, tool_call) for tool_call in tool_calls]
+            return [future.result() for future in futures]
+        finally:
+            # Timed-out tools may still be running; don't wait for them
+            pool.shutdown(wait=False)
 
     def create_execution_entry(
         self,
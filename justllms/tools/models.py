@@ -1,9 +1,52 @@
+import asyncio
+import contextlib
+import inspect
+import threading
 import uuid
+import weakref
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+
+class ConcurrencyLimit:
+    """Fixed cap on how many calls of a tool run at once.
+
+    Threads share one bounded semaphore. Coroutines get a semaphore per event
+    loop, so the cap applies to each loop separately.
+
+    Args:
+        limit: Maximum number of calls running at once.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._semaphore = threading.BoundedSemaphore(limit)
+        self._async_semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a slot is free and take it."""
+        self._semaphore.acquire()
+
+    def release(self) -> None:
+        """Give back a slot taken with acquire()."""
+        self._semaphore.release()
+
+    @contextlib.asynccontextmanager
+    async def aslot(self) -> AsyncIterator[None]:
+        """Hold a slot of the running event loop for the duration of the block."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._async_semaphores.get(loop)
+            if semaphore is None:
+                semaphore = self._async_semaphores[loop] = asyncio.Semaphore(self.limit)
+        async with semaphore:
+            yield
 
 
 class ParameterInfo(BaseModel):
@@ -33,6 +76,24 @@ class Tool(BaseModel):
     return_type: Optional[Any] = None  # Can be type or typing generic
     metadata: Dict[str, Any] = Field(default_factory=dict)
     is_native: bool = False  # For provider-specific native tools
+    max_concurrency: Optional[int] = Field(default=None, ge=1)
+    """Maximum number of calls of this tool running at once (None for no limit)."""
+
+    _concurrency_limit: Optional[ConcurrencyLimit] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Create the limit enforcing max_concurrency."""
+        if self.max_concurrency is not None:
+            self._concurrency_limit = ConcurrencyLimit(self.max_concurrency)
+
+    @property
+    def concurrency_limit(self) -> Optional[ConcurrencyLimit]:
+        """Limit on calls of this tool in flight, or None without max_concurrency.
+
+        It lives on the tool, so it is shared by every completion the tool is
+        used in.
+        """
+        return self._concurrency_limit
 
     @property
     def full_name(self) -> str:
@@ -41,6 +102,11 @@ class Tool(BaseModel):
             return f"{self.namespace}.{self.name}"
         return self.name
 
+    @property
+    def is_async(self) -> bool:
+        """Whether the callable is a coroutine function (``async def``)."""
+        return inspect.iscoroutinefunction(self.callable)
+
     def to_json_schema(self) -> Dict[str, Any]:
         """Convert tool to JSON Schema format for providers."""
         required_params = [name for name, param in self.parameters.items() if param.required]
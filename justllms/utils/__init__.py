@@ -1,4 +1,5 @@
+from justllms.utils.request_key import request_key
 from justllms.utils.token_counter import TokenCounter, count_tokens
 from justllms.utils.validators import validate_messages
 
-__all__ = ["TokenCounter", "count_tokens", "validate_messages"]
+__all__ = ["TokenCounter", "count_tokens", "request_key", "validate_messages"]
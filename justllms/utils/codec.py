@@ -0,0 +1,181 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Mapping, Optional, Union
+
+import httpx
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import msgspec
+
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+
+class JSONCodec(ABC):
+    """Encoder/decoder used for request payloads, response bodies and stream events.
+
+    Implementations produce compact UTF-8 JSON and raise ``TypeError`` for
+    objects they cannot encode and ``json.JSONDecodeError`` for invalid input,
+    like the standard library.
+    """
+
+    name: str
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """Encode ``obj`` as UTF-8 JSON."""
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode a JSON document."""
+
+
+class StdlibJSONCodec(JSONCodec):
+    """Codec backed by the standard library ``json`` module."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec backed by orjson.
+
+    Objects orjson can't encode (e.g. integers beyond 64 bits) are retried
+    with the standard library, so it accepts everything StdlibJSONCodec does.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if not HAS_ORJSON:
+            raise ImportError("orjson is not installed. Install it with: pip install orjson")
+        self._fallback = StdlibJSONCodec()
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj)  # type: ignore[no-any-return]
+        except TypeError:
+            return self._fallback.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """Codec backed by msgspec.json."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        if not HAS_MSGSPEC:
+            raise ImportError("msgspec is not installed. Install it with: pip install msgspec")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._fallback = StdlibJSONCodec()
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._encoder.encode(obj)  # type: ignore[no-any-return]
+        except (TypeError, OverflowError):
+            return self._fallback.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            document = data if isinstance(data, str) else data.decode("utf-8", "replace")
+            raise json.JSONDecodeError(str(e), document, 0) from None
+
+
+_CODECS: Dict[str, Callable[[], JSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": StdlibJSONCodec,
+}
+
+
+def _default_codec() -> JSONCodec:
+    if HAS_ORJSON:
+        return OrjsonCodec()
+    if HAS_MSGSPEC:
+        return MsgspecCodec()
+    return StdlibJSONCodec()
+
+
+_codec: JSONCodec = _default_codec()
+
+
+def get_codec() -> JSONCodec:
+    """Return the codec in use (orjson, then msgspec, then stdlib, by default)."""
+    return _codec
+
+
+def set_codec(codec: Optional[Union[str, JSONCodec]]) -> JSONCodec:
+    """Choose the JSON codec used throughout justllms.
+
+    Args:
+        codec: "orjson", "msgspec", "json", a JSONCodec instance, or None to
+            restore the default (fastest installed).
+
+    Returns:
+        JSONCodec: The codec now in use.
+
+    Raises:
+        ValueError: If the codec name is unknown.
+        ImportError: If the named codec's library is not installed.
+    """
+    global _codec
+    if codec is None:
+        _codec = _default_codec()
+    elif isinstance(codec, str):
+        if codec not in _CODECS:
+            raise ValueError(f"Unknown JSON codec {codec!r}; expected one of {sorted(_CODECS)}")
+        _codec = _CODECS[codec]()
+    else:
+        _codec = codec
+    return _codec
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as compact UTF-8 JSON with the current codec."""
+    return _codec.dumps(obj)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document with the current codec.
+
+    Raises:
+        json.JSONDecodeError: If ``data`` is not valid JSON.
+    """
+    return _codec.loads(data)
+
+
+def json_body(payload: Any, headers: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
+    """Build httpx request arguments that send ``payload`` encoded with the current codec.
+
+    Use instead of httpx's ``json=``, which always encodes with the standard
+    library.
+
+    Args:
+        payload: Request body.
+        headers: Request headers; Content-Type defaults to application/json.
+
+    Returns:
+        Dict[str, Any]: ``content`` and ``headers`` arguments for httpx.
+    """
+    request_headers = httpx.Headers(headers)
+    request_headers.setdefault("Content-Type", "application/json")
+    return {"content": dumps(payload), "headers": request_headers}
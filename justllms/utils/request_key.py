@@ -0,0 +1,37 @@
+import hashlib
+import json
+from typing import Any, Dict, List
+
+from justllms.core.models import Message
+
+# Parameters that don't change what the provider generates
+_NON_SEMANTIC_PARAMS = {"timeout", "hedge_delay"}
+
+
+def request_key(provider: str, model: str, messages: List[Message], params: Dict[str, Any]) -> str:
+    """Build a stable fingerprint for a completion request.
+
+    Two requests get the same key when they target the same provider and model
+    with the same normalized messages and generation parameters.
+
+    Args:
+        provider: Provider name.
+        model: Model name.
+        messages: Validated messages.
+        params: Generation parameters as passed to the provider.
+
+    Returns:
+        str: Hex SHA-256 digest of the canonical request.
+    """
+    canonical = json.dumps(
+        {
+            "provider": provider,
+            "model": model,
+            "messages": [m.model_dump(mode="json", exclude_none=True) for m in messages],
+            "params": {k: v for k, v in params.items() if k not in _NON_SEMANTIC_PARAMS},
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()